@@ -5,6 +5,7 @@ Usage:
   Console mode (mic/speaker):  python agent.py console
   Room mode (dev/playground):  python agent.py dev
   Production:                  python agent.py start
+  Download models (VAD, turn detector): python agent.py download-files
 
 METADATA BRIDGE:
   When a call comes from the dashboard (browser), the room carries
@@ -26,12 +27,17 @@ from livekit.agents import (
     AgentSession,
     AudioConfig,
     BackgroundAudioPlayer,
-    BuiltinAudioClip,
     JobContext,
+    JobExecutorType,
+    JobProcess,
+    LanguageCode,
+    MetricsCollectedEvent,
     RunContext,
     UserStateChangedEvent,
     UserInputTranscribedEvent,
 )
+from livekit.agents import llm
+from livekit.agents.metrics import LLMMetrics
 from livekit.plugins import silero
 
 # === All plugins MUST be imported at top level (main thread) ===
@@ -58,14 +64,48 @@ try:
 except ImportError:
     deepgram = None
 
+# Importing the multilingual model registers its inference runner,
+# so the ONNX model is loaded once per worker, not once per call
 try:
-    from livekit.plugins import turn_detector
+    from livekit.plugins.turn_detector.multilingual import MultilingualModel
 except ImportError:
-    turn_detector = None
-
-from config import config
-from providers import get_stt, get_llm, get_tts
-from prompts import get_prompt
+    MultilingualModel = None
+
+import call_records
+from call_records import CallRecord, CallRecorder
+from call_summary import summarize_call
+from hangup import CallEnd
+from clip_cache import AUDIO_CLIPS, load_clip
+from config import config, pin_config, refresh_config
+from context_compactor import ContextCompactor
+from stats import (
+    FirstTurn,
+    log_after_goodbye_report,
+    log_first_turn_report,
+    log_preemptive_report,
+    log_prompt_cache_report,
+    log_transfer_report,
+    record_llm_metrics,
+)
+from tenants import (
+    DEFAULT_TENANT,
+    SIP_CALLER_NUMBER,
+    SIP_DIALED_NUMBER,
+    SIP_TRUNK_ID,
+    get_registry,
+    prewarm_bundles,
+    prompt_mode as tenant_prompt_mode,
+    take_bundle,
+)
+from worker_load import LOAD_THRESHOLD, CallLoopLag, worker_load
+import warmup
+from providers import get_stt, get_llm, get_tts, say_scripted, voice_key
+from providers.audio_profile import WIDEBAND, get_audio_profile, telephony_profile
+from providers.bangla_verbalizer import text_transforms
+from providers.batched_vad import BatchedVAD
+from providers.preemptive_stt import StableInterimSTT
+import prompts
+from prompts import PROMPTS, build_call_context, get_prompt, refresh_prompts
 
 # Import all function tools
 from tools.appointment import (
@@ -75,6 +115,7 @@ from tools.appointment import (
     get_next_available,
 )
 from tools.crm import (
+    PhoneNumberWatcher,
     register_customer,
     lookup_customer,
     update_customer_notes,
@@ -115,7 +156,7 @@ TOOLS_BY_ACTION = {
     ],
 }
 
-# ALL tools — used when no action filtering is specified (SIP/phone calls)
+# ALL tools — every tool the agent knows about
 ALL_TOOLS = [
     register_customer,
     lookup_customer,
@@ -131,21 +172,77 @@ ALL_TOOLS = [
 ]
 
 # ═══════════════════════════════════════════════════════
-# BACKGROUND AUDIO CLIPS (from LiveKit built-in library)
+# TOOLS — per AGENT_MODE manifest for SIP/phone calls
+# Only the tools each mode's prompt actually uses, so the LLM
+# doesn't pay prompt tokens for (or misuse) the rest.
+# end_call is always included so the agent can hang up.
 # ═══════════════════════════════════════════════════════
-AUDIO_CLIPS = {
-    "office": BuiltinAudioClip.OFFICE_AMBIENCE,
-    "city": BuiltinAudioClip.CITY_AMBIENCE,
-    "forest": BuiltinAudioClip.FOREST_AMBIENCE,
-    "crowd": BuiltinAudioClip.CROWDED_ROOM,
-    "typing": BuiltinAudioClip.KEYBOARD_TYPING,
-    "typing2": BuiltinAudioClip.KEYBOARD_TYPING2,
-    "hold_music": BuiltinAudioClip.HOLD_MUSIC,
+TOOLS_BY_MODE = {
+    "receptionist": ALL_TOOLS,
+    "appointment": [
+        check_available_slots,
+        get_next_available,
+        book_appointment,
+        cancel_appointment,
+        lookup_customer,  # "look them up by phone"
+        end_call,
+    ],
+    "support": [
+        lookup_customer,
+        update_customer_notes,
+        create_support_ticket,
+        escalate_to_human,
+        end_call,
+    ],
+    "sales": [
+        register_customer,
+        lookup_customer,
+        update_customer_notes,
+        book_appointment,
+        end_call,
+    ],
+    "survey": [
+        register_customer,
+        lookup_customer,
+        update_customer_notes,
+        create_support_ticket,
+        end_call,
+    ],
+    "collections": [
+        lookup_customer,
+        update_customer_notes,
+        create_support_ticket,
+        transfer_to_department,
+        escalate_to_human,
+        end_call,
+    ],
 }
 
 
-def _build_background_audio() -> BackgroundAudioPlayer | None:
-    """Build BackgroundAudioPlayer from .env config. Returns None if disabled."""
+def _check_tool_manifest() -> None:
+    """Startup check: every tool a prompt names must be in that mode's manifest."""
+    problems = []
+    for mode, prompt in PROMPTS.items():
+        manifest = {tool.id for tool in TOOLS_BY_MODE.get(mode, [])}
+        if not manifest:
+            problems.append(f"{mode}: no entry in TOOLS_BY_MODE")
+            continue
+        named = {tool.id for tool in ALL_TOOLS if tool.id in prompt}
+        missing = named - manifest
+        if missing:
+            problems.append(f"{mode}: prompt uses {sorted(missing)} but manifest lacks them")
+    if problems:
+        raise ValueError("Tool manifest out of sync with prompts:\n  " + "\n  ".join(problems))
+
+
+_check_tool_manifest()
+
+async def _build_background_audio() -> BackgroundAudioPlayer | None:
+    """Build BackgroundAudioPlayer from .env config. Returns None if disabled.
+
+    Clips come pre-decoded and volume-scaled from clip_cache, memory-mapped
+    and shared by every worker process — the player mixes them at volume 1.0.
+    """
     if not config.background_audio_enabled:
         logger.info("🔇 Background audio: DISABLED")
         return None
@@ -155,8 +252,7 @@ def _build_background_audio() -> BackgroundAudioPlayer | None:
     ambient = None
     if ambient_clip:
         ambient = AudioConfig(
-            source=ambient_clip,
-            volume=config.background_audio_volume,
+            source=await load_clip(ambient_clip, volume=config.background_audio_volume, loop=True),
         )
         logger.info(
             f"🔊 Background audio: {config.background_audio_type} "
@@ -168,8 +264,7 @@ def _build_background_audio() -> BackgroundAudioPlayer | None:
     thinking = None
     if config.thinking_sound_enabled and thinking_clip:
         thinking = AudioConfig(
-            source=thinking_clip,
-            volume=config.thinking_sound_volume,
+            source=await load_clip(thinking_clip, volume=config.thinking_sound_volume),
         )
         logger.info(
             f"💭 Thinking sound: {config.thinking_sound_type} "
@@ -200,7 +295,7 @@ def _parse_dashboard_config(metadata: str | None) -> dict | None:
 def _get_tools_for_actions(actions: dict | None) -> list:
     """Filter tools based on dashboard action toggles.
 
-    If actions is None (SIP call), returns ALL tools.
+    If actions is None, returns ALL tools.
     If actions is provided, only includes tools for enabled actions.
     """
     if actions is None:
@@ -218,19 +313,136 @@ def _get_tools_for_actions(actions: dict | None) -> list:
     return tools
 
 
-server = AgentServer()
+class BanglaVoiceAgent(Agent):
+    """Agent that sends a compacted chat context to the LLM on long calls."""
+
+    def __init__(
+        self,
+        *,
+        instructions: str,
+        tools: list,
+        compactor: ContextCompactor | None = None,
+    ) -> None:
+        super().__init__(instructions=instructions, tools=tools)
+        self._compactor = compactor
+
+    async def llm_node(self, chat_ctx: llm.ChatContext, tools: list, model_settings):
+        if self._compactor:
+            chat_ctx = self._compactor.compact(chat_ctx)
+        async for chunk in Agent.default.llm_node(self, chat_ctx, tools, model_settings):
+            yield chunk
+
+
+async def _build_turn_detection(proc: JobProcess):
+    """Semantic end-of-turn model, or None to fall back to VAD silence only."""
+    if not config.turn_detection_enabled or MultilingualModel is None:
+        return None
+    if proc.userdata.get("turn_detector_unavailable"):
+        return None
+    try:
+        model = MultilingualModel()
+    except Exception as e:
+        # Model files missing — don't retry on every call in this process
+        proc.userdata["turn_detector_unavailable"] = True
+        logger.warning(
+            f"⚠️  Turn detector unavailable ({e}). Using VAD silence only. "
+            f"Run: python agent.py download-files"
+        )
+        return None
+    # Without a threshold for the language the session ignores the model
+    if not await model.supports_language(LanguageCode(config.language)):
+        logger.warning(f"⚠️  Turn detector has no threshold for {config.language}. Using VAD silence only.")
+        return None
+    return model
+
+
+def prewarm(proc: JobProcess):
+    """Runs once per worker process before it takes calls — load models here."""
+    vad_cls = BatchedVAD if config.vad_batching else silero.VAD
+    proc.userdata[WIDEBAND.vad_key] = vad_cls.load()
+    if config.telephony_audio:
+        # SIP calls run VAD at the narrowband rate — no resampling
+        telephony = telephony_profile()
+        proc.userdata[telephony.vad_key] = vad_cls.load(sample_rate=telephony.sample_rate)
+
+    # Phone calls: each tenant's providers ready before the call, prompts cached
+    registry = get_registry()
+    prewarm_bundles(proc.userdata, telephony_profile().sample_rate if config.telephony_audio else None)
+    for tenant in (DEFAULT_TENANT, *registry.tenants):
+        snapshot = tenant.apply(refresh_config())
+        if not tenant.system_prompt and snapshot.agent_mode in PROMPTS:
+            get_prompt(mode=snapshot.agent_mode, company_name=snapshot.company_name)
+    logger.info(
+        f"🔥 Worker prewarmed: Silero VAD loaded"
+        f"{' (batched across calls)' if config.vad_batching else ''}, "
+        f"providers for {len(registry.tenants) + 1} tenant(s)"
+    )
+
+    # Tokens and self-hosted models warmed in the background, kept warm while idle
+    warmup.start()
+
+
+def _get_vad(proc: JobProcess, profile):
+    """The VAD prewarmed for this audio profile.
+
+    Loaded on first use if .env changed the telephony rate since prewarm;
+    the prewarmed models are reused for everything else.
+    """
+    if profile.vad_key not in proc.userdata:
+        vad_cls = type(proc.userdata[WIDEBAND.vad_key])
+        proc.userdata[profile.vad_key] = vad_cls.load(sample_rate=profile.sample_rate)
+        logger.info(f"🔥 Silero VAD loaded for {profile.sample_rate} Hz")
+    return proc.userdata[profile.vad_key]
+
+
+async def _log_call_stats() -> None:
+    log_prompt_cache_report()
+    log_preemptive_report()
+    log_first_turn_report()
+    log_after_goodbye_report()
+    log_transfer_report()
+
+
+server_options = dict(
+    setup_fnc=prewarm,
+    # Stop taking calls at the session cap or when the loop/CPU falls behind
+    load_fnc=worker_load.get_load,
+    load_threshold=LOAD_THRESHOLD,
+    prometheus_port=config.prometheus_port or None,
+)
+if config.vad_batching:
+    # Batched VAD needs every call in the same process — run jobs as threads
+    server_options["job_executor_type"] = JobExecutorType.THREAD
+elif config.prometheus_port:
+    # One process per call: sum every job process's stats (stats.py) on /metrics
+    server_options["prometheus_multiproc_dir"] = config.prometheus_multiproc_dir
+server = AgentServer(**server_options)
+server.on("worker_started", worker_load.start)
 
 
 @server.rtc_session()
 async def entrypoint(ctx: JobContext):
+    # Pick up .env and prompt edits — this call keeps this snapshot to the end
+    call_config = refresh_config()
+    pin_config(call_config)
+    refresh_prompts()
     config.print_config()
 
+    # No keep-warm pings while this call runs; first turn tagged warm or cold
+    warmup.call_started()
+    ctx.add_shutdown_callback(warmup.call_ended)
+    first_turn = FirstTurn(warm=warmup.is_warm())
+
+    # This call's event-loop lag, read by the worker's admission (worker_load.py)
+    ctx.add_shutdown_callback(CallLoopLag().aclose)
+
     # ═══════════════════════════════════════════════════════
     # METADATA BRIDGE — check if this call came from dashboard
     # ═══════════════════════════════════════════════════════
     await ctx.connect()
 
     dashboard_config = _parse_dashboard_config(ctx.room.metadata)
+    audio_profile = get_audio_profile(is_sip=not dashboard_config)
 
     if dashboard_config:
         # ─── DASHBOARD CALL: use dynamic config from frontend ───
@@ -250,61 +462,111 @@ async def entrypoint(ctx: JobContext):
         logger.info(f"  🔊 TTS: {tts_provider or '(env default)'} / {tts_voice or '(env default)'}")
         logger.info(f"  📄 Prompt: {system_prompt[:80]}..." if system_prompt else "  📄 Prompt: (env default)")
 
-        stt_instance = get_stt(provider=stt_provider)
-        llm_instance = get_llm(provider=llm_provider, model=llm_model)
-        tts_instance = get_tts(provider=tts_provider, voice=tts_voice)
-        tools = _get_tools_for_actions(actions)
-
         # Use custom prompt if provided, otherwise fall back to .env agent mode
+        # Stable prompt first, volatile context (date) last — keeps the
+        # provider's prompt cache warm
         if system_prompt and system_prompt.strip():
-            agent_instructions = system_prompt
+            prompt_mode = "dashboard"
+            agent_instructions = system_prompt + build_call_context()
+            greeting = None  # custom persona — no scripted mode greeting
         else:
+            prompt_mode = config.agent_mode
             agent_instructions = get_prompt(
                 mode=config.agent_mode,
-                company_name="আমাদের কোম্পানি",
+                company_name=config.company_name,
             )
+            greeting = prompts.get_greeting(config.agent_mode, company_name=config.company_name)
 
-    else:
-        # ─── SIP/PHONE CALL: use .env defaults (original behavior) ───
-        logger.info("📞 Source: SIP/Phone — using .env defaults")
+        stt_instance = get_stt(provider=stt_provider)
+        llm_instance = get_llm(provider=llm_provider, model=llm_model, cache_key=prompt_mode)
+        tts_instance = get_tts(provider=tts_provider, voice=tts_voice)
+        tools = _get_tools_for_actions(actions)
 
-        stt_instance = get_stt()
-        llm_instance = get_llm()
-        tts_instance = get_tts()
-        tools = ALL_TOOLS
+    else:
+        # ─── SIP/PHONE CALL: tenant of the dialed number, else .env defaults ───
+        registry = get_registry()
+        tenant = DEFAULT_TENANT
+        if registry.tenants:
+            participant = await ctx.wait_for_participant()
+            tenant = registry.resolve(
+                dialed_number=participant.attributes.get(SIP_DIALED_NUMBER),
+                trunk_id=participant.attributes.get(SIP_TRUNK_ID),
+                room_name=ctx.room.name,
+            )
+        call_config = tenant.apply(refresh_config())
+        pin_config(call_config)
+        logger.info(f"📞 Source: SIP/Phone — tenant {tenant.name} ({config.company_name}, {config.agent_mode})")
+
+        prompt_mode = tenant_prompt_mode(tenant)
+        bundle = take_bundle(ctx.proc.userdata, tenant, audio_profile.sample_rate, call_config)
+        stt_instance, llm_instance, tts_instance = bundle.stt, bundle.llm, bundle.tts
+        tools = TOOLS_BY_MODE[config.agent_mode]
         first_message = ""
 
-        agent_instructions = get_prompt(
-            mode=config.agent_mode,
-            company_name="আমাদের কোম্পানি",
-        )
+        if tenant.system_prompt:
+            agent_instructions = tenant.system_prompt + build_call_context()
+            greeting = None  # custom persona — no scripted mode greeting
+        else:
+            agent_instructions = get_prompt(
+                mode=config.agent_mode,
+                company_name=config.company_name,
+            )
+            greeting = prompts.get_greeting(config.agent_mode, company_name=config.company_name)
 
     # ═══════════════════════════════════════════════════════
-    # SILENCE HANDLING — makes the agent behave like a human
+    # PREEMPTIVE GENERATION (opt-in) — start the LLM once the
+    # interim transcript has been stable for a short window
+    # ═══════════════════════════════════════════════════════
+    preemptive = config.preemptive_generation
+    if preemptive and stt_instance.capabilities.streaming and stt_instance.capabilities.interim_results:
+        stt_instance = StableInterimSTT(stt_instance, stable_window=config.preemptive_stable_window)
+        logger.info(f"⚡ Preemptive generation: ON (stable window {config.preemptive_stable_window}s)")
+
     # ═══════════════════════════════════════════════════════
+    # END OF TURN — semantic turn detector + per-source endpointing
+    # ═══════════════════════════════════════════════════════
+    turn_detection = await _build_turn_detection(ctx.proc)
+    if dashboard_config:
+        min_delay = config.dashboard_min_endpointing_delay
+        max_delay = config.dashboard_max_endpointing_delay
+    else:
+        min_delay = config.sip_min_endpointing_delay
+        max_delay = config.sip_max_endpointing_delay
+    logger.info(
+        f"⏱️  End of turn: {'turn detector' if turn_detection else 'VAD only'} "
+        f"(endpointing {min_delay}s–{max_delay}s)"
+    )
+
+    logger.info(
+        f"🔉 Audio: {audio_profile.name} "
+        f"(in {audio_profile.sample_rate or 'default'} Hz, TTS {tts_instance.sample_rate} Hz)"
+    )
 
     session = AgentSession(
-        vad=silero.VAD.load(),
+        vad=_get_vad(ctx.proc, audio_profile),
+        turn_detection=turn_detection,
+        min_endpointing_delay=min_delay,
+        max_endpointing_delay=max_delay,
         stt=stt_instance,
         llm=llm_instance,
         tts=tts_instance,
+        tts_text_transforms=text_transforms(config.language),  # numbers as Bangla words
         user_away_timeout=10.0,  # 10 seconds of silence = nudge
+        preemptive_generation=preemptive,
     )
 
+    # Hang up once the goodbye has played out (end_call, silence farewell)
+    call_end = CallEnd(ctx, session)
+
+    # ═══════════════════════════════════════════════════════
+    # SILENCE HANDLING — makes the agent behave like a human
+    # ═══════════════════════════════════════════════════════
     # Track how many times we've nudged a silent caller
     nudge_count = 0
 
-    # Define what Nusrat says during silence — like a real human
-    NUDGE_PROMPTS = [
-        # Nudge 1: Gentle check (like "hello? are you there?")
-        "কলার চুপ আছে। তুমি মানুষের মতো স্বাভাবিকভাবে বলো: 'হ্যালো? বলুন, আমি শুনছি।' — শুধু এটুকুই বলো, বেশি কিছু না।",
-
-        # Nudge 2: A bit more concerned
-        "কলার এখনো চুপ। বলো: 'আপনি কি শুনতে পাচ্ছেন? আমি আপনার কথা শুনতে পাচ্ছি না।' — শুধু এটুকুই।",
-
-        # Nudge 3: Polite goodbye
-        "কলার উত্তর দিচ্ছে না। ভদ্রভাবে বিদায় নাও: 'ঠিক আছে, মনে হচ্ছে লাইনে সমস্যা হচ্ছে। আপনি আবার কল দিবেন। আসসালামু আলাইকুম।' — তারপর end_call টুল কল করো।",
-    ]
+    # What Nusrat says during silence — scripted lines, spoken verbatim
+    # (see prompts/scripted.py). No LLM round trip before the nudge.
+    NUDGE_SCRIPT = prompts.NUDGE_LINES + [prompts.SILENCE_FAREWELL]
 
     @session.on("user_state_changed")
     def _on_user_state(ev: UserStateChangedEvent):
@@ -313,12 +575,20 @@ async def entrypoint(ctx: JobContext):
 
         if ev.new_state == "away":
             # User has been silent — speak up like a human would
-            idx = min(nudge_count, len(NUDGE_PROMPTS) - 1)
-            prompt = NUDGE_PROMPTS[idx]
+            idx = min(nudge_count, len(NUDGE_SCRIPT) - 1)
+            line = NUDGE_SCRIPT[idx]
             nudge_count += 1
             logger.info(f"🔇 Silence detected — nudge #{nudge_count}")
-            # generate_reply() returns SpeechHandle synchronously — just call it
-            session.generate_reply(instructions=prompt)
+            # say() returns SpeechHandle synchronously — just call it
+            handle = say_scripted(session, line, voice_key=voice_key(tts_instance))
+            if line == prompts.SILENCE_FAREWELL:
+                call_end.goodbye(handle, "caller_silent")
+
+    # Speculative CRM prefetch — start lookup_customer's Sheets query
+    # as soon as the caller says their number
+    phone_watcher = None
+    if config.crm_prefetch_enabled and lookup_customer in tools:
+        phone_watcher = PhoneNumberWatcher()
 
     @session.on("user_input_transcribed")
     def _on_user_spoke(ev: UserInputTranscribedEvent):
@@ -327,51 +597,91 @@ async def entrypoint(ctx: JobContext):
         if nudge_count > 0:
             logger.info(f"🔊 User spoke again — resetting silence counter")
             nudge_count = 0
+        if phone_watcher:
+            phone_watcher.on_transcript(ev.transcript, ev.is_final)
+
+    # Long calls: keep the last N turns, summarize the rest in the background
+    compactor = None
+    if config.context_compaction_enabled:
+        compactor = ContextCompactor(llm_instance, mode=prompt_mode)
+        ctx.add_shutdown_callback(compactor.aclose)
+
+    @session.on("metrics_collected")
+    def _on_metrics(ev: MetricsCollectedEvent):
+        """Track prompt cache hits per agent mode."""
+        if compactor is not None and compactor.owns(ev.metrics):
+            return  # context summaries: a different prompt, not a call turn
+        if isinstance(ev.metrics, LLMMetrics):
+            record_llm_metrics(prompt_mode, ev.metrics)
+        first_turn.on_metrics(ev.metrics)
+        call_end.stats.on_metrics(ev.metrics)
+
+    ctx.add_shutdown_callback(_log_call_stats)
+
+    # Transcript and tool calls — summarized after the hang-up, then queued
+    # and written in batches by call_records' writer thread
+    recorder = CallRecorder(session, CallRecord(
+        call_id=ctx.job.id,
+        room=ctx.room.name,
+        source="dashboard" if dashboard_config else "sip",
+        mode=prompt_mode,
+        sheet_id=config.google_sheet_id,
+    ))
+
+    async def _save_call_record() -> None:
+        record = recorder.finish()
+        if record is None:
+            return
+        record.end_reason = record.end_reason or call_end.reason  # silence farewell, transfers
+        pin_config(call_config)  # shutdown callbacks don't see the call's pinned config
+        await summarize_call(record, llm_instance)
+        call_records.submit(record)
+        if server_options.get("job_executor_type") != JobExecutorType.THREAD:
+            await call_records.drain()  # this process ends with the call
+
+    ctx.add_shutdown_callback(_save_call_record)
 
     # Create agent with resolved instructions and tools
-    agent = Agent(
+    agent = BanglaVoiceAgent(
         instructions=agent_instructions,
         tools=tools,
+        compactor=compactor,
     )
 
     await session.start(
         room=ctx.room,
         agent=agent,
+        room_options=audio_profile.room_options(),
     )
+    for participant in ctx.room.remote_participants.values():
+        recorder.record.caller = recorder.record.caller or participant.attributes.get(SIP_CALLER_NUMBER, "")
 
     # ═══════════════════════════════════════════════════════
     # BACKGROUND AUDIO — office ambience + thinking sounds
     # Only works in room mode (dev/start), NOT console mode
     # ═══════════════════════════════════════════════════════
-    bg_audio = _build_background_audio()
+    bg_audio = await _build_background_audio()
     if bg_audio:
         await bg_audio.start(room=ctx.room, agent_session=session)
+        call_end.background_audio = bg_audio
         logger.info("🔊 Background audio started")
 
     # ═══════════════════════════════════════════════════════
     # FIRST GREETING
-    # Dashboard: uses custom first_message if provided
-    # SIP/Phone: uses default salam greeting
+    # Dashboard: speaks the custom first_message verbatim
+    # SIP/Phone: speaks the mode's scripted salam greeting
+    # Only modes without a fixed greeting ask the LLM
     # ═══════════════════════════════════════════════════════
     if first_message and first_message.strip():
-        # Dashboard custom greeting — speak the exact first_message
-        await session.generate_reply(
-            instructions=(
-                f"কলারকে ঠিক এই কথাটা বলো, কোনো কিছু বাদ দিবে না বা যোগ করবে না: "
-                f"'{first_message}'"
-            )
-        )
+        # Dashboard custom greeting — straight to TTS, no LLM (arbitrary text, not cached)
+        await session.say(first_message.strip())
         logger.info(f"🎙️ Custom first message: {first_message[:60]}...")
+    elif greeting:
+        # Scripted salam greeting for this mode
+        await say_scripted(session, greeting, voice_key=voice_key(tts_instance))
     else:
-        # Default salam greeting (original behavior)
-        await session.generate_reply(
-            instructions=(
-                "আসসালামু আলাইকুম বলে কলারকে সালাম দাও। "
-                "নিজের পরিচয় দাও — তুমি নুসরাত, এই কোম্পানির রিসেপশনিস্ট। "
-                "তারপর কলারের নাম জিজ্ঞেস করো। "
-                "২ লাইনের বেশি বলো না।"
-            )
-        )
+        # Mode needs caller details in the greeting — let the LLM write it
+        await session.generate_reply(instructions=prompts.GREETING_INSTRUCTIONS)
 
     logger.info("🎙️ Agent session started — silence monitor active")
 
@@ -0,0 +1 @@
+"""Offline benchmarks for the voice agent. Run from bangla-voice-agent/: python -m bench.<name>"""
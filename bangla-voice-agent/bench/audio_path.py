@@ -0,0 +1,105 @@
+"""
+Audio path benchmark — SIP calls as wideband vs. telephony profile
+═══════════════════════════════════════════════════
+Measures the CPU the agent itself spends per second of caller audio on
+the input side (VAD incl. its resampling, resampling for STT), for:
+  wideband   -> how SIP calls were handled before: room audio at 24 kHz,
+                VAD and STT at 16 kHz
+  telephony  -> providers/audio_profile.py: everything at
+                TELEPHONY_SAMPLE_RATE, no resampling
+
+Also reports the PCM bytes per second TTS produces at each output rate.
+Provider-side and SIP-bridge savings are not included.
+
+Usage (from bangla-voice-agent/):
+  python -m bench.audio_path --seconds 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+from livekit import rtc
+from livekit.plugins import silero
+
+from config import config
+
+STT_DEFAULT_RATE = 16000  # Google/Azure/Deepgram/AssemblyAI default input
+ROOM_DEFAULT_RATE = 24000  # AgentSession room audio default
+TTS_DEFAULT_RATE = 24000
+
+
+def _caller_audio(seconds: float, rate: int) -> list[rtc.AudioFrame]:
+    """Speech-like bursts with pauses, in 10 ms frames."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * rate)) / rate
+    voiced = np.sin(2 * np.pi * 140 * t) * (1 + 0.3 * rng.standard_normal(t.size))
+    pcm = (voiced * (((t % 1.6) < 1.0)) * 8000).astype(np.int16)
+    step = rate // 100
+    return [
+        rtc.AudioFrame(
+            data=pcm[i : i + step].tobytes(),
+            sample_rate=rate,
+            num_channels=1,
+            samples_per_channel=step,
+        )
+        for i in range(0, len(pcm) - step + 1, step)
+    ]
+
+
+async def _input_cpu(room_rate: int, vad_rate: int, stt_rate: int, seconds: float) -> float:
+    """CPU seconds per second of caller audio."""
+    frames = _caller_audio(seconds, room_rate)
+    vad = silero.VAD.load(sample_rate=vad_rate)
+
+    start = time.process_time()
+    stream = vad.stream()
+    resampler = (
+        rtc.AudioResampler(input_rate=room_rate, output_rate=stt_rate)
+        if room_rate != stt_rate
+        else None
+    )
+    for frame in frames:
+        stream.push_frame(frame)
+        if resampler:
+            resampler.push(frame)  # what the STT stream does before sending
+    stream.end_input()
+    async for _ in stream:
+        pass
+    await stream.aclose()
+    return (time.process_time() - start) / seconds
+
+
+async def run(seconds: float) -> dict:
+    rate = config.telephony_sample_rate
+    wideband = await _input_cpu(ROOM_DEFAULT_RATE, STT_DEFAULT_RATE, STT_DEFAULT_RATE, seconds)
+    telephony = await _input_cpu(rate, rate, rate, seconds)
+    return {
+        "seconds": seconds,
+        "wideband": {
+            "input_cpu_ms_per_call_second": round(wideband * 1000, 2),
+            "tts_pcm_bytes_per_second": TTS_DEFAULT_RATE * 2,
+        },
+        "telephony": {
+            "sample_rate": rate,
+            "input_cpu_ms_per_call_second": round(telephony * 1000, 2),
+            "tts_pcm_bytes_per_second": rate * 2,
+        },
+        "cpu_saved_per_call": f"{1 - telephony / wideband:.0%}" if wideband else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=30.0, help="caller audio to process")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.seconds)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
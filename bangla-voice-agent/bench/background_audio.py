@@ -0,0 +1,117 @@
+"""
+Background audio benchmark — per-call decoding vs. shared clip cache
+═══════════════════════════════════════════════════
+For N calls, pulls S seconds of ambience (looped) plus one thinking
+sound per call from each kind of source and reports, per added call:
+  - CPU ms per second of call
+  - Python memory allocated (tracemalloc peak)
+
+  per_call  -> what BackgroundAudioPlayer does with a BuiltinAudioClip:
+               decode the file, scale every frame by the volume
+  cached    -> clip_cache.load_clip: pre-scaled PCM, memory-mapped from
+               CLIP_CACHE_DIR and shared by every process
+
+The mixer and track publishing cost the same in both and are left out.
+
+Usage (from bangla-voice-agent/):
+  python -m bench.background_audio --calls 20 --seconds 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+import numpy as np
+from livekit import rtc
+from livekit.agents.utils.audio import audio_frames_from_file
+
+from clip_cache import AUDIO_CLIPS, MIXER_SAMPLE_RATE, cache_report, load_clip
+from config import config
+
+AMBIENT = "office"
+THINKING = "typing"
+
+
+async def _per_call_source(path: str, volume: float, loop: bool):
+    """BackgroundAudioPlayer's path for file clips."""
+    while True:
+        async for frame in audio_frames_from_file(path, sample_rate=MIXER_SAMPLE_RATE):
+            data = np.frombuffer(frame.data, dtype=np.int16).astype(np.float32)
+            data *= volume
+            np.clip(data, -32768, 32767, out=data)
+            yield rtc.AudioFrame(
+                data=data.astype(np.int16).tobytes(),
+                sample_rate=frame.sample_rate,
+                num_channels=frame.num_channels,
+                samples_per_channel=frame.samples_per_channel,
+            )
+        if not loop:
+            return
+
+
+async def _pull(source, seconds: float | None) -> None:
+    pulled = 0.0
+    async for frame in source:
+        pulled += frame.duration
+        if seconds is not None and pulled >= seconds:
+            break
+
+
+async def _calls(make_sources, calls: int, seconds: float) -> dict:
+    tracemalloc.start()
+    cpu_start = time.process_time()
+    for _ in range(calls):
+        ambient, thinking = await make_sources()
+        await asyncio.gather(_pull(ambient, seconds), _pull(thinking, None))
+    cpu = time.process_time() - cpu_start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "cpu_ms_per_call_second": round(cpu / (calls * seconds) * 1000, 3),
+        "alloc_peak_kib": round(peak / 1024),
+    }
+
+
+async def run(calls: int, seconds: float) -> dict:
+    ambient_path = AUDIO_CLIPS[AMBIENT].path()
+    thinking_path = AUDIO_CLIPS[THINKING].path()
+    ambient_vol = config.background_audio_volume
+    thinking_vol = config.thinking_sound_volume
+
+    async def per_call():
+        return (
+            _per_call_source(ambient_path, ambient_vol, loop=True),
+            _per_call_source(thinking_path, thinking_vol, loop=False),
+        )
+
+    async def cached():
+        return (
+            await load_clip(AUDIO_CLIPS[AMBIENT], volume=ambient_vol, loop=True),
+            await load_clip(AUDIO_CLIPS[THINKING], volume=thinking_vol),
+        )
+
+    report = {"calls": calls, "seconds_per_call": seconds}
+    report["per_call"] = await _calls(per_call, calls, seconds)
+    await cached()  # one-time load per process; the mapped pages are shared across processes
+    report["cached"] = await _calls(cached, calls, seconds)
+    clips = cache_report()
+    report["cached"]["mapped_clip_kib"] = round(clips["mapped_bytes"] / 1024)
+    report["cached"]["private_clip_kib"] = round(clips["private_bytes"] / 1024)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=30.0, help="ambience pulled per call")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.calls, args.seconds)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
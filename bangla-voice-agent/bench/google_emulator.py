@@ -0,0 +1,481 @@
+"""
+Google Sheets / Calendar emulator — the CRM and calendar tools without Google
+═══════════════════════════════════════════════════
+A localhost HTTP server with the part of the Sheets v4 and Calendar v3
+APIs that tools/crm.py and tools/appointment.py use:
+
+  Sheets    GET  /v4/spreadsheets/{id}                     (metadata)
+            GET  /v4/spreadsheets/{id}/values/{range}
+            PUT  /v4/spreadsheets/{id}/values/{range}
+            POST /v4/spreadsheets/{id}/values/{range}:append
+            POST /v4/spreadsheets/{id}/values:batchUpdate
+            POST /v4/spreadsheets/{id}:batchUpdate
+  Calendar  POST   /calendar/v3/freeBusy
+            GET    /calendar/v3/calendars/{id}/events
+            POST   /calendar/v3/calendars/{id}/events
+            DELETE /calendar/v3/calendars/{id}/events/{event_id}
+
+Any spreadsheet or calendar ID works; it is seeded on first use with
+--rows CRM customers or --events-per-day busy events. Every request
+waits --latency-ms (± jitter), and --error-rate of them fail with 429
+RESOURCE_EXHAUSTED like a real quota error.
+
+Point the tools at it with GOOGLE_API_EMULATOR=http://127.0.0.1:8765
+(no service-account credentials needed).
+
+Usage (from bangla-voice-agent/):
+  python -m bench.google_emulator --rows 100000 --events-per-day 12 --latency-ms 80
+
+In-process (tests):
+  emulator = GoogleEmulator(rows=100_000)
+  url = emulator.start()          # serves from a background thread
+  ...
+  emulator.stats                  # requests per endpoint
+  emulator.stop()
+
+Child process (benchmarks — the emulator's JSON work doesn't compete
+for the caller's GIL and skew its timings):
+  emulator = EmulatorProcess(rows=100_000)
+  url = emulator.start()
+  emulator.stats()                # GET /_emulator/stats, not counted itself
+  emulator.stop()
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import re
+import threading
+import urllib.request
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from aiohttp import web
+
+HEADERS = ["Name", "Phone", "Email", "Company", "Last Interaction", "Notes", "Status"]
+DHAKA = timezone(timedelta(hours=6))
+BUSINESS_START_HOUR = 9
+BUSINESS_END_HOUR = 17
+SEEDED_DAYS = 60  # busy events from today on
+SHEET_TITLE = "Sheet1"
+
+# Phone of a seeded customer, for lookups that should hit
+KNOWN_PHONE = "01712345678"
+
+
+# ═══════════════════════════════════════════════════════
+# A1 RANGES
+# ═══════════════════════════════════════════════════════
+_CELL = re.compile(r"^([A-Z]*)(\d*)$")
+
+
+def _column(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+def _letters(col: int) -> str:
+    out = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        out = chr(65 + rem) + out
+    return out
+
+
+def parse_range(a1: str) -> tuple[int, int, int | None, int | None]:
+    """'Sheet1!B2:C' -> (row1, col1, row2, col2), 1-based; None = open-ended."""
+    if "!" in a1:
+        a1 = a1.split("!", 1)[1]
+    elif a1.strip("'") == SHEET_TITLE:
+        a1 = ""  # the whole sheet
+    a1 = a1.replace("$", "").upper()
+    if not a1:
+        return 1, 1, None, None
+    start, _, end = a1.partition(":")
+    m1, m2 = _CELL.match(start), _CELL.match(end or start)
+    if not m1 or not m2:
+        raise ValueError(f"bad range {a1!r}")
+    row1 = int(m1.group(2) or 1)
+    col1 = _column(m1.group(1)) if m1.group(1) else 1
+    row2 = int(m2.group(2)) if m2.group(2) else None
+    col2 = _column(m2.group(1)) if m2.group(1) else None
+    return row1, col1, row2, col2
+
+
+def _a1(row1: int, col1: int, row2: int, col2: int) -> str:
+    return f"{SHEET_TITLE}!{_letters(col1)}{row1}:{_letters(col2)}{row2}"
+
+
+# ═══════════════════════════════════════════════════════
+# DATA
+# ═══════════════════════════════════════════════════════
+class Sheet:
+    def __init__(self, rows: int, rng: random.Random) -> None:
+        self.rows: list[list[str]] = [list(HEADERS)]
+        for i in range(rows):
+            phone = KNOWN_PHONE if i == rows // 2 else f"01{rng.randint(3, 9)}{rng.randrange(10**8):08d}"
+            self.rows.append([
+                f"Customer {i}", phone, f"customer{i}@example.com", "", "2026-01-01",
+                "Seeded by the emulator", "active",
+            ])
+
+    def get(self, a1: str, columns: bool) -> list[list[str]]:
+        row1, col1, row2, col2 = parse_range(a1)
+        row2 = min(row2 or len(self.rows), len(self.rows))
+        width = max((len(r) for r in self.rows[row1 - 1 : row2]), default=0)
+        col2 = min(col2 or width, width)
+        grid = [
+            (self.rows[r - 1] + [""] * col2)[col1 - 1 : col2] for r in range(row1, row2 + 1)
+        ]
+        if columns:
+            grid = [list(col) for col in zip(*grid)] if grid else []
+        # Like Sheets: no trailing empty cells or rows
+        grid = [row[: max((i + 1 for i, v in enumerate(row) if v != ""), default=0)] for row in grid]
+        while grid and not grid[-1]:
+            grid.pop()
+        return grid
+
+    def put(self, row1: int, col1: int, values: list[list]) -> tuple[int, int]:
+        for r, row in enumerate(values):
+            index = row1 - 1 + r
+            while len(self.rows) <= index:
+                self.rows.append([])
+            target = self.rows[index]
+            target.extend([""] * (col1 - 1 + len(row) - len(target)))
+            for c, value in enumerate(row):
+                target[col1 - 1 + c] = "" if value is None else str(value)
+        return len(values), max((len(row) for row in values), default=0)
+
+    def last_row(self) -> int:
+        last = len(self.rows)
+        while last and not any(self.rows[last - 1]):
+            last -= 1
+        return last
+
+
+class Calendar:
+    def __init__(self, events_per_day: int, rng: random.Random) -> None:
+        self.events: dict[str, dict] = {}
+        slots = (BUSINESS_END_HOUR - BUSINESS_START_HOUR) * 2
+        today = datetime.now(DHAKA).replace(hour=0, minute=0, second=0, microsecond=0)
+        for day in range(SEEDED_DAYS):
+            for slot in rng.sample(range(slots), min(events_per_day, slots)):
+                start = today + timedelta(days=day, hours=BUSINESS_START_HOUR, minutes=30 * slot)
+                self.insert({
+                    "summary": f"Seeded appointment {day}-{slot}",
+                    "start": {"dateTime": start.isoformat()},
+                    "end": {"dateTime": (start + timedelta(minutes=30)).isoformat()},
+                })
+
+    def insert(self, body: dict) -> dict:
+        event = dict(body, id=uuid.uuid4().hex, status="confirmed")
+        event["_start"] = _event_time(body["start"])
+        event["_end"] = _event_time(body["end"])
+        self.events[event["id"]] = event
+        return event
+
+    def between(self, time_min: str | None, time_max: str | None) -> list[dict]:
+        lo = datetime.fromisoformat(time_min) if time_min else None
+        hi = datetime.fromisoformat(time_max) if time_max else None
+        return sorted(
+            (e for e in self.events.values()
+             if (hi is None or e["_start"] < hi) and (lo is None or e["_end"] > lo)),
+            key=lambda e: e["_start"],
+        )
+
+
+def _event_time(field: dict) -> datetime:
+    """Event start/end; a dateTime without offset is in the given timeZone."""
+    dt = datetime.fromisoformat(field["dateTime"])
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=ZoneInfo(field.get("timeZone", "UTC")))
+    return dt
+
+
+def _public(event: dict) -> dict:
+    return {k: v for k, v in event.items() if not k.startswith("_")}
+
+
+# ═══════════════════════════════════════════════════════
+# SERVER
+# ═══════════════════════════════════════════════════════
+class GoogleEmulator:
+    def __init__(
+        self,
+        *,
+        rows: int = 1000,
+        events_per_day: int = 8,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.rows = rows
+        self.events_per_day = events_per_day
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.sheets: dict[str, Sheet] = {}
+        self.calendars: dict[str, Calendar] = {}
+        self.stats: Counter[str] = Counter()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+
+    # ─── data ───
+    def sheet(self, spreadsheet_id: str) -> Sheet:
+        if spreadsheet_id not in self.sheets:
+            self.sheets[spreadsheet_id] = Sheet(self.rows, self._rng)
+        return self.sheets[spreadsheet_id]
+
+    def calendar(self, calendar_id: str) -> Calendar:
+        if calendar_id not in self.calendars:
+            self.calendars[calendar_id] = Calendar(self.events_per_day, self._rng)
+        return self.calendars[calendar_id]
+
+    # ─── request handling ───
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        name = request.match_info.route.name or "unknown"
+        if name.startswith("emulator."):
+            return await handler(request)
+        self.stats[name] += 1
+        delay = self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.stats["quota_errors"] += 1
+            return web.json_response(
+                {"error": {
+                    "code": 429,
+                    "message": "Quota exceeded for quota metric 'Read requests' (emulated)",
+                    "status": "RESOURCE_EXHAUSTED",
+                }},
+                status=429,
+            )
+        try:
+            return await handler(request)
+        except ValueError as e:
+            return web.json_response(
+                {"error": {"code": 400, "message": str(e), "status": "INVALID_ARGUMENT"}}, status=400
+            )
+
+    async def _spreadsheet(self, request: web.Request) -> web.Response:
+        sheet_id = request.match_info["id"]
+        sheet = self.sheet(sheet_id)
+        return web.json_response({
+            "spreadsheetId": sheet_id,
+            "properties": {"title": f"CRM {sheet_id}", "locale": "en_US", "timeZone": "Asia/Dhaka"},
+            "sheets": [{"properties": {
+                "sheetId": 0, "title": SHEET_TITLE, "index": 0, "sheetType": "GRID",
+                "gridProperties": {"rowCount": max(1000, len(sheet.rows)), "columnCount": 26},
+            }}],
+        })
+
+    async def _values_get(self, request: web.Request) -> web.Response:
+        a1 = request.match_info["range"]
+        columns = request.query.get("majorDimension") == "COLUMNS"
+        values = self.sheet(request.match_info["id"]).get(a1, columns)
+        body = {"range": a1, "majorDimension": "COLUMNS" if columns else "ROWS"}
+        if values:
+            body["values"] = values
+        return web.json_response(body)
+
+    def _update(self, sheet_id: str, a1: str, values: list[list]) -> dict:
+        row1, col1, _, _ = parse_range(a1)
+        rows, cols = self.sheet(sheet_id).put(row1, col1, values)
+        return {
+            "spreadsheetId": sheet_id,
+            "updatedRange": _a1(row1, col1, row1 + rows - 1, col1 + cols - 1),
+            "updatedRows": rows,
+            "updatedColumns": cols,
+            "updatedCells": sum(len(row) for row in values),
+        }
+
+    async def _values_put(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response(
+            self._update(request.match_info["id"], request.match_info["range"], body.get("values", []))
+        )
+
+    async def _values_append(self, request: web.Request) -> web.Response:
+        sheet_id = request.match_info["id"]
+        a1 = request.match_info["range"]
+        _, col1, _, _ = parse_range(a1)
+        body = await request.json()
+        row = self.sheet(sheet_id).last_row() + 1
+        update = self._update(sheet_id, f"{_letters(col1)}{row}", body.get("values", []))
+        return web.json_response({"spreadsheetId": sheet_id, "tableRange": a1, "updates": update})
+
+    async def _values_batch_update(self, request: web.Request) -> web.Response:
+        sheet_id = request.match_info["id"]
+        body = await request.json()
+        responses = [self._update(sheet_id, d["range"], d.get("values", [])) for d in body.get("data", [])]
+        return web.json_response({
+            "spreadsheetId": sheet_id,
+            "totalUpdatedCells": sum(r["updatedCells"] for r in responses),
+            "responses": responses,
+        })
+
+    async def _batch_update(self, request: web.Request) -> web.Response:
+        # Formatting/resize requests — accepted, nothing to store
+        body = await request.json()
+        return web.json_response({
+            "spreadsheetId": request.match_info["id"],
+            "replies": [{} for _ in body.get("requests", [])],
+        })
+
+    async def _freebusy(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        calendars = {
+            item["id"]: {"busy": [
+                {"start": e["_start"].isoformat(), "end": e["_end"].isoformat()}
+                for e in self.calendar(item["id"]).between(body.get("timeMin"), body.get("timeMax"))
+            ]}
+            for item in body.get("items", [])
+        }
+        return web.json_response({
+            "kind": "calendar#freeBusy",
+            "timeMin": body.get("timeMin"),
+            "timeMax": body.get("timeMax"),
+            "calendars": calendars,
+        })
+
+    async def _events_list(self, request: web.Request) -> web.Response:
+        events = self.calendar(request.match_info["calendar"]).between(
+            request.query.get("timeMin"), request.query.get("timeMax")
+        )
+        return web.json_response({"kind": "calendar#events", "items": [_public(e) for e in events]})
+
+    async def _events_insert(self, request: web.Request) -> web.Response:
+        event = self.calendar(request.match_info["calendar"]).insert(await request.json())
+        return web.json_response(_public(event))
+
+    async def _events_delete(self, request: web.Request) -> web.Response:
+        calendar = self.calendar(request.match_info["calendar"])
+        if calendar.events.pop(request.match_info["event"], None) is None:
+            return web.json_response({"error": {"code": 404, "message": "Not Found"}}, status=404)
+        return web.Response(status=204)
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.stats))
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        sheets = "/v4/spreadsheets/{id}"
+        calendar = "/calendar/v3/calendars/{calendar}/events"
+        app.router.add_get(sheets, self._spreadsheet, name="sheets.get")
+        app.router.add_post(sheets + ":batchUpdate", self._batch_update, name="sheets.batchUpdate")
+        app.router.add_post(sheets + "/values:batchUpdate", self._values_batch_update, name="values.batchUpdate")
+        app.router.add_post(sheets + "/values/{range}:append", self._values_append, name="values.append")
+        app.router.add_get(sheets + "/values/{range}", self._values_get, name="values.get")
+        app.router.add_put(sheets + "/values/{range}", self._values_put, name="values.update")
+        app.router.add_post("/calendar/v3/freeBusy", self._freebusy, name="freebusy.query")
+        app.router.add_get(calendar, self._events_list, name="events.list")
+        app.router.add_post(calendar, self._events_insert, name="events.insert")
+        app.router.add_delete(calendar + "/{event}", self._events_delete, name="events.delete")
+        app.router.add_get("/_emulator/stats", self._stats, name="emulator.stats")
+        return app
+
+    # ─── in-process serving ───
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve from a background thread; returns the base URL."""
+        ready = threading.Event()
+        url: list[str] = []
+
+        async def serve() -> None:
+            self._runner = web.AppRunner(self.app(), access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, host, port)
+            await site.start()
+            bound = site._server.sockets[0].getsockname()[1]
+            url.append(f"http://{host}:{bound}")
+            ready.set()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(serve())
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="google-emulator", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return url[0]
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+
+def _serve_child(options: dict, conn) -> None:
+    conn.send(GoogleEmulator(**options).start())
+    threading.Event().wait()
+
+
+class EmulatorProcess:
+    """GoogleEmulator served from a child process."""
+
+    def __init__(self, **options) -> None:
+        self.options = options
+        self.url = ""
+        self._proc: multiprocessing.Process | None = None
+
+    def start(self) -> str:
+        ctx = multiprocessing.get_context("spawn")
+        parent, child = ctx.Pipe()
+        self._proc = ctx.Process(target=_serve_child, args=(self.options, child), daemon=True)
+        self._proc.start()
+        self.url = parent.recv()
+        return self.url
+
+    def stats(self) -> dict[str, int]:
+        with urllib.request.urlopen(f"{self.url}/_emulator/stats") as response:
+            return json.load(response)
+
+    def requests(self) -> int:
+        return sum(self.stats().values())
+
+    def stop(self) -> None:
+        if self._proc is not None:
+            self._proc.terminate()
+            self._proc.join()
+            self._proc = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rows", type=int, default=1000, help="CRM customers per spreadsheet")
+    parser.add_argument("--events-per-day", type=int, default=8, help="busy 30-min slots per day")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failing with 429")
+    args = parser.parse_args()
+
+    emulator = GoogleEmulator(
+        rows=args.rows,
+        events_per_day=args.events_per_day,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+    )
+    print(f"Google emulator on http://{args.host}:{args.port} — set GOOGLE_API_EMULATOR to this URL")
+    web.run_app(emulator.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
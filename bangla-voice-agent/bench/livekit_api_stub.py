@@ -0,0 +1,174 @@
+"""
+LiveKit server API stand-in — SIP transfers without a PBX
+═══════════════════════════════════════════════════
+A localhost Twirp server with the part of the LiveKit server API that
+sip_transfer.py uses, so warm and cold transfers can be run and timed
+without a LiveKit server, SIP trunk or phone:
+
+  SIP          CreateSIPParticipant    rings --answer-ms, then joins the
+                                       room (or fails, see below)
+               TransferSIPParticipant  accepts the REFER after --refer-ms
+  RoomService  RemoveParticipant, DeleteRoom
+
+Dialed numbers behave by their last digit — 0 answers, 7 is busy (SIP
+486 at once), 8 never answers (SIP 480 after the request's ringing
+timeout, scaled by --ring-scale), 9 fails every request — so one
+routing table covers every path. Transfers to a target containing
+"fail" are rejected. GET /_stub/stats returns requests per method and
+the participants in each room.
+
+Usage (from bangla-voice-agent/):
+  python -m bench.livekit_api_stub --answer-ms 3000 --refer-ms 800
+  then api.LiveKitAPI("http://127.0.0.1:7881", "key", "secret") — any key works
+
+In-process (benchmarks):
+  stub = LiveKitAPIStub(answer_ms=3000)
+  url = stub.start()              # serves from a background thread
+  ...
+  stub.stats
+  stub.stop()
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+from collections import Counter, defaultdict
+
+from aiohttp import web
+from livekit import api
+
+ROUTES = {
+    "/twirp/livekit.SIP/CreateSIPParticipant": "create_sip_participant",
+    "/twirp/livekit.SIP/TransferSIPParticipant": "transfer_sip_participant",
+    "/twirp/livekit.RoomService/RemoveParticipant": "remove_participant",
+    "/twirp/livekit.RoomService/DeleteRoom": "delete_room",
+}
+
+
+class TwirpError(Exception):
+    def __init__(self, code: str, msg: str, status: int, meta: dict | None = None) -> None:
+        super().__init__(msg)
+        self.body = {"code": code, "msg": msg, "meta": meta or {}}
+        self.status = status
+
+
+class LiveKitAPIStub:
+    def __init__(self, answer_ms: float = 3000.0, refer_ms: float = 800.0, ring_scale: float = 0.1) -> None:
+        self.answer = answer_ms / 1000
+        self.refer = refer_ms / 1000
+        self.ring_scale = ring_scale
+        self.stats: Counter[str] = Counter()
+        self.rooms: dict[str, set[str]] = defaultdict(set)
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    # ─── methods ───
+    async def create_sip_participant(self, body: bytes) -> api.SIPParticipantInfo:
+        request = api.CreateSIPParticipantRequest.FromString(body)
+        behavior = request.sip_call_to[-1:]
+        if behavior == "9":
+            raise TwirpError("internal", "trunk error", 500)
+        if behavior == "7":
+            raise TwirpError("unavailable", "busy", 503, {"sip_status_code": "486", "sip_status": "Busy Here"})
+        if behavior == "8":
+            await asyncio.sleep((request.ringing_timeout.seconds or 30) * self.ring_scale)
+            raise TwirpError(
+                "unavailable", "no answer", 503, {"sip_status_code": "480", "sip_status": "Temporarily Unavailable"}
+            )
+        await asyncio.sleep(self.answer if request.wait_until_answered else 0)
+        self.rooms[request.room_name].add(request.participant_identity)
+        return api.SIPParticipantInfo(
+            participant_id=f"PA_{request.participant_identity}",
+            participant_identity=request.participant_identity,
+            room_name=request.room_name,
+            sip_call_id=f"SCL_{self.stats['create_sip_participant']}",
+        )
+
+    async def transfer_sip_participant(self, body: bytes) -> api.TransferSIPParticipantResponse:
+        request = api.TransferSIPParticipantRequest.FromString(body)
+        await asyncio.sleep(self.refer)
+        if "fail" in request.transfer_to:
+            raise TwirpError("unavailable", "transfer rejected", 503, {"sip_status_code": "603", "sip_status": "Decline"})
+        self.rooms[request.room_name].discard(request.participant_identity)
+        return api.TransferSIPParticipantResponse(status=api.STS_TRANSFER_SUCCESSFUL)
+
+    async def remove_participant(self, body: bytes) -> api.RemoveParticipantResponse:
+        request = api.RoomParticipantIdentity.FromString(body)
+        if request.identity not in self.rooms[request.room]:
+            raise TwirpError("not_found", "participant not found", 404)
+        self.rooms[request.room].discard(request.identity)
+        return api.RemoveParticipantResponse()
+
+    async def delete_room(self, body: bytes) -> api.DeleteRoomResponse:
+        request = api.DeleteRoomRequest.FromString(body)
+        self.rooms.pop(request.room, None)
+        return api.DeleteRoomResponse()
+
+    # ─── HTTP ───
+    async def _twirp(self, request: web.Request) -> web.Response:
+        method = ROUTES[request.path]
+        self.stats[method] += 1
+        try:
+            response = await getattr(self, method)(await request.read())
+        except TwirpError as e:
+            return web.json_response(e.body, status=e.status)
+        return web.Response(body=response.SerializeToString(), content_type="application/protobuf")
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"requests": dict(self.stats), "rooms": {k: sorted(v) for k, v in self.rooms.items()}})
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        for path in ROUTES:
+            app.router.add_post(path, self._twirp)
+        app.router.add_get("/_stub/stats", self._stats)
+        return app
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve from a background thread; returns the base URL."""
+        ready = threading.Event()
+        url: list[str] = []
+
+        async def serve() -> None:
+            self._runner = web.AppRunner(self.app(), access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, host, port)
+            await site.start()
+            bound = site._server.sockets[0].getsockname()[1]
+            url.append(f"http://{host}:{bound}")
+            ready.set()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(serve())
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="livekit-api-stub", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return url[0]
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7881)
+    parser.add_argument("--answer-ms", type=float, default=3000.0, help="ringing before a pre-dial is answered")
+    parser.add_argument("--refer-ms", type=float, default=800.0, help="until a cold transfer is accepted")
+    parser.add_argument("--ring-scale", type=float, default=0.1, help="fraction of the ringing timeout before no-answer")
+    args = parser.parse_args()
+    stub = LiveKitAPIStub(args.answer_ms, args.refer_ms, args.ring_scale)
+    web.run_app(stub.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Load test — how many concurrent calls one worker sustains
+═══════════════════════════════════════════════════
+Starts the agent worker with the load-test stand-in providers
+(providers/loadtest.py — no Google/OpenAI keys needed) and places N
+synthetic calls against it. Every call runs the real entrypoint: room
+audio, VAD, turn detection, tools, background audio, silence monitor.
+Each caller says something, waits for the agent's reply, and repeats.
+
+Reports:
+  - sessions per core   calls / CPU cores the worker used (all its processes)
+  - memory per session  worker RSS growth / calls
+  - loop lag            worst lag per second on each call's event loop
+  - turn latency        caller stops talking -> agent audio starts
+
+Needs a LiveKit server; a local `livekit-server --dev` is enough
+(LIVEKIT_URL / LIVEKIT_API_KEY / LIVEKIT_API_SECRET from .env, dev
+defaults otherwise). Timings of the stand-ins: LOADTEST_* in config.py.
+
+Usage (from bangla-voice-agent/):
+  livekit-server --dev &
+  python -m bench.load_test --calls 20 --turns 5
+  python -m bench.load_test --calls 40 --no-admission   # past the worker's limits
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import psutil
+from livekit import api, rtc
+
+from config import config
+
+AGENT_DIR = Path(__file__).resolve().parent.parent
+
+CALLER_RATE = 16000
+CALLER_FRAME = CALLER_RATE // 100  # 10 ms
+CALLER_SPEECH_SECONDS = 1.5
+AGENT_VOICE_RMS = 300  # the stand-in TTS tone is ~700 RMS
+AGENT_DONE_QUIET = 1.0  # seconds of agent quiet that end its reply
+REPLY_TIMEOUT = 20.0
+WORKER_START_TIMEOUT = 90.0
+
+
+def _pct(values: list[float], p: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))], 1)
+
+
+def _distribution(values: list[float]) -> dict:
+    return {"n": len(values), "p50": _pct(values, 50), "p90": _pct(values, 90), "p99": _pct(values, 99),
+            "max": round(max(values), 1) if values else None}
+
+
+# ═══════════════════════════════════════════════════════
+# WORKER — the agent under test, as its own process tree
+# ═══════════════════════════════════════════════════════
+class Worker:
+    def __init__(self, stats_dir: Path, no_admission: bool) -> None:
+        self.log_path = stats_dir / "worker.log"
+        env = dict(
+            os.environ,
+            STT_PROVIDER="loadtest",
+            LLM_PROVIDER="loadtest",
+            TTS_PROVIDER="loadtest",
+            LOADTEST_STATS_DIR=str(stats_dir),
+        )
+        if no_admission:
+            env.update(MAX_SESSIONS_PER_WORKER="0", MAX_LOOP_LAG_MS="1e9", MAX_WORKER_CPU="1e9")
+        self._log = open(self.log_path, "w")
+        self.proc = subprocess.Popen(
+            [sys.executable, "agent.py", "start"],
+            cwd=AGENT_DIR,
+            env=env,
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+        )
+        self._root = psutil.Process(self.proc.pid)
+        self._cpu: dict[int, tuple[float, float]] = {}  # pid -> (first, last) CPU seconds
+
+    async def wait_registered(self) -> None:
+        deadline = time.monotonic() + WORKER_START_TIMEOUT
+        while "registered worker" not in self.log_path.read_text(errors="replace"):
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"worker exited — see {self.log_path}")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"worker did not register — see {self.log_path}")
+            await asyncio.sleep(0.5)
+
+    def sample(self) -> int:
+        """Update per-process CPU time; returns the tree's RSS in bytes."""
+        rss = 0
+        for proc in [self._root, *self._root.children(recursive=True)]:
+            try:
+                times = proc.cpu_times()
+                rss += proc.memory_info().rss
+            except psutil.Error:
+                continue
+            cpu = times.user + times.system
+            first, _ = self._cpu.get(proc.pid, (cpu, cpu))
+            self._cpu[proc.pid] = (first, cpu)
+        return rss
+
+    def reset_cpu(self) -> None:
+        self._cpu.clear()
+        self.sample()
+
+    def cpu_seconds(self) -> float:
+        return sum(last - first for first, last in self._cpu.values())
+
+    def stop(self) -> None:
+        self.proc.send_signal(signal.SIGINT)
+        try:
+            self.proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+        self._log.close()
+
+
+# ═══════════════════════════════════════════════════════
+# CALLER — one synthetic phone call
+# ═══════════════════════════════════════════════════════
+class Caller:
+    def __init__(self, room_name: str, identity: str) -> None:
+        self.room_name = room_name
+        self.identity = identity
+        self.room = rtc.Room()
+        self.talking_until = 0.0
+        self.agent_voice_at = 0.0  # last agent audio frame above the threshold
+        self.agent_onsets: list[float] = []  # agent starts speaking after quiet
+        self.latencies: list[float] = []
+        self.error: str | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def _token(self) -> str:
+        return (
+            api.AccessToken(config.livekit_api_key, config.livekit_api_secret)
+            .with_identity(self.identity)
+            .with_grants(api.VideoGrants(room_join=True, room=self.room_name))
+            .to_jwt()
+        )
+
+    async def _publish(self, source: rtc.AudioSource) -> None:
+        rng = np.random.default_rng(hash(self.identity) & 0xFFFF)
+        t = np.arange(CALLER_FRAME) / CALLER_RATE
+        silence = np.zeros(CALLER_FRAME, dtype=np.int16).tobytes()
+        start = time.perf_counter()
+        sent = 0
+        while True:
+            if time.monotonic() < self.talking_until:
+                voiced = np.sin(2 * np.pi * 140 * (t + sent / 100)) * (1 + 0.3 * rng.standard_normal(t.size))
+                data = (voiced * 6000).astype(np.int16).tobytes()
+            else:
+                data = silence
+            await source.capture_frame(rtc.AudioFrame(data, CALLER_RATE, 1, CALLER_FRAME))
+            sent += 1
+            await asyncio.sleep(max(0.0, start + sent / 100 - time.perf_counter()))
+
+    async def _listen(self, track: rtc.Track) -> None:
+        async for event in rtc.AudioStream(track, sample_rate=CALLER_RATE, num_channels=1):
+            pcm = np.frombuffer(event.frame.data, dtype=np.int16).astype(np.float32)
+            if pcm.size and np.sqrt(np.mean(pcm**2)) > AGENT_VOICE_RMS:
+                now = time.monotonic()
+                if now - self.agent_voice_at > AGENT_DONE_QUIET:
+                    self.agent_onsets.append(now)
+                self.agent_voice_at = now
+
+    async def _agent_reply(self, after: float) -> float:
+        """Wait for the agent to start and finish a reply; returns when it started."""
+        deadline = time.monotonic() + REPLY_TIMEOUT
+        while not any(onset > after for onset in self.agent_onsets):
+            if time.monotonic() > deadline:
+                raise TimeoutError("no agent reply")
+            await asyncio.sleep(0.02)
+        onset = next(onset for onset in self.agent_onsets if onset > after)
+        while time.monotonic() - self.agent_voice_at < AGENT_DONE_QUIET:
+            if time.monotonic() > deadline + REPLY_TIMEOUT:
+                raise TimeoutError("agent reply never ended")
+            await asyncio.sleep(0.05)
+        return onset
+
+    async def run(self, turns: int) -> None:
+        def on_track(track: rtc.Track, publication, participant) -> None:
+            if track.kind == rtc.TrackKind.KIND_AUDIO and publication.name != "background_audio":
+                self._tasks.append(asyncio.create_task(self._listen(track)))
+
+        self.room.on("track_subscribed", on_track)
+        try:
+            await self.room.connect(config.livekit_url, self._token())
+            source = rtc.AudioSource(CALLER_RATE, 1)
+            track = rtc.LocalAudioTrack.create_audio_track("caller", source)
+            await self.room.local_participant.publish_track(
+                track, rtc.TrackPublishOptions(source=rtc.TrackSource.SOURCE_MICROPHONE)
+            )
+            self._tasks.append(asyncio.create_task(self._publish(source)))
+
+            await self._agent_reply(after=0.0)  # greeting
+            for _ in range(turns):
+                self.talking_until = time.monotonic() + CALLER_SPEECH_SECONDS
+                await asyncio.sleep(CALLER_SPEECH_SECONDS)
+                stopped = time.monotonic()
+                onset = await self._agent_reply(after=stopped)
+                self.latencies.append((onset - stopped) * 1000)
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await self.room.disconnect()
+
+
+# ═══════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════
+def _loop_lag(stats_dir: Path) -> dict:
+    worst, mean = [], []
+    for path in stats_dir.glob("lag-*.jsonl"):
+        for line in path.read_text().splitlines():
+            sample = json.loads(line)
+            worst.append(sample["max_ms"])
+            mean.append(sample["mean_ms"])
+    return {
+        "loops": len(list(stats_dir.glob("lag-*.jsonl"))),
+        "worst_per_second_ms": _distribution(worst),
+        "mean_ms": round(sum(mean) / len(mean), 2) if mean else None,
+    }
+
+
+async def run(calls: int, turns: int, ramp: float, no_admission: bool) -> dict:
+    stats_dir = Path(tempfile.mkdtemp(prefix="bangla-loadtest-"))
+    worker = Worker(stats_dir, no_admission)
+    try:
+        await worker.wait_registered()
+        await asyncio.sleep(2.0)  # idle processes finish prewarming
+        idle_rss = worker.sample()
+        worker.reset_cpu()
+
+        run_id = f"{int(time.time())}"
+        callers = [Caller(f"loadtest-{run_id}-{i}", f"caller-{i}") for i in range(calls)]
+        peak_rss = idle_rss
+
+        async def sample_worker() -> None:
+            nonlocal peak_rss
+            while True:
+                peak_rss = max(peak_rss, worker.sample())
+                await asyncio.sleep(1.0)
+
+        sampler = asyncio.create_task(sample_worker())
+        start = time.perf_counter()
+
+        async def place(i: int, caller: Caller) -> None:
+            await asyncio.sleep(i * ramp)
+            await caller.run(turns)
+
+        await asyncio.gather(*(place(i, c) for i, c in enumerate(callers)))
+        wall = time.perf_counter() - start
+        sampler.cancel()
+        worker.sample()
+        cpu = worker.cpu_seconds()
+    finally:
+        worker.stop()
+
+    answered = [c for c in callers if c.error is None]
+    cores = cpu / wall if wall else 0.0
+    return {
+        "calls": calls,
+        "turns_per_call": turns,
+        "answered": len(answered),
+        "failed": {c.identity: c.error for c in callers if c.error},
+        "wall_seconds": round(wall, 1),
+        "worker_cpu_cores": round(cores, 2),
+        "sessions_per_core": round(len(answered) / cores, 1) if cores else None,
+        "memory_mib_per_session": round((peak_rss - idle_rss) / calls / 2**20, 1) if calls else None,
+        "worker_rss_mib": {"idle": round(idle_rss / 2**20), "peak": round(peak_rss / 2**20)},
+        "loop_lag": _loop_lag(stats_dir),
+        "turn_latency_ms": _distribution([ms for c in callers for ms in c.latencies]),
+        "worker_log": str(worker.log_path),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=5, help="caller turns per call after the greeting")
+    parser.add_argument("--ramp", type=float, default=0.5, help="seconds between call starts")
+    parser.add_argument("--no-admission", action="store_true", help="lift the worker's session/lag/CPU limits")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.calls, args.turns, args.ramp, args.no_admission)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+SIP transfer handoff latency — pre-dialed warm transfer vs. the rest
+═══════════════════════════════════════════════════
+Runs sip_transfer.SipTransfer against bench/livekit_api_stub.py (no
+LiveKit server, trunk or phone) with the handoff line played as a
+--handoff-ms wait, and measures per case the caller's wait from the end
+of the handoff line until they are connected:
+
+  warm           pre-dialed while the handoff line plays (what the agent does)
+  dial_after     dialed only once the handoff line is over (no pre-dial)
+  cold_no_answer pre-dial not answered -> cold transfer (SIP REFER)
+  cold_busy      pre-dial busy -> cold transfer
+  cold_no_trunk  no SIP_OUTBOUND_TRUNK_ID -> cold transfer
+  failed         no answer and the REFER rejected -> the LLM offers a callback
+
+Usage (from bangla-voice-agent/):
+  python -m bench.sip_transfer --answer-ms 3000 --handoff-ms 2500 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import statistics
+import time
+
+from livekit import api
+
+from bench.livekit_api_stub import LiveKitAPIStub
+from config import pin_config, refresh_config
+from sip_transfer import SipTransfer
+
+ROOM = "bench-transfer"
+CALLER = "sip-caller"
+
+# Stand-in numbers by last digit: 0 answers, 7 busy, 8 no answer (bench/livekit_api_stub.py)
+CASES = {
+    "warm": ("+8809610000010", True),
+    "dial_after": ("+8809610000010", True),
+    "cold_no_answer": ("+8809610000018", True),
+    "cold_busy": ("+8809610000017", True),
+    "cold_no_trunk": ("+8809610000010", False),
+    "failed": ("sip:fail-8@pbx.example", True),
+}
+
+
+async def _measure(lkapi: api.LiveKitAPI, case: str, handoff: float) -> dict:
+    target, trunk = CASES[case]
+    pin_config(dataclasses.replace(refresh_config(), sip_outbound_trunk_id="ST_bench" if trunk else ""))
+    transfer = SipTransfer(lkapi, ROOM, CALLER)
+    if case == "dial_after":
+        await asyncio.sleep(handoff)
+        handoff_done = time.perf_counter()
+        result = await transfer.run("sales", target, handoff=asyncio.sleep(0))
+    else:
+        start = time.perf_counter()
+        result = await transfer.run("sales", target, handoff=asyncio.sleep(handoff))
+        handoff_done = start + handoff
+    return {"mode": result.mode, "wait_ms": (time.perf_counter() - handoff_done) * 1000}
+
+
+async def run(answer_ms: float, handoff_ms: float, runs: int) -> dict:
+    stub = LiveKitAPIStub(answer_ms=answer_ms)
+    url = stub.start()
+    lkapi = api.LiveKitAPI(url, "bench", "bench-secret-bench-secret-bench-secret")
+    report = {}
+    try:
+        for case in CASES:
+            results = [await _measure(lkapi, case, handoff_ms / 1000) for _ in range(runs)]
+            waits = [r["wait_ms"] for r in results]
+            report[case] = {
+                "mode": results[-1]["mode"],
+                "wait_ms": {"p50": round(statistics.median(waits), 1),
+                            "min": round(min(waits), 1), "max": round(max(waits), 1)},
+            }
+    finally:
+        await lkapi.aclose()
+        stub.stop()
+    report["stub_requests"] = dict(stub.stats)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--answer-ms", type=float, default=3000.0, help="ringing before the department answers")
+    parser.add_argument("--handoff-ms", type=float, default=2500.0, help="length of the spoken handoff line")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.answer_ms, args.handoff_ms, args.runs)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
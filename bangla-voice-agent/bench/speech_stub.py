@@ -0,0 +1,280 @@
+"""
+Speech server stub — the custom STT/TTS protocols without a model
+═══════════════════════════════════════════════════
+A localhost websocket server speaking the protocols of
+providers/custom_stt.py and providers/custom_tts.py, so
+STT_PROVIDER=custom / TTS_PROVIDER=custom can be run and measured
+without the self-hosted models:
+
+  STT  ws /stt   detects speech by energy; interims every 0.3 s of
+                 speech, the final transcript --final-delay-ms after
+                 endpointing (endpointing_ms of quiet, or "finalize")
+  TTS  ws /tts   a quiet tone for each text chunk: first audio
+                 --ttfb-ms after the first chunk, then generated at
+                 --rtf (seconds of work per second of audio) in 40 ms
+                 chunks; "cancel" stops generating at once
+
+Transcripts are the scripted caller lines, in turn. GET /stats returns
+connections, sessions/contexts, cancels and seconds of audio generated
+— sessions > connections means connections were reused.
+
+Usage (from bangla-voice-agent/):
+  python -m bench.speech_stub --final-delay-ms 150 --ttfb-ms 120
+  STT_PROVIDER=custom CUSTOM_STT_URL=ws://127.0.0.1:8001/stt \
+  TTS_PROVIDER=custom CUSTOM_TTS_URL=ws://127.0.0.1:8001/tts python agent.py dev
+
+In-process:
+  stub = SpeechStub()
+  url = stub.start()              # serves from a background thread
+  ...
+  stub.stats
+  stub.stop()
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import threading
+from collections import Counter
+
+import numpy as np
+from aiohttp import WSMsgType, web
+
+SCRIPT = [
+    "আসসালামু আলাইকুম, আমি একটা অ্যাপয়েন্টমেন্ট নিতে চাই",
+    "আমার নাম রহিম, নম্বর জিরো ওয়ান সেভেন ওয়ান টু",
+    "আগামীকাল বিকেলে কি সময় আছে",
+    "না, আর কিছু লাগবে না, ধন্যবাদ",
+]
+
+SPEECH_RMS = 500  # int16 RMS above this counts as speech
+INTERIM_INTERVAL = 0.3  # seconds of speech between interim transcripts
+
+TTS_SECONDS_PER_CHAR = 0.06  # ~Bangla speaking rate
+TTS_CHUNK_MS = 40
+TTS_TONE_HZ = 225  # whole cycles per 40 ms chunk — chunks join without clicks
+TTS_TONE_AMPLITUDE = 1000
+
+
+class _Recognition:
+    """One STT session: energy endpointing over the PCM it is sent."""
+
+    def __init__(self, ws: web.WebSocketResponse, start: dict, final_delay: float, turn: int) -> None:
+        self.ws = ws
+        self.sample_rate = int(start.get("sample_rate", 16000))
+        self.interim_results = bool(start.get("interim_results", True))
+        self.endpointing = float(start.get("endpointing_ms", 300)) / 1000
+        self.final_delay = final_delay
+        self.turn = turn
+        self.position = 0.0  # seconds of audio received
+        self.speech_start: float | None = None
+        self.speech = 0.0
+        self.quiet = 0.0
+        self.next_interim = INTERIM_INTERVAL
+
+    def _line(self) -> str:
+        return SCRIPT[self.turn % len(SCRIPT)]
+
+    async def audio(self, data: bytes) -> None:
+        pcm = np.frombuffer(data, dtype=np.int16)
+        duration = pcm.size / self.sample_rate
+        self.position += duration
+        talking = pcm.size and np.sqrt(np.mean(pcm.astype(np.float32) ** 2)) > SPEECH_RMS
+        if talking:
+            if self.speech_start is None:
+                self.speech_start = self.position - duration
+                await self.ws.send_json({"type": "speech_started"})
+            self.speech += duration
+            self.quiet = 0.0
+            if self.interim_results and self.speech >= self.next_interim:
+                self.next_interim += INTERIM_INTERVAL
+                words = self._line().split()
+                partial = " ".join(words[: max(1, int(self.speech / INTERIM_INTERVAL))])
+                await self.ws.send_json({"type": "interim", "text": partial, "confidence": 0.6})
+        elif self.speech_start is not None:
+            self.quiet += duration
+            if self.quiet >= self.endpointing:
+                await self.finalize()
+
+    async def finalize(self) -> None:
+        if self.speech_start is None:
+            return
+        await asyncio.sleep(self.final_delay)
+        await self.ws.send_json({
+            "type": "final",
+            "text": self._line(),
+            "confidence": 0.9,
+            "start": round(self.speech_start, 3),
+            "end": round(self.position - self.quiet, 3),
+        })
+        await self.ws.send_json({"type": "speech_ended"})
+        self.turn += 1
+        self.speech_start = None
+        self.speech = self.quiet = 0.0
+        self.next_interim = INTERIM_INTERVAL
+
+
+class _Synthesis:
+    """One TTS context: audio for each text chunk until flush or cancel."""
+
+    def __init__(self, ws: web.WebSocketResponse, start: dict, stats: Counter, ttfb: float, rtf: float) -> None:
+        self.ws = ws
+        self.context_id = start.get("context_id", "")
+        self.stats = stats
+        self.ttfb = ttfb
+        self.rtf = rtf
+        sample_rate = int(start.get("sample_rate", 24000))
+        t = np.arange(sample_rate * TTS_CHUNK_MS // 1000) / sample_rate
+        self.chunk = (np.sin(2 * np.pi * TTS_TONE_HZ * t) * TTS_TONE_AMPLITUDE).astype(np.int16).tobytes()
+        self.texts: asyncio.Queue[str | None] = asyncio.Queue()
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        first = True
+        while (text := await self.texts.get()) is not None:
+            if first:
+                await asyncio.sleep(self.ttfb)
+                first = False
+            chunks = max(1, round(len(text) * TTS_SECONDS_PER_CHAR * 1000 / TTS_CHUNK_MS))
+            for _ in range(chunks):
+                await asyncio.sleep(TTS_CHUNK_MS / 1000 * self.rtf)
+                await self.ws.send_bytes(self.chunk)
+                self.stats["tts.audio_seconds"] += TTS_CHUNK_MS / 1000
+        await self.ws.send_json({"type": "done", "context_id": self.context_id})
+
+    async def cancel(self) -> None:
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.stats["tts.cancelled"] += 1
+        await self.ws.send_json({"type": "done", "context_id": self.context_id})
+
+
+class SpeechStub:
+    def __init__(self, *, final_delay_ms: float = 100.0, ttfb_ms: float = 150.0, rtf: float = 0.3) -> None:
+        self.final_delay = final_delay_ms / 1000
+        self.ttfb = ttfb_ms / 1000
+        self.rtf = rtf
+        self.stats: Counter[str] = Counter()
+        self._turn = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+
+    async def _stt(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.stats["stt.connections"] += 1
+        session: _Recognition | None = None
+        async for msg in ws:
+            if msg.type == WSMsgType.BINARY:
+                if session is None:
+                    await ws.send_json({"type": "error", "message": "audio before start"})
+                    continue
+                await session.audio(msg.data)
+                continue
+            if msg.type != WSMsgType.TEXT:
+                continue
+            message = json.loads(msg.data)
+            kind = message.get("type")
+            if kind == "start":
+                self.stats["stt.sessions"] += 1
+                session = _Recognition(ws, message, self.final_delay, self._turn)
+            elif kind == "finalize" and session is not None:
+                await session.finalize()
+            elif kind == "end" and session is not None:
+                await session.finalize()
+                self._turn = session.turn
+                session = None
+                await ws.send_json({"type": "ended"})
+        return ws
+
+    async def _tts(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.stats["tts.connections"] += 1
+        context: _Synthesis | None = None
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            message = json.loads(msg.data)
+            kind = message.get("type")
+            if kind == "start":
+                self.stats["tts.contexts"] += 1
+                context = _Synthesis(ws, message, self.stats, self.ttfb, self.rtf)
+            elif context is None or message.get("context_id") != context.context_id:
+                await ws.send_json({"type": "error", "message": f"unknown context in {kind}"})
+            elif kind == "text":
+                context.texts.put_nowait(message.get("text", ""))
+            elif kind == "flush":
+                context.texts.put_nowait(None)
+            elif kind == "cancel":
+                await context.cancel()
+                context = None
+        if context is not None:
+            context.task.cancel()
+        return ws
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.stats))
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/stt", self._stt)
+        app.router.add_get("/tts", self._tts)
+        app.router.add_get("/stats", self._stats)
+        return app
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve from a background thread; returns the base URL (ws://)."""
+        ready = threading.Event()
+        url: list[str] = []
+
+        async def serve() -> None:
+            self._runner = web.AppRunner(self.app(), access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, host, port)
+            await site.start()
+            bound = site._server.sockets[0].getsockname()[1]
+            url.append(f"ws://{host}:{bound}")
+            ready.set()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(serve())
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="speech-stub", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return url[0]
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--final-delay-ms", type=float, default=100.0, help="endpoint -> final transcript")
+    parser.add_argument("--ttfb-ms", type=float, default=150.0, help="first text chunk -> first audio")
+    parser.add_argument("--rtf", type=float, default=0.3, help="seconds of work per second of audio")
+    args = parser.parse_args()
+
+    stub = SpeechStub(final_delay_ms=args.final_delay_ms, ttfb_ms=args.ttfb_ms, rtf=args.rtf)
+    print(f"Speech stub on ws://{args.host}:{args.port} — CUSTOM_STT_URL=.../stt, CUSTOM_TTS_URL=.../tts")
+    web.run_app(stub.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
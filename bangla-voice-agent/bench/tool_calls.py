@@ -0,0 +1,272 @@
+"""
+Tool-call benchmark — CRM and appointment tools against the Google emulator
+═══════════════════════════════════════════════════
+Calls each function tool the way the LLM does, against
+bench/google_emulator.py (in a child process, so its work doesn't show
+up as this loop's stalls) at several data sizes and concurrency levels,
+and records per call:
+  - wall_ms      time until the tool returns (median)
+  - round_trips  Sheets/Calendar API requests it made
+  - blocked_ms   time the event loop was stalled (> STALL_MS at a time)
+                 while it ran — audio for every call on the worker stops
+                 for that long
+
+Results are compared with bench/tool_baselines.jsonl. A case regresses
+when it makes more round trips than its baseline, or its wall or blocked
+time exceeds the baseline by more than --tolerance (plus 5 ms). Round
+trips don't depend on the machine; timings do, so refresh the baselines
+(--update) on the machine that checks them.
+
+Usage (from bangla-voice-agent/):
+  python -m bench.tool_calls                 # compare, exit 1 on regression
+  python -m bench.tool_calls --quick         # smallest size, concurrency 1
+  python -m bench.tool_calls --update        # write new baselines
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import itertools
+import json
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from bench.google_emulator import KNOWN_PHONE, EmulatorProcess
+from config import pin_config, refresh_config
+from tools.appointment import (
+    book_appointment,
+    cancel_appointment,
+    check_available_slots,
+    get_next_available,
+)
+from tools.crm import create_support_ticket, lookup_customer, register_customer
+
+BASELINE_FILE = Path(__file__).parent / "tool_baselines.jsonl"
+
+SHEET_ID = "bench-crm"
+CALENDAR_ID = "bench@group.calendar.google.com"
+
+# Data size: CRM rows for Sheets tools, busy slots per day (of 16) for Calendar tools
+CRM_SIZES = (1_000, 100_000)
+CALENDAR_SIZES = (4, 16)
+CONCURRENCY = (1, 8)
+
+STALL_MS = 5.0
+TICK = 0.001
+SLACK_MS = 5.0
+
+_ids = itertools.count()
+
+
+def _tomorrow() -> str:
+    return (date.today() + timedelta(days=1)).isoformat()
+
+
+# ═══════════════════════════════════════════════════════
+# CASES — how the LLM calls each tool
+# ═══════════════════════════════════════════════════════
+# Each case is awaited for any setup (not measured) and returns the call to measure
+async def _lookup_customer():
+    return lookup_customer(None, phone_number=KNOWN_PHONE)
+
+
+async def _register_customer():
+    return register_customer(None, customer_name="বেঞ্চ গ্রাহক", phone_number=f"019{next(_ids):08d}")
+
+
+async def _create_support_ticket():
+    return create_support_ticket(
+        None,
+        caller_name="রহিম",
+        phone_number=KNOWN_PHONE,
+        issue_description="ইন্টারনেট কাজ করছে না",
+        priority="high",
+    )
+
+
+async def _check_available_slots():
+    return check_available_slots(None, date=_tomorrow())
+
+
+async def _get_next_available():
+    return get_next_available(None)
+
+
+async def _book_appointment():
+    return book_appointment(
+        None,
+        caller_name=f"Bench Booking {next(_ids)}",
+        phone_number=KNOWN_PHONE,
+        date=_tomorrow(),
+        time="11:00 AM",
+        purpose="চেকআপ",
+    )
+
+
+async def _cancel_appointment():
+    name = f"Bench Cancel {next(_ids)}"
+    await book_appointment(None, caller_name=name, phone_number=KNOWN_PHONE,
+                           date=_tomorrow(), time="3:00 PM", purpose="চেকআপ")
+    return cancel_appointment(None, caller_name=name, date=_tomorrow())
+
+
+CRM_CASES = {
+    "lookup_customer": _lookup_customer,
+    "register_customer": _register_customer,
+    "create_support_ticket": _create_support_ticket,
+}
+CALENDAR_CASES = {
+    "check_available_slots": _check_available_slots,
+    "get_next_available": _get_next_available,
+    "book_appointment": _book_appointment,
+    "cancel_appointment": _cancel_appointment,
+}
+
+
+# ═══════════════════════════════════════════════════════
+# MEASUREMENT
+# ═══════════════════════════════════════════════════════
+class LoopStallMeter:
+    """Total time the event loop was stalled for more than STALL_MS at a time."""
+
+    def __init__(self) -> None:
+        self.blocked = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _tick(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            stall = time.perf_counter() - start - TICK
+            if stall * 1000 > STALL_MS:
+                self.blocked += stall
+
+    async def __aenter__(self) -> LoopStallMeter:
+        self._task = asyncio.create_task(self._tick())
+        await asyncio.sleep(0)  # first tick armed before the tools start
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await asyncio.sleep(TICK * 2)  # let the last stall be counted
+        self._task.cancel()
+
+
+async def _timed(coro) -> float:
+    start = time.perf_counter()
+    result = await coro
+    if isinstance(result, dict) and (result.get("error") or result.get("success") is False):
+        raise RuntimeError(f"tool failed: {result}")
+    return (time.perf_counter() - start) * 1000
+
+
+async def run_case(emulator: EmulatorProcess, make_call, concurrency: int, repeat: int) -> dict:
+    walls: list[float] = []
+    blocked = 0.0
+    round_trips = 0
+    for _ in range(repeat):
+        calls = [await make_call() for _ in range(concurrency)]
+        requests_before = emulator.requests()
+        async with LoopStallMeter() as meter:
+            walls.extend(await asyncio.gather(*(_timed(call) for call in calls)))
+        blocked += meter.blocked
+        round_trips += emulator.requests() - requests_before
+    calls_made = repeat * concurrency
+    return {
+        "wall_ms": round(statistics.median(walls), 1),
+        "round_trips": round(round_trips / calls_made, 2),
+        "blocked_ms": round(blocked * 1000 / calls_made, 1),
+    }
+
+
+async def run(quick: bool, repeat: int, latency_ms: float) -> list[dict]:
+    groups = [(CRM_CASES, CRM_SIZES, "rows"), (CALENDAR_CASES, CALENDAR_SIZES, "busy_per_day")]
+    concurrency_levels = CONCURRENCY[:1] if quick else CONCURRENCY
+    results = []
+    for cases, sizes, size_name in groups:
+        for size in sizes[:1] if quick else sizes:
+            emulator = EmulatorProcess(
+                rows=size if size_name == "rows" else 100,
+                events_per_day=size if size_name == "busy_per_day" else 0,
+                latency_ms=latency_ms,
+            )
+            url = emulator.start()
+            # The tools read config per call — point this benchmark's calls at the emulator
+            pin_config(dataclasses.replace(
+                refresh_config(),
+                google_api_emulator=url,
+                google_sheet_id=SHEET_ID,
+                google_calendar_id=CALENDAR_ID,
+                crm_prefetch_enabled=False,
+            ))
+            try:
+                for name, make_call in cases.items():
+                    for concurrency in concurrency_levels:
+                        result = await run_case(emulator, make_call, concurrency, repeat)
+                        case = f"{name}/{size_name}={size}/c={concurrency}"
+                        results.append({"case": case, **result})
+                        print(f"  {case:<48} {result}", file=sys.stderr)
+            finally:
+                emulator.stop()
+    return results
+
+
+# ═══════════════════════════════════════════════════════
+# BASELINES
+# ═══════════════════════════════════════════════════════
+def load_baselines() -> dict[str, dict]:
+    if not BASELINE_FILE.exists():
+        return {}
+    lines = BASELINE_FILE.read_text(encoding="utf-8").splitlines()
+    return {entry["case"]: entry for entry in map(json.loads, filter(None, lines))}
+
+
+def save_baselines(results: list[dict], latency_ms: float) -> None:
+    lines = [json.dumps(dict(r, latency_ms=latency_ms), ensure_ascii=False) for r in results]
+    BASELINE_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def regressions(results: list[dict], baselines: dict[str, dict], tolerance: float) -> list[str]:
+    found = []
+    for result in results:
+        base = baselines.get(result["case"])
+        if base is None:
+            continue
+        if result["round_trips"] > base["round_trips"]:
+            found.append(f"{result['case']}: round trips {base['round_trips']} -> {result['round_trips']}")
+        for key in ("wall_ms", "blocked_ms"):
+            if result[key] > base[key] * (1 + tolerance) + SLACK_MS:
+                found.append(f"{result['case']}: {key} {base[key]} -> {result[key]}")
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="smallest data size, concurrency 1")
+    parser.add_argument("--repeat", type=int, default=3, help="rounds per case")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="emulated API latency per request")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed timing slowdown vs. baseline")
+    parser.add_argument("--update", action="store_true", help=f"write {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.quick, args.repeat, args.latency_ms))
+    if args.update:
+        save_baselines(results, args.latency_ms)
+        print(f"Baselines written to {BASELINE_FILE}", file=sys.stderr)
+        return
+
+    baselines = load_baselines()
+    stale = {b.get("latency_ms") for b in baselines.values()} - {args.latency_ms}
+    if stale:
+        print(f"⚠️  Baselines were recorded with --latency-ms {stale}", file=sys.stderr)
+    found = regressions(results, baselines, args.tolerance)
+    print(json.dumps({"results": results, "regressions": found}, indent=2, ensure_ascii=False))
+    sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
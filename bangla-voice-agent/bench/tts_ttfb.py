@@ -0,0 +1,120 @@
+"""
+TTS time to first audio — custom vs. managed providers
+═══════════════════════════════════════════════════
+Feeds the same Bangla reply to each TTS provider the way the agent
+does — word by word at LLM speed into the stream get_tts returns,
+split by the Bangla sentence/clause tokenizer — and measures per run:
+  - ttfb_ms    first word in -> first audio out
+  - after_llm  last word in  -> first audio out (negative = audio
+               started while the LLM was still writing)
+  - total_ms   first word in -> last audio out
+
+Managed providers need their keys in .env. With --stub the custom
+provider is pointed at bench/speech_stub.py instead of CUSTOM_TTS_URL.
+
+Usage (from bangla-voice-agent/):
+  python -m bench.tts_ttfb --providers custom,google,elevenlabs --runs 5
+  python -m bench.tts_ttfb --providers custom --stub
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import statistics
+import time
+
+from livekit.agents import tts as tts_module
+from livekit.agents import utils
+
+from config import config, pin_config, refresh_config
+
+REPLY = (
+    "জি অবশ্যই, আমি দেখছি। আগামীকাল বিকেল চারটায় ডাক্তারের একটি সময় খালি আছে। "
+    "আপনি কি সেই সময়টা নিতে চান, নাকি অন্য কোনো দিন দেখব?"
+)
+
+
+async def _run_once(tts: tts_module.TTS, tokens_per_second: float) -> dict:
+    stream = tts.stream()
+    words = REPLY.split(" ")
+    marks: dict[str, float] = {}
+
+    async def feed() -> None:
+        marks["first_in"] = time.perf_counter()
+        for i, word in enumerate(words):
+            stream.push_text(word + (" " if i < len(words) - 1 else ""))
+            await asyncio.sleep(1 / tokens_per_second)
+        marks["last_in"] = time.perf_counter()
+        stream.end_input()
+
+    feeder = asyncio.create_task(feed())
+    async for _ in stream:
+        now = time.perf_counter()
+        marks.setdefault("first_out", now)
+        marks["last_out"] = now
+    await feeder
+    await stream.aclose()
+    return {
+        "ttfb_ms": (marks["first_out"] - marks["first_in"]) * 1000,
+        "after_llm_ms": (marks["first_out"] - marks["last_in"]) * 1000,
+        "total_ms": (marks["last_out"] - marks["first_in"]) * 1000,
+    }
+
+
+async def _measure(provider: str, runs: int, tokens_per_second: float) -> dict:
+    from providers.tts_factory import get_tts
+
+    tts = get_tts(provider)
+    results = []
+    try:
+        await _run_once(tts, tokens_per_second)  # connect / authenticate outside the measurement
+        for _ in range(runs):
+            results.append(await _run_once(tts, tokens_per_second))
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    finally:
+        await tts.aclose()
+    return {
+        key: {"p50": round(statistics.median(r[key] for r in results), 1),
+              "min": round(min(r[key] for r in results), 1),
+              "max": round(max(r[key] for r in results), 1)}
+        for key in results[0]
+    }
+
+
+async def run(providers: list[str], runs: int, tokens_per_second: float) -> dict:
+    utils.http_context._new_session_ctx()
+    try:
+        return {p: await _measure(p, runs, tokens_per_second) for p in providers}
+    finally:
+        await utils.http_context._close_http_ctx()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", default=f"custom,{config.tts_provider}")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--tokens-per-second", type=float, default=40.0, help="simulated LLM output rate")
+    parser.add_argument("--stub", action="store_true", help="serve the custom provider from bench/speech_stub.py")
+    args = parser.parse_args()
+
+    providers = list(dict.fromkeys(p.strip() for p in args.providers.split(",") if p.strip()))
+    stub = None
+    if args.stub:
+        from bench.speech_stub import SpeechStub
+
+        stub = SpeechStub()
+        pin_config(dataclasses.replace(refresh_config(), custom_tts_url=stub.start() + "/tts"))
+    try:
+        report = asyncio.run(run(providers, args.runs, args.tokens_per_second))
+    finally:
+        if stub is not None:
+            stub.stop()
+    print(json.dumps({"reply_chars": len(REPLY), "results": report}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
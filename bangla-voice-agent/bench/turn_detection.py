@@ -0,0 +1,205 @@
+"""
+End-of-turn benchmark — turn detector vs. VAD silence only
+═══════════════════════════════════════════════════
+Replays recorded Bangla utterances and reports, for each mode:
+  - end-of-turn delay: time from the caller's last word to the agent
+    deciding the turn is over
+  - false-cut rate: share of mid-utterance pauses (e.g. while dictating
+    a phone number) where the agent would have cut in
+
+Usage (from bangla-voice-agent/):
+  python agent.py download-files          # once — fetch the models
+  python -m bench.turn_detection --manifest recordings/manifest.jsonl
+
+Manifest: one JSON object per line
+  {"audio": "rahim_phone.wav",
+   "agent": "আপনার মোবাইল নম্বরটা বলুন।",         # optional: what the agent just asked
+   "segments": ["জিরো ওয়ান সেভেন", "এক দুই তিন", "চার পাঁচ ছয় সাত আট"]}
+"segments" is the transcript of each stretch of speech between pauses, in order.
+Audio paths are relative to the manifest. WAV, 16-bit mono, any sample rate.
+
+The decision rule mirrors AgentSession: after VAD end of speech, wait
+min_endpointing_delay, or max_endpointing_delay if the turn detector
+says the caller is unlikely to be done.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import wave
+from pathlib import Path
+
+from livekit import rtc
+from livekit.agents.vad import VADEventType
+from livekit.plugins import silero
+
+from config import config
+
+# VAD settings used by the agent (silero.VAD.load() defaults)
+VAD_MIN_SILENCE = 0.55
+# Fine-grained VAD pass to find every pause in the recording
+SEGMENT_MIN_SILENCE = 0.1
+
+
+def _read_wav(path: Path) -> list[rtc.AudioFrame]:
+    with wave.open(str(path), "rb") as wav:
+        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+            raise ValueError(f"{path}: expected 16-bit mono WAV")
+        rate = wav.getframerate()
+        samples_per_frame = rate // 100  # 10 ms
+        frames = []
+        while chunk := wav.readframes(samples_per_frame):
+            frames.append(
+                rtc.AudioFrame(
+                    data=chunk,
+                    sample_rate=rate,
+                    num_channels=1,
+                    samples_per_channel=len(chunk) // 2,
+                )
+            )
+    return frames
+
+
+async def _speech_segments(vad: silero.VAD, frames: list[rtc.AudioFrame]) -> list[tuple[float, float]]:
+    """(start, end) in seconds of each stretch of speech."""
+    stream = vad.stream()
+    for frame in frames:
+        stream.push_frame(frame)
+    stream.end_input()
+
+    segments = []
+    start = None
+    async for ev in stream:
+        if ev.type == VADEventType.START_OF_SPEECH:
+            start = ev.timestamp - ev.speech_duration
+        elif ev.type == VADEventType.END_OF_SPEECH and start is not None:
+            segments.append((start, ev.timestamp - ev.silence_duration))
+            start = None
+    await stream.aclose()
+    return segments
+
+
+class _TurnDetector:
+    """Runs the multilingual turn-detector model in-process."""
+
+    def __init__(self, language: str) -> None:
+        from livekit.plugins.turn_detector.base import _download_from_hf_hub
+        from livekit.plugins.turn_detector.models import HG_MODEL, MODEL_REVISIONS
+        from livekit.plugins.turn_detector.multilingual import _EUORunnerMultilingual
+
+        self._runner = _EUORunnerMultilingual()
+        self._runner.initialize()
+
+        languages_file = _download_from_hf_hub(
+            HG_MODEL,
+            "languages.json",
+            revision=MODEL_REVISIONS["multilingual"],
+            local_files_only=True,
+        )
+        with open(languages_file) as f:
+            languages = json.load(f)
+        lang = languages.get(language) or languages.get(language.split("-")[0])
+        self.threshold = lang["threshold"] if lang else None
+
+    def predict(self, agent_text: str | None, user_text: str) -> tuple[float, float]:
+        """Return (end-of-turn probability, inference seconds)."""
+        chat_ctx = []
+        if agent_text:
+            chat_ctx.append({"role": "assistant", "content": agent_text})
+        chat_ctx.append({"role": "user", "content": user_text})
+        start = time.perf_counter()
+        result = json.loads(self._runner.run(json.dumps({"chat_ctx": chat_ctx}).encode()))
+        return result["eou_probability"], time.perf_counter() - start
+
+
+def _decide(
+    detector: _TurnDetector | None,
+    agent_text: str | None,
+    user_text: str,
+    min_delay: float,
+    max_delay: float,
+) -> float:
+    """Seconds of silence after which the agent would end the turn."""
+    delay = min_delay
+    inference = 0.0
+    if detector is not None and detector.threshold is not None:
+        probability, inference = detector.predict(agent_text, user_text)
+        if probability < detector.threshold:
+            delay = max_delay
+    return max(VAD_MIN_SILENCE, delay) + inference
+
+
+async def run(manifest: Path, source: str) -> dict:
+    if source == "sip":
+        min_delay, max_delay = config.sip_min_endpointing_delay, config.sip_max_endpointing_delay
+    else:
+        min_delay, max_delay = config.dashboard_min_endpointing_delay, config.dashboard_max_endpointing_delay
+
+    vad = silero.VAD.load(min_silence_duration=SEGMENT_MIN_SILENCE)
+    detector = _TurnDetector(config.language)
+    if detector.threshold is None:
+        print(f"⚠️  Turn detector has no threshold for {config.language} — it will behave like VAD only")
+
+    results = {
+        mode: {"eot_delays": [], "pauses": 0, "false_cuts": 0}
+        for mode in ("vad_only", "turn_detector")
+    }
+
+    for line in manifest.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        frames = _read_wav(manifest.parent / item["audio"])
+        segments = await _speech_segments(vad, frames)
+        texts = item["segments"]
+        if len(segments) != len(texts):
+            print(f"⚠️  {item['audio']}: VAD found {len(segments)} segments, manifest has {len(texts)} — skipped")
+            continue
+
+        for mode, det in (("vad_only", None), ("turn_detector", detector)):
+            r = results[mode]
+            # Mid-utterance pauses: would the agent cut in?
+            for i in range(len(segments) - 1):
+                gap = segments[i + 1][0] - segments[i][1]
+                if gap < VAD_MIN_SILENCE:
+                    continue  # VAD doesn't even end speech here
+                r["pauses"] += 1
+                partial = " ".join(texts[: i + 1])
+                if gap >= _decide(det, item.get("agent"), partial, min_delay, max_delay):
+                    r["false_cuts"] += 1
+            # Real end of the utterance
+            r["eot_delays"].append(
+                _decide(det, item.get("agent"), " ".join(texts), min_delay, max_delay)
+            )
+
+    report = {"source": source, "min_delay": min_delay, "max_delay": max_delay}
+    for mode, r in results.items():
+        delays = sorted(r["eot_delays"])
+        report[mode] = {
+            "utterances": len(delays),
+            "eot_delay_mean": round(statistics.mean(delays), 3) if delays else None,
+            "eot_delay_p50": round(delays[len(delays) // 2], 3) if delays else None,
+            "eot_delay_p90": round(delays[int(len(delays) * 0.9)], 3) if delays else None,
+            "pauses": r["pauses"],
+            "false_cut_rate": round(r["false_cuts"] / r["pauses"], 3) if r["pauses"] else 0.0,
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--manifest", type=Path, required=True)
+    parser.add_argument("--source", choices=["sip", "dashboard"], default="sip",
+                        help="which endpointing delays to use (default: sip)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.manifest, args.source))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+VAD benchmark — per-session Silero vs. cross-session batching
+═══════════════════════════════════════════════════
+Runs N concurrent VAD streams in one process, each fed audio in real
+time (10 ms frames), and reports for each mode:
+  - CPU seconds used per second of call audio, per session
+  - sessions per core = 1 / that (VAD alone — an upper bound)
+  - event-loop lag (how late the 10 ms frame pushes ran)
+  - for batched mode: mean batch size
+
+Usage (from bangla-voice-agent/):
+  python -m bench.vad_batching --sessions 50 --seconds 20
+  python -m bench.vad_batching --sessions 50 --audio recordings/caller.wav
+
+Without --audio, each session gets synthetic speech-like bursts with pauses.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from livekit import rtc
+from livekit.plugins import silero
+
+from providers.batched_vad import BatchedVAD, get_batcher
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = SAMPLE_RATE // 100  # 10 ms
+
+
+def _synthetic_audio(seconds: float, seed: int) -> np.ndarray:
+    """Alternating ~1 s voiced bursts and ~0.6 s silence, int16."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    voiced = (np.sin(2 * np.pi * (120 + 30 * np.sin(2 * np.pi * 3 * t)) * t)
+              * (1 + 0.3 * rng.standard_normal(t.size)))
+    gate = ((t + rng.random()) % 1.6) < 1.0
+    return (voiced * gate * 8000).astype(np.int16)
+
+
+def _wav_audio(path: Path) -> np.ndarray:
+    with wave.open(str(path), "rb") as wav:
+        if wav.getsampwidth() != 2 or wav.getnchannels() != 1 or wav.getframerate() != SAMPLE_RATE:
+            raise ValueError(f"{path}: expected 16-bit mono 16 kHz WAV")
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+
+async def _session(vad: silero.VAD, audio: np.ndarray, lags: list[float]) -> None:
+    stream = vad.stream()
+
+    async def _drain() -> None:
+        async for _ in stream:
+            pass
+
+    drain = asyncio.create_task(_drain())
+    start = time.perf_counter()
+    for i in range(0, len(audio) - FRAME_SAMPLES + 1, FRAME_SAMPLES):
+        due = start + (i // FRAME_SAMPLES) * 0.01
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        lags.append(max(0.0, time.perf_counter() - due))
+        chunk = audio[i : i + FRAME_SAMPLES]
+        stream.push_frame(
+            rtc.AudioFrame(
+                data=chunk.tobytes(),
+                sample_rate=SAMPLE_RATE,
+                num_channels=1,
+                samples_per_channel=FRAME_SAMPLES,
+            )
+        )
+    stream.end_input()
+    await drain
+    await stream.aclose()
+
+
+async def _run_mode(vad: silero.VAD, sessions: int, seconds: float, audio: np.ndarray | None) -> dict:
+    clips = [
+        audio[: int(seconds * SAMPLE_RATE)] if audio is not None else _synthetic_audio(seconds, seed=i)
+        for i in range(sessions)
+    ]
+    lags: list[float] = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(_session(vad, clip, lags) for clip in clips))
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    audio_seconds = sum(len(c) for c in clips) / SAMPLE_RATE
+    cpu_per_audio_second = cpu / audio_seconds
+    lags.sort()
+    return {
+        "sessions": sessions,
+        "wall_seconds": round(wall, 2),
+        "cpu_seconds": round(cpu, 2),
+        "cpu_per_session_second": round(cpu_per_audio_second, 4),
+        "sessions_per_core": round(1 / cpu_per_audio_second, 1) if cpu_per_audio_second else None,
+        "loop_lag_p50_ms": round(statistics.median(lags) * 1000, 2),
+        "loop_lag_p99_ms": round(lags[int(len(lags) * 0.99)] * 1000, 2),
+    }
+
+
+async def run(sessions: int, seconds: float, audio_path: Path | None) -> dict:
+    audio = _wav_audio(audio_path) if audio_path else None
+    # In the worker each call has its own loop and executor; here they share
+    # one loop, so give it enough threads for every session's model call
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=sessions + 4))
+    report = {"per_session": await _run_mode(silero.VAD.load(), sessions, seconds, audio)}
+
+    batched = await _run_mode(BatchedVAD.load(), sessions, seconds, audio)
+    batcher = get_batcher(SAMPLE_RATE)
+    batched["mean_batch_size"] = round(batcher.mean_batch_size, 1)
+    report["batched"] = batched
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10.0, help="audio per session")
+    parser.add_argument("--audio", type=Path, help="16 kHz mono WAV fed to every session")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.sessions, args.seconds, args.audio))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
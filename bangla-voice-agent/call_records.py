@@ -0,0 +1,292 @@
+"""
+Call records — transcript, tool calls and summary of every call.
+
+CallRecorder follows one call's AgentSession events: every caller and
+agent message that goes into the chat history, every tool call with its
+arguments and result, and the reason end_call was given. When the call
+ends, call_summary.py adds a summary and the record is handed to
+submit(), which only puts it on an in-memory queue — nothing on the
+call's path waits for disk or network.
+
+A writer thread takes records off the queue in batches
+(CALL_RECORDS_BATCH records, or whatever arrived within
+CALL_RECORDS_FLUSH_INTERVAL seconds) and appends them to
+  CALL_RECORDS_DIR/calls-YYYYMMDD-<pid>.jsonl.gz   one JSON record per line
+(one file per process, so workers never interleave writes; each batch is
+a gzip member, read the file with gzip.open). CALL_RECORDS_EXPORT adds
+a copy of every record to:
+  sqlite   CALL_RECORDS_DIR/calls.sqlite3, table `calls`
+  sheets   a "Calls" worksheet in the tenant's GOOGLE_SHEET_ID
+
+drain() writes out everything queued. It runs when the worker process
+exits, and agent.py awaits it at the end of a call when the process ends
+with the call (one process per call).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+from livekit.agents import (
+    AgentSession,
+    CloseEvent,
+    ConversationItemAddedEvent,
+    FunctionToolsExecutedEvent,
+    llm,
+)
+
+from config import config, refresh_config
+
+logger = logging.getLogger("voice-agent.call-records")
+
+MAX_QUEUED = 1000  # records waiting for the writer; beyond this new ones are dropped
+DRAIN_TIMEOUT = 10.0  # seconds drain() waits for the writer
+SHEETS_WORKSHEET = "Calls"
+SHEETS_HEADERS = ["Call ID", "Started", "Ended", "Mode", "Caller", "End Reason", "Summary", "Transcript"]
+SHEETS_CELL_LIMIT = 45000  # Sheets rejects cells over 50,000 characters
+
+
+@dataclass
+class CallRecord:
+    call_id: str
+    room: str
+    source: str  # "sip" or "dashboard"
+    mode: str  # prompt mode, "<tenant>:<mode>" for tenant calls
+    started_at: float = field(default_factory=time.time)
+    ended_at: float = 0.0
+    caller: str = ""  # caller's number on SIP calls
+    transcript: list[dict] = field(default_factory=list)  # {"role", "text", "at", "interrupted"}
+    tool_calls: list[dict] = field(default_factory=list)  # {"name", "arguments", "output", "is_error", "at"}
+    end_reason: str = ""  # from end_call
+    summary: str = ""  # written after the call (call_summary.py)
+    close_reason: str = ""  # why the session closed
+    # Tenant's CRM sheet — for the Sheets export and call summaries written later
+    sheet_id: str = field(default="", repr=False)
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+class CallRecorder:
+    """Builds one call's CallRecord from its session events."""
+
+    def __init__(self, session: AgentSession, record: CallRecord) -> None:
+        self.record = record
+        self._finished = False
+        session.on("conversation_item_added", self._on_item)
+        session.on("function_tools_executed", self._on_tools)
+        session.on("close", self._on_close)
+
+    def _on_item(self, ev: ConversationItemAddedEvent) -> None:
+        item = ev.item
+        if isinstance(item, llm.ChatMessage) and item.role in ("user", "assistant") and item.text_content:
+            self.record.transcript.append({
+                "role": item.role,
+                "text": item.text_content,
+                "at": round(item.created_at, 3),
+                "interrupted": item.interrupted,
+            })
+
+    def _on_tools(self, ev: FunctionToolsExecutedEvent) -> None:
+        for call, output in ev.zipped():
+            try:
+                arguments = json.loads(call.arguments or "{}")
+            except json.JSONDecodeError:
+                arguments = call.arguments
+            self.record.tool_calls.append({
+                "name": call.name,
+                "arguments": arguments,
+                "output": output.output if output else None,
+                "is_error": output.is_error if output else False,
+                "at": round(call.created_at, 3),
+            })
+            if call.name == "end_call" and isinstance(arguments, dict):
+                self.record.end_reason = str(arguments.get("reason", ""))
+
+    def _on_close(self, ev: CloseEvent) -> None:
+        self.record.close_reason = ev.reason.value
+
+    def finish(self) -> CallRecord | None:
+        """The finished record, once — None if it was already taken. Pass it to submit()."""
+        if self._finished:
+            return None
+        self._finished = True
+        self.record.ended_at = time.time()
+        return self.record
+
+
+# ═══════════════════════════════════════════════════════
+# QUEUE + WRITER THREAD
+# ═══════════════════════════════════════════════════════
+_queue: queue.Queue[CallRecord | threading.Event] = queue.Queue(maxsize=MAX_QUEUED)
+_writer_lock = threading.Lock()
+_writer: threading.Thread | None = None
+
+
+def submit(record: CallRecord) -> None:
+    """Queue a finished call's record for the writer thread. Never blocks."""
+    if not config.call_records_enabled:
+        return
+    _ensure_writer()
+    try:
+        _queue.put_nowait(record)
+    except queue.Full:
+        logger.warning(f"⚠️  Call record queue full — dropped the record of {record.call_id}")
+
+
+def _drain_sync(timeout: float = DRAIN_TIMEOUT) -> bool:
+    if _writer is None:
+        return True
+    done = threading.Event()
+    try:
+        _queue.put(done, timeout=timeout)
+    except queue.Full:
+        return False
+    return done.wait(timeout)
+
+
+async def drain(timeout: float = DRAIN_TIMEOUT) -> None:
+    """Wait (off the event loop) until every queued record is written."""
+    if not await asyncio.to_thread(_drain_sync, timeout):
+        logger.warning(f"⚠️  Call records not written within {timeout:.0f}s")
+
+
+def _ensure_writer() -> None:
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_run_writer, name="call-records", daemon=True)
+            _writer.start()
+            atexit.register(_drain_sync)
+
+
+def _run_writer() -> None:
+    batch: list[CallRecord] = []
+    deadline = 0.0
+    while True:
+        settings = refresh_config()
+        timeout = max(0.0, deadline - time.monotonic()) if batch else None
+        try:
+            item = _queue.get(timeout=timeout)
+        except queue.Empty:
+            item = None
+
+        if isinstance(item, CallRecord):
+            if not batch:
+                deadline = time.monotonic() + settings.call_records_flush_interval
+            batch.append(item)
+            if len(batch) < settings.call_records_batch and time.monotonic() < deadline:
+                continue
+        # Batch full, flush interval over, or a drain() waiting
+        if batch:
+            _write_batch(batch, settings)
+            batch = []
+        if isinstance(item, threading.Event):
+            item.set()
+
+
+def _write_batch(batch: list[CallRecord], settings) -> None:
+    start = time.perf_counter()
+    try:
+        _write_jsonl(batch, settings.call_records_dir)
+    except Exception as e:
+        logger.error(f"❌ Could not write {len(batch)} call record(s): {e}")
+        return
+
+    export = settings.call_records_export.lower()
+    try:
+        if export == "sqlite":
+            _export_sqlite(batch, settings.call_records_dir)
+        elif export == "sheets":
+            _export_sheets(batch)
+    except Exception as e:
+        logger.warning(f"⚠️  Call record {export} export failed: {e}")
+    logger.info(
+        f"🗂️  Wrote {len(batch)} call record(s){f' (+{export})' if export else ''} "
+        f"in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+
+
+# ═══════════════════════════════════════════════════════
+# STORAGE
+# ═══════════════════════════════════════════════════════
+def _write_jsonl(batch: list[CallRecord], directory: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"calls-{datetime.now():%Y%m%d}-{os.getpid()}.jsonl.gz")
+    lines = "".join(json.dumps(record.to_json(), ensure_ascii=False) + "\n" for record in batch)
+    with gzip.open(path, "ab") as f:
+        f.write(lines.encode("utf-8"))
+
+
+def _export_sqlite(batch: list[CallRecord], directory: str) -> None:
+    with sqlite3.connect(os.path.join(directory, "calls.sqlite3"), timeout=10) as db:
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS calls ("
+            "call_id TEXT PRIMARY KEY, room TEXT, source TEXT, mode TEXT, "
+            "started_at REAL, ended_at REAL, caller TEXT, end_reason TEXT, summary TEXT, "
+            "close_reason TEXT, transcript TEXT, tool_calls TEXT)"
+        )
+        db.executemany(
+            "INSERT OR REPLACE INTO calls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    r.call_id, r.room, r.source, r.mode, r.started_at, r.ended_at, r.caller,
+                    r.end_reason, r.summary, r.close_reason,
+                    json.dumps(r.transcript, ensure_ascii=False),
+                    json.dumps(r.tool_calls, ensure_ascii=False),
+                )
+                for r in batch
+            ],
+        )
+
+
+def _transcript_text(record: CallRecord) -> str:
+    lines = "\n".join(
+        f"{'Caller' if turn['role'] == 'user' else 'Agent'}: {turn['text']}" for turn in record.transcript
+    )
+    return lines[:SHEETS_CELL_LIMIT]
+
+
+def _export_sheets(batch: list[CallRecord]) -> None:
+    import gspread
+
+    from tools.crm import _sheets_client
+
+    by_sheet: dict[str, list[CallRecord]] = {}
+    for record in batch:
+        if record.sheet_id:
+            by_sheet.setdefault(record.sheet_id, []).append(record)
+
+    client = _sheets_client()
+    for sheet_id, records in by_sheet.items():
+        spreadsheet = client.open_by_key(sheet_id)
+        try:
+            worksheet = spreadsheet.worksheet(SHEETS_WORKSHEET)
+        except gspread.WorksheetNotFound:
+            worksheet = spreadsheet.add_worksheet(SHEETS_WORKSHEET, rows=1000, cols=len(SHEETS_HEADERS))
+            worksheet.append_row(SHEETS_HEADERS)
+        worksheet.append_rows(
+            [
+                [
+                    r.call_id,
+                    datetime.fromtimestamp(r.started_at).isoformat(timespec="seconds"),
+                    datetime.fromtimestamp(r.ended_at).isoformat(timespec="seconds"),
+                    r.mode, r.caller, r.end_reason, r.summary, _transcript_text(r),
+                ]
+                for r in records
+            ],
+            value_input_option="RAW",
+        )
@@ -0,0 +1,168 @@
+"""
+Call summaries — written after the call from its recorded transcript.
+
+end_call and escalate_to_human used to take a summary argument, so the
+LLM wrote a paragraph of output tokens while the caller waited for the
+goodbye. Now the tools take only what they act on and the summary is
+produced once the call is over:
+
+  - at hang-up, agent.py summarizes the call with the call's own LLM
+    (bounded by CALL_SUMMARY_TIMEOUT — the worker's shutdown window is
+    short) before the record goes to call_records' writer
+  - calls that missed that window (timeout, LLM error, worker killed)
+    are summarized later in batch from the saved records:
+
+      python -m call_summary call_records/calls-*.jsonl.gz
+
+The summary is stored in the call record and appended to the caller's
+Notes in the tenant's CRM sheet (tools/crm.py), next to what the agent
+saved during the call. The batch run queues the updated records again;
+a later record replaces an earlier one with the same call_id.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import gzip
+import json
+import logging
+from datetime import datetime
+
+from livekit.agents import llm, utils
+
+from call_records import CallRecord
+from config import config, pin_config, refresh_config
+
+logger = logging.getLogger("voice-agent.call-summary")
+
+SUMMARY_INSTRUCTIONS = (
+    "You write the CRM notes for a finished phone call between a caller and "
+    "the agent Nusrat. Summarize what the caller wanted, what was done "
+    "(ticket, appointment, order or transfer, with IDs, dates and amounts) "
+    "and anything still pending. At most 4 short sentences. "
+    "Write in the language of the conversation. Output only the summary."
+)
+MAX_TOOL_OUTPUT_CHARS = 400  # tool results are clipped in the summarizer's input
+
+
+def _conversation(record: CallRecord) -> str:
+    """Transcript and tool calls of the call, in order, one line each."""
+    lines = [
+        (turn["at"], f"{'caller' if turn['role'] == 'user' else 'agent'}: {turn['text']}")
+        for turn in record.transcript
+    ]
+    for call in record.tool_calls:
+        output = str(call["output"] or "")[:MAX_TOOL_OUTPUT_CHARS]
+        lines.append((call["at"], f"tool {call['name']}({json.dumps(call['arguments'], ensure_ascii=False)}) -> {output}"))
+    return "\n".join(line for _, line in sorted(lines, key=lambda line: line[0]))
+
+
+def customer_phone(record: CallRecord) -> str:
+    """The number the CRM knows the caller by: the last one a tool used, else the caller ID."""
+    for call in reversed(record.tool_calls):
+        if isinstance(call["arguments"], dict) and call["arguments"].get("phone_number"):
+            return str(call["arguments"]["phone_number"])
+    return record.caller
+
+
+async def summarize(record: CallRecord, summary_llm: llm.LLM) -> str:
+    """Write the call's summary into record.summary and return it."""
+    if not record.transcript:
+        return ""
+    ctx = llm.ChatContext.empty()
+    ctx.add_message(role="system", content=SUMMARY_INSTRUCTIONS)
+    ctx.add_message(role="user", content=_conversation(record))
+
+    parts = []
+    async with summary_llm.chat(chat_ctx=ctx) as stream:
+        async for chunk in stream:
+            if chunk.delta and chunk.delta.content:
+                parts.append(chunk.delta.content)
+    record.summary = "".join(parts).strip()
+    return record.summary
+
+
+async def store_in_crm(record: CallRecord) -> None:
+    """Append the summary to the caller's Notes in the CRM sheet, if there is one."""
+    from tools.crm import append_customer_notes, sheets_configured
+
+    phone = customer_phone(record)
+    if not (record.summary and phone and sheets_configured()):
+        return
+
+    when = datetime.fromtimestamp(record.started_at).strftime("%Y-%m-%d")
+    result = await asyncio.to_thread(append_customer_notes, phone, f"কল সারাংশ {when}: {record.summary}")
+    if not result.get("success"):
+        logger.warning(f"⚠️  Call summary not saved to CRM for {record.call_id}: {result.get('message')}")
+
+
+async def summarize_call(record: CallRecord, summary_llm: llm.LLM) -> None:
+    """At hang-up: summarize and store, within CALL_SUMMARY_TIMEOUT. Never raises."""
+    if not config.call_summary_enabled:
+        return
+
+    async def _summarize_and_store() -> None:
+        await summarize(record, summary_llm)
+        await store_in_crm(record)
+
+    try:
+        await asyncio.wait_for(_summarize_and_store(), config.call_summary_timeout)
+    except Exception as e:  # TimeoutError included — the batch run picks the call up
+        logger.warning(f"⚠️  Call summary of {record.call_id} not written: {type(e).__name__} {e}")
+        return
+    if record.summary:
+        logger.info(f"📋 Call summary ({len(record.summary)} chars) saved for {record.call_id}")
+
+
+# ═══════════════════════════════════════════════════════
+# BATCH — calls saved without a summary
+# ═══════════════════════════════════════════════════════
+def _unsummarized(paths: list[str]) -> list[CallRecord]:
+    records: dict[str, CallRecord] = {}
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = CallRecord(**json.loads(line))
+                records[record.call_id] = record  # a later record replaces an earlier one
+    return [r for r in records.values() if not r.summary and r.transcript]
+
+
+async def run(paths: list[str]) -> dict:
+    import call_records
+    from providers.llm_factory import get_llm
+
+    records = _unsummarized(paths)
+    utils.http_context._new_session_ctx()
+    summary_llm = get_llm()
+    done, failed = 0, 0
+    try:
+        for record in records:
+            # The call's CRM is the tenant's sheet the record was made with
+            pin_config(dataclasses.replace(refresh_config(), google_sheet_id=record.sheet_id))
+            try:
+                await summarize(record, summary_llm)
+                await store_in_crm(record)
+            except Exception as e:
+                logger.warning(f"⚠️  Call summary of {record.call_id} failed: {e}")
+                failed += 1
+                continue
+            call_records.submit(record)
+            done += 1
+    finally:
+        await utils.http_context._close_http_ctx()
+    await call_records.drain()
+    return {"unsummarized": len(records), "summarized": done, "failed": failed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="call record files (calls-*.jsonl.gz)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(asyncio.run(run(args.paths)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
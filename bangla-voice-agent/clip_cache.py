@@ -0,0 +1,168 @@
+"""
+Pre-decoded background audio clips shared by every call.
+
+BackgroundAudioPlayer normally decodes the ambience/typing OGG files
+again for every call (and for every thinking sound), then scales each
+frame by the volume in real time.
+
+Here each (clip, volume, sample rate) is decoded and volume-scaled once
+per machine:
+  - the PCM is written to CLIP_CACHE_DIR and memory-mapped read-only, so
+    every worker process — one per call with the default executor —
+    reads the same page-cache pages instead of holding its own copy
+  - playback slices 20 ms frames off the mapping as the mixer pulls them;
+    rtc.AudioFrame copies a slice, so a call's private memory is the few
+    frames in flight, not the clip
+
+CachedClip is passed to AudioConfig as the source with volume=1.0.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import mmap
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from livekit import rtc
+from livekit.agents import BuiltinAudioClip
+from livekit.agents.utils.audio import audio_frames_from_file
+
+logger = logging.getLogger("voice-agent.audio")
+
+# BackgroundAudioPlayer mixes at 48 kHz mono
+MIXER_SAMPLE_RATE = 48000
+FRAME_MS = 20
+
+CLIP_CACHE_DIR = Path(os.getenv("CLIP_CACHE_DIR", Path(tempfile.gettempdir()) / "bangla-voice-clips"))
+
+# ═══════════════════════════════════════════════════════
+# BACKGROUND AUDIO CLIPS (from LiveKit built-in library)
+# ═══════════════════════════════════════════════════════
+AUDIO_CLIPS = {
+    "office": BuiltinAudioClip.OFFICE_AMBIENCE,
+    "city": BuiltinAudioClip.CITY_AMBIENCE,
+    "forest": BuiltinAudioClip.FOREST_AMBIENCE,
+    "crowd": BuiltinAudioClip.CROWDED_ROOM,
+    "typing": BuiltinAudioClip.KEYBOARD_TYPING,
+    "typing2": BuiltinAudioClip.KEYBOARD_TYPING2,
+    "hold_music": BuiltinAudioClip.HOLD_MUSIC,
+}
+
+
+class CachedClip:
+    """Replayable frame source: every `async for` starts a new playback.
+
+    The player accepts an AsyncIterator; this one hands out a fresh
+    generator per playback so the same clip can be played again
+    (thinking sound) or forever (ambience, loop=True).
+    """
+
+    def __init__(self, pcm: mmap.mmap | bytes, sample_rate: int, *, loop: bool) -> None:
+        self._pcm = pcm
+        self._sample_rate = sample_rate
+        self._loop = loop
+
+    def __aiter__(self):
+        return self._play()
+
+    async def __anext__(self) -> rtc.AudioFrame:
+        # Playback always goes through __aiter__
+        raise StopAsyncIteration
+
+    async def _play(self):
+        samples = self._sample_rate * FRAME_MS // 1000
+        step = samples * 2
+        view = memoryview(self._pcm)
+        while True:
+            for i in range(0, len(view) - step + 1, step):
+                yield rtc.AudioFrame(
+                    data=view[i : i + step],
+                    sample_rate=self._sample_rate,
+                    num_channels=1,
+                    samples_per_channel=samples,
+                )
+            if not self._loop:
+                return
+
+
+# Mapped cache files (shared page cache); bytes only if the file couldn't be written
+_pcm: dict[tuple[str, float, int], mmap.mmap | bytes] = {}
+
+
+def _cache_file(path: str, volume: float, sample_rate: int) -> Path:
+    return CLIP_CACHE_DIR / f"{Path(path).stem}-{sample_rate}-v{volume:.3f}.pcm"
+
+
+async def _decode(path: str, volume: float, sample_rate: int) -> bytes:
+    chunks = [
+        np.frombuffer(frame.data, dtype=np.int16)
+        async for frame in audio_frames_from_file(path, sample_rate=sample_rate, num_channels=1)
+    ]
+    pcm = np.concatenate(chunks).astype(np.float32) if chunks else np.zeros(0, np.float32)
+    if volume != 1.0:
+        pcm *= volume
+    return np.clip(pcm, -32768, 32767).astype(np.int16).tobytes()
+
+
+def _map_pcm_file(cache_file: Path) -> mmap.mmap | None:
+    try:
+        with open(cache_file, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # missing, or empty (ValueError)
+        return None
+
+
+def _store_pcm_file(cache_file: Path, pcm: bytes) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pcm)
+        os.replace(tmp, cache_file)  # atomic — concurrent workers never see half a file
+    except OSError as e:
+        logger.warning(f"⚠️  Could not write clip cache {cache_file}: {e}")
+
+
+async def load_clip(
+    clip: BuiltinAudioClip | str,
+    *,
+    volume: float = 1.0,
+    loop: bool = False,
+    sample_rate: int = MIXER_SAMPLE_RATE,
+) -> CachedClip:
+    """Decoded, volume-scaled clip — decoded at most once per machine."""
+    path = clip.path() if isinstance(clip, BuiltinAudioClip) else clip
+    key = (path, round(volume, 3), sample_rate)
+
+    if key not in _pcm:
+        start = time.perf_counter()
+        cache_file = _cache_file(*key)
+        pcm = await asyncio.to_thread(_map_pcm_file, cache_file)
+        source = "disk cache"
+        if pcm is None:
+            decoded = await _decode(path, volume, sample_rate)
+            await asyncio.to_thread(_store_pcm_file, cache_file, decoded)
+            pcm = await asyncio.to_thread(_map_pcm_file, cache_file) or decoded
+            source = "decoded"
+        _pcm[key] = pcm
+        logger.info(
+            f"🎵 Clip {Path(path).name} @ {volume} ({source}, "
+            f"{'mapped' if isinstance(pcm, mmap.mmap) else 'in memory'}): "
+            f"{len(pcm) / 1024:.0f} KiB in {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+
+    return CachedClip(_pcm[key], sample_rate, loop=loop)
+
+
+def cache_report() -> dict:
+    """Clips loaded in this process: mapped bytes are shared page cache, private bytes are this process's own."""
+    mapped = sum(len(pcm) for pcm in _pcm.values() if isinstance(pcm, mmap.mmap))
+    return {
+        "clips": len(_pcm),
+        "mapped_bytes": mapped,
+        "private_bytes": sum(len(pcm) for pcm in _pcm.values()) - mapped,
+    }
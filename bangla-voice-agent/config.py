@@ -1,13 +1,36 @@
 """
 Central configuration for the Bangla Voice Agent.
 Reads .env and exposes typed config for all providers.
+
+Editing .env does not need a restart: every new call first calls
+refresh_config(), which rebuilds Config if the file changed, and pins
+that snapshot for the whole call. Active calls keep the snapshot they
+started with. Worker-level settings read at startup (VAD_BATCHING,
+PROMETHEUS_PORT, PROMETHEUS_MULTIPROC_DIR) still need a restart.
 """
 
+import importlib.util
+import logging
 import os
-from dataclasses import dataclass, field
-from dotenv import load_dotenv
+import tempfile
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from dotenv import dotenv_values, find_dotenv, load_dotenv
+
+logger = logging.getLogger("voice-agent.config")
+
+ENV_FILE = find_dotenv()
+# Real environment variables win over .env, on reload too
+_PROCESS_ENV = frozenset(os.environ)
 
-load_dotenv()
+load_dotenv(ENV_FILE)
+
+
+def _parse_targets(value: str) -> dict[str, str]:
+    """TRANSFER_TARGETS as a dict: "sales=+880...,support=sip:..." -> {"sales": ..., "support": ...}"""
+    pairs = (item.split("=", 1) for item in value.split(",") if "=" in item)
+    return {department.strip().lower(): target.strip() for department, target in pairs if target.strip()}
 
 
 @dataclass
@@ -22,6 +45,10 @@ class Config:
     # Language & mode
     language: str = os.getenv("LANGUAGE", "bn-BD")
     agent_mode: str = os.getenv("AGENT_MODE", "receptionist")
+    company_name: str = os.getenv("COMPANY_NAME", "আমাদের কোম্পানি")
+
+    # Several businesses on one deployment, matched by dialed number (tenants.py)
+    tenants_file: str = os.getenv("TENANTS_FILE", "tenants.toml")
 
     # ══════════════════════════════════════
     # Google / Gemini
@@ -33,14 +60,95 @@ class Config:
     # Google Sheets CRM
     google_sheet_id: str = os.getenv("GOOGLE_SHEET_ID", "")
 
+    # Start CRM lookups as soon as the caller says their number (tools/crm.py)
+    crm_prefetch_enabled: bool = os.getenv("CRM_PREFETCH_ENABLED", "true").lower() == "true"
+
     # Google Calendar
     google_calendar_id: str = os.getenv("GOOGLE_CALENDAR_ID", "")
 
+    # Send Sheets/Calendar calls to a local emulator instead of Google
+    # (bench/google_emulator.py), e.g. http://127.0.0.1:8765 — no credentials needed
+    google_api_emulator: str = os.getenv("GOOGLE_API_EMULATOR", "")
+
     # Google Cloud TTS voice options
     google_tts_voice: str = os.getenv("GOOGLE_TTS_VOICE", "bn-IN-Chirp3-HD-Kore")
     google_tts_speaking_rate: float = float(os.getenv("GOOGLE_TTS_SPEAKING_RATE", "1.0"))
     google_tts_pitch: float = float(os.getenv("GOOGLE_TTS_PITCH", "0.0"))
 
+    # Provider-side prompt caching (Anthropic cache_control, OpenAI prompt_cache_key)
+    llm_prompt_caching: bool = os.getenv("LLM_PROMPT_CACHING", "true").lower() == "true"
+
+    # Semantic end-of-turn detection (multilingual turn-detector model)
+    # Endpointing delays are tuned per call source: phone callers pause more
+    # (dictating numbers over a noisy line), so SIP waits longer before cutting in.
+    turn_detection_enabled: bool = os.getenv("TURN_DETECTION_ENABLED", "true").lower() == "true"
+    sip_min_endpointing_delay: float = float(os.getenv("SIP_MIN_ENDPOINTING_DELAY", "0.6"))
+    sip_max_endpointing_delay: float = float(os.getenv("SIP_MAX_ENDPOINTING_DELAY", "4.0"))
+    dashboard_min_endpointing_delay: float = float(os.getenv("DASHBOARD_MIN_ENDPOINTING_DELAY", "0.4"))
+    dashboard_max_endpointing_delay: float = float(os.getenv("DASHBOARD_MAX_ENDPOINTING_DELAY", "3.0"))
+
+    # Start the LLM on stable interim transcripts (opt-in, see providers/preemptive_stt.py)
+    preemptive_generation: bool = os.getenv("PREEMPTIVE_GENERATION", "false").lower() == "true"
+    preemptive_stable_window: float = float(os.getenv("PREEMPTIVE_STABLE_WINDOW", "0.3"))
+
+    # Rolling chat-context compaction for long calls (see context_compactor.py)
+    context_compaction_enabled: bool = os.getenv("CONTEXT_COMPACTION_ENABLED", "true").lower() == "true"
+    context_keep_turns: int = int(os.getenv("CONTEXT_KEEP_TURNS", "6"))
+    context_token_budget: int = int(os.getenv("CONTEXT_TOKEN_BUDGET", "3000"))
+
+    # Keep SIP calls at their native narrowband rate end to end (see providers/audio_profile.py)
+    telephony_audio: bool = os.getenv("TELEPHONY_AUDIO", "true").lower() == "true"
+    telephony_sample_rate: int = int(os.getenv("TELEPHONY_SAMPLE_RATE", "8000"))
+
+    # Worker admission (see worker_load.py): the worker stops taking calls when any limit is hit
+    max_sessions_per_worker: int = int(os.getenv("MAX_SESSIONS_PER_WORKER", "25"))  # 0 = no cap
+    max_loop_lag_ms: float = float(os.getenv("MAX_LOOP_LAG_MS", "100"))
+    max_worker_cpu: float = float(os.getenv("MAX_WORKER_CPU", "0.8"))
+    prometheus_port: int = int(os.getenv("PROMETHEUS_PORT", "0"))  # 0 = no metrics endpoint
+    # Job processes write their voice_agent_* metrics here; the worker serves the sum (see stats.py)
+    prometheus_multiproc_dir: str = os.getenv(
+        "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "bangla-voice-metrics")
+    )
+
+    # Warm-up at worker prewarm and while idle (see warmup.py): Google tokens
+    # and a tiny priming request to self-hosted (custom) STT/LLM/TTS
+    warmup_enabled: bool = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    keep_warm_interval: float = float(os.getenv("KEEP_WARM_INTERVAL", "240"))  # seconds, 0 = prewarm only
+    warmup_timeout: float = float(os.getenv("WARMUP_TIMEOUT", "10"))  # per target
+
+    # Call records (see call_records.py): transcript, tool calls and summary of every
+    # call, written in batches by a background thread, never on the call's path
+    call_records_enabled: bool = os.getenv("CALL_RECORDS_ENABLED", "true").lower() == "true"
+    call_records_dir: str = os.getenv("CALL_RECORDS_DIR", "call_records")
+    call_records_export: str = os.getenv("CALL_RECORDS_EXPORT", "")  # "", "sqlite" or "sheets"
+    call_records_batch: int = int(os.getenv("CALL_RECORDS_BATCH", "20"))
+    call_records_flush_interval: float = float(os.getenv("CALL_RECORDS_FLUSH_INTERVAL", "5"))  # seconds
+
+    # Hang up once end_call's goodbye has played out (see hangup.py): close the
+    # STT/TTS/VAD streams, stop background audio, delete the room and end the job
+    hangup_on_end_call: bool = os.getenv("HANGUP_ON_END_CALL", "true").lower() == "true"
+
+    # SIP transfers (see sip_transfer.py). TRANSFER_TARGETS maps departments to a phone
+    # number or SIP URI: "sales=+8809610000010,support=sip:support@pbx.example.com".
+    # Warm transfers pre-dial through SIP_OUTBOUND_TRUNK_ID; without it, transfers are cold.
+    transfer_targets: dict[str, str] = field(
+        default_factory=lambda: _parse_targets(os.getenv("TRANSFER_TARGETS", ""))
+    )
+    escalation_department: str = os.getenv("ESCALATION_DEPARTMENT", "support")  # escalate_to_human
+    sip_outbound_trunk_id: str = os.getenv("SIP_OUTBOUND_TRUNK_ID", "")
+    transfer_ring_timeout: float = float(os.getenv("TRANSFER_RING_TIMEOUT", "20"))  # seconds
+
+    # Call summary written at hang-up from the transcript (see call_summary.py) and
+    # appended to the caller's CRM notes; calls that miss the timeout are left to the batch run
+    call_summary_enabled: bool = os.getenv("CALL_SUMMARY_ENABLED", "true").lower() == "true"
+    call_summary_timeout: float = float(os.getenv("CALL_SUMMARY_TIMEOUT", "6"))  # seconds
+
+    # Batch Silero VAD across all calls in a worker (opt-in, see providers/batched_vad.py).
+    # Runs jobs as threads in one process instead of one process per call.
+    vad_batching: bool = os.getenv("VAD_BATCHING", "false").lower() == "true"
+    vad_batch_window_ms: float = float(os.getenv("VAD_BATCH_WINDOW_MS", "4"))
+    vad_batch_max: int = int(os.getenv("VAD_BATCH_MAX", "64"))
+
     # ══════════════════════════════════════
     # OpenAI
     # ══════════════════════════════════════
@@ -99,11 +207,28 @@ class Config:
     # Custom OpenAI-compatible endpoints
     # ══════════════════════════════════════
     custom_stt_url: str = os.getenv("CUSTOM_STT_URL", "http://localhost:8001/stt")
+    custom_stt_endpointing_ms: int = int(os.getenv("CUSTOM_STT_ENDPOINTING_MS", "300"))  # server-side silence
     custom_tts_url: str = os.getenv("CUSTOM_TTS_URL", "http://localhost:8002/tts")
+    custom_tts_voice: str = os.getenv("CUSTOM_TTS_VOICE", "")  # empty = server default
+    custom_tts_sample_rate: int = int(os.getenv("CUSTOM_TTS_SAMPLE_RATE", "24000"))
     custom_llm_url: str = os.getenv("CUSTOM_LLM_URL", "http://localhost:8003/v1")
     custom_llm_model: str = os.getenv("CUSTOM_LLM_MODEL", "default")
     custom_llm_api_key: str = os.getenv("CUSTOM_LLM_API_KEY", "not-needed")
 
+    # ══════════════════════════════════════
+    # Load-test stand-ins (provider "loadtest", see providers/loadtest.py)
+    # ══════════════════════════════════════
+    loadtest_script: str = os.getenv("LOADTEST_SCRIPT", "")  # caller lines, one per line
+    loadtest_stt_final_delay: float = float(os.getenv("LOADTEST_STT_FINAL_DELAY", "0.3"))
+    loadtest_llm_ttft: float = float(os.getenv("LOADTEST_LLM_TTFT", "0.5"))
+    loadtest_llm_tokens_per_second: float = float(os.getenv("LOADTEST_LLM_TOKENS_PER_SECOND", "40"))
+    loadtest_llm_reply_words: int = int(os.getenv("LOADTEST_LLM_REPLY_WORDS", "20"))
+    loadtest_tool_every: int = int(os.getenv("LOADTEST_TOOL_EVERY", "3"))  # 0 = no tool calls
+    loadtest_tool: str = os.getenv("LOADTEST_TOOL", "lookup_customer")
+    loadtest_tool_args: str = os.getenv("LOADTEST_TOOL_ARGS", '{"phone_number": "01712345678"}')
+    loadtest_tts_ttfb: float = float(os.getenv("LOADTEST_TTS_TTFB", "0.2"))
+    loadtest_stats_dir: str = os.getenv("LOADTEST_STATS_DIR", "")  # per-call loop lag samples
+
     # ══════════════════════════════════════
     # LiveKit
     # ══════════════════════════════════════
@@ -131,6 +256,7 @@ class Config:
         print(f"  TTS Provider : {self.tts_provider}")
         print(f"  Language     : {self.language}")
         print(f"  Agent Mode   : {self.agent_mode}")
+        print(f"  Company      : {self.company_name}")
         print(f"  LiveKit URL  : {self.livekit_url}")
         print(f"  Google Sheet : {'✅ Connected' if self.google_sheet_id else '❌ Not set'}")
         print(f"  Google Cal   : {'✅ Connected' if self.google_calendar_id else '❌ Not set'}")
@@ -139,5 +265,81 @@ class Config:
         print("=" * 50 + "\n")
 
 
-# Singleton config instance
-config = Config()
+# ═══════════════════════════════════════════════════════
+# HOT RELOAD — new calls get the new .env, active calls keep theirs
+# ═══════════════════════════════════════════════════════
+def _env_mtime() -> float:
+    try:
+        return os.path.getmtime(ENV_FILE) if ENV_FILE else 0.0
+    except OSError:
+        return 0.0
+
+
+def _apply_env_file(previous_keys: set[str]) -> set[str]:
+    """Load .env into os.environ, dropping keys that were removed from it."""
+    values = {k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+    for key in previous_keys - values.keys() - _PROCESS_ENV:
+        os.environ.pop(key, None)
+    for key, value in values.items():
+        if key not in _PROCESS_ENV:
+            os.environ[key] = value
+    return set(values)
+
+
+def _build_config() -> Config:
+    """A Config built from the environment as it is now."""
+    # Field defaults are read from the environment when the class body
+    # runs, so run a private copy of this module to get a fresh Config
+    spec = importlib.util.spec_from_file_location("_config_reload", __file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Config()
+
+
+_reload_lock = threading.Lock()
+_env_keys = set(dotenv_values(ENV_FILE)) if ENV_FILE else set()
+_env_loaded_mtime = _env_mtime()
+_latest = Config()
+_call_config: ContextVar["Config | None"] = ContextVar("call_config", default=None)
+
+
+def refresh_config() -> Config:
+    """The latest Config — rebuilt first if .env changed since the last load.
+
+    A .env that fails to parse keeps the previous config.
+    """
+    global _latest, _env_keys, _env_loaded_mtime
+    mtime = _env_mtime()
+    if mtime == _env_loaded_mtime:
+        return _latest
+
+    with _reload_lock:
+        if mtime == _env_loaded_mtime:
+            return _latest
+        _env_loaded_mtime = mtime
+        try:
+            _env_keys = _apply_env_file(_env_keys)
+            new = _build_config()
+        except Exception as e:
+            logger.error(f"❌ .env reload failed, keeping previous config: {e}")
+            return _latest
+
+        changed = [f.name for f in fields(Config) if getattr(new, f.name) != getattr(_latest, f.name)]
+        _latest = new
+        logger.info(f"🔄 Config reloaded for new calls — changed: {', '.join(changed) or 'nothing'}")
+        return _latest
+
+
+def pin_config(snapshot: Config) -> None:
+    """Use `snapshot` for the rest of this call (current task and everything it starts)."""
+    _call_config.set(snapshot)
+
+
+class _ConfigProxy:
+    """`config` everywhere in the app: the current call's snapshot, else the latest."""
+
+    def __getattr__(self, name: str):
+        return getattr(_call_config.get() or _latest, name)
+
+
+config = _ConfigProxy()
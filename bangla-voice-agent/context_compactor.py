@@ -0,0 +1,222 @@
+"""
+Rolling chat-context compaction for long calls.
+
+Every user turn, assistant turn and tool JSON stays in the session's chat
+history, so on a long support or collections call each LLM request gets
+bigger and time-to-first-token keeps growing.
+
+ContextCompactor trims what is SENT to the LLM (the session history
+itself is untouched):
+  - the last N turns are kept verbatim
+  - older turns are replaced by a short running summary
+  - old tool results are clipped
+  - the conversation is kept under a per-mode token budget
+
+The summary is written by the LLM in a background task, never on the
+critical path. Until it catches up, older turns are sent verbatim
+(or dropped, oldest first, if they'd blow the budget). Its requests go
+through the call's LLM, so their metrics reach the session too —
+owns() tells them apart so they stay out of the call's LLM stats.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from livekit.agents import llm
+from livekit.agents.metrics import LLMMetrics
+
+from config import config
+
+logger = logging.getLogger("voice-agent.context")
+
+# Conversation-history budget (tokens, excluding the system prompt) per AGENT_MODE.
+# Modes not listed use CONTEXT_TOKEN_BUDGET from .env.
+MODE_TOKEN_BUDGETS = {
+    "receptionist": 3000,
+    "appointment": 2500,
+    "support": 4000,
+    "sales": 3000,
+    "survey": 2500,
+    "collections": 4000,
+}
+
+# Rough token estimate — Bangla script tokenizes at ~3 chars/token
+CHARS_PER_TOKEN = 3
+
+# Tool results outside the current turn are clipped to this many chars
+MAX_OLD_TOOL_OUTPUT_CHARS = 400
+
+SUMMARY_INSTRUCTIONS = (
+    "You maintain running notes for an ongoing phone call between a caller and "
+    "the agent Nusrat. Update the notes with the new part of the conversation. "
+    "Keep names, phone numbers, dates, times, ticket and appointment IDs, and "
+    "what was agreed or is still pending. At most 8 short bullet points. "
+    "Write in the language of the conversation. Output only the notes."
+)
+
+
+def _estimate_tokens(item: llm.ChatItem) -> int:
+    if isinstance(item, llm.ChatMessage):
+        chars = len(item.text_content or "")
+    elif isinstance(item, llm.FunctionCall):
+        chars = len(item.name) + len(item.arguments)
+    elif isinstance(item, llm.FunctionCallOutput):
+        chars = len(item.output)
+    else:
+        chars = 0
+    return chars // CHARS_PER_TOKEN + 4
+
+
+def _describe(item: llm.ChatItem) -> str | None:
+    """One transcript line for the summarizer."""
+    if isinstance(item, llm.ChatMessage):
+        text = item.text_content
+        return f"{item.role}: {text}" if text else None
+    if isinstance(item, llm.FunctionCall):
+        return f"tool call {item.name}({item.arguments})"
+    if isinstance(item, llm.FunctionCallOutput):
+        return f"tool result {item.name}: {item.output[:MAX_OLD_TOOL_OUTPUT_CHARS]}"
+    return None
+
+
+def _split_turns(items: list[llm.ChatItem]) -> list[list[llm.ChatItem]]:
+    """Group items into turns, each starting at a user message.
+
+    Tool calls and their outputs always stay in the same group.
+    """
+    turns: list[list[llm.ChatItem]] = []
+    for item in items:
+        if not turns or (isinstance(item, llm.ChatMessage) and item.role == "user"):
+            turns.append([])
+        turns[-1].append(item)
+    return turns
+
+
+class ContextCompactor:
+    """Keeps the LLM's view of a call small and roughly constant in size."""
+
+    def __init__(
+        self,
+        summary_llm: llm.LLM,
+        *,
+        mode: str,
+        keep_turns: int | None = None,
+        token_budget: int | None = None,
+    ) -> None:
+        self._llm = summary_llm
+        self._mode = mode
+        self._keep_turns = keep_turns or config.context_keep_turns
+        self._token_budget = token_budget or MODE_TOKEN_BUDGETS.get(
+            mode, config.context_token_budget
+        )
+        self._summary = ""
+        self._summarized: set[str] = set()  # item ids covered by the summary
+        self._task: asyncio.Task | None = None
+        self._request_ids: set[str] = set()  # summary requests, see owns()
+
+    def compact(self, chat_ctx: llm.ChatContext) -> llm.ChatContext:
+        """Return a compacted copy of chat_ctx to send to the LLM. Never blocks."""
+        system: list[llm.ChatItem] = []
+        convo: list[llm.ChatItem] = []
+        for item in chat_ctx.items:
+            if isinstance(item, llm.ChatMessage) and item.role in ("system", "developer"):
+                system.append(item)
+            else:
+                convo.append(item)
+
+        turns = _split_turns(convo)
+        if len(turns) <= self._keep_turns:
+            return chat_ctx
+
+        old_turns = turns[: -self._keep_turns]
+        recent_turns = turns[-self._keep_turns :]
+
+        # Turns the summary doesn't cover yet — summarize them in the background
+        pending = [t for t in old_turns if t[0].id not in self._summarized]
+        if pending:
+            self._schedule_summary(pending)
+
+        # Clip bulky tool JSON everywhere except the current turn
+        kept = [[self._clip(i) for i in t] for t in pending + recent_turns[:-1]]
+        kept.append(recent_turns[-1])
+
+        # Enforce the token budget — drop oldest unsummarized turns first
+        # (they are already queued for the summary)
+        def _total(groups: list[list[llm.ChatItem]]) -> int:
+            return sum(_estimate_tokens(i) for g in groups for i in g)
+
+        summary_tokens = len(self._summary) // CHARS_PER_TOKEN
+        while len(kept) > self._keep_turns and _total(kept) + summary_tokens > self._token_budget:
+            kept.pop(0)
+
+        items = list(system)
+        if self._summary:
+            items.append(
+                llm.ChatMessage(
+                    role="system",
+                    content=[f"## এই কলের আগের অংশের সারাংশ\n{self._summary}"],
+                )
+            )
+        for group in kept:
+            items.extend(group)
+
+        logger.debug(
+            f"🗜️ Context [{self._mode}]: {len(chat_ctx.items)} items → {len(items)} "
+            f"(~{_total(kept) + summary_tokens} tokens)"
+        )
+        return llm.ChatContext(items)
+
+    def _clip(self, item: llm.ChatItem) -> llm.ChatItem:
+        if isinstance(item, llm.FunctionCallOutput) and len(item.output) > MAX_OLD_TOOL_OUTPUT_CHARS:
+            return item.model_copy(
+                update={"output": item.output[:MAX_OLD_TOOL_OUTPUT_CHARS] + " …"}
+            )
+        return item
+
+    def _schedule_summary(self, turns: list[list[llm.ChatItem]]) -> None:
+        if self._task and not self._task.done():
+            return  # one summary at a time — the next compact() picks up the rest
+        self._task = asyncio.create_task(self._summarize(turns))
+
+    async def _summarize(self, turns: list[list[llm.ChatItem]]) -> None:
+        lines = [line for t in turns for i in t if (line := _describe(i))]
+        ctx = llm.ChatContext.empty()
+        ctx.add_message(role="system", content=SUMMARY_INSTRUCTIONS)
+        ctx.add_message(
+            role="user",
+            content=(
+                f"Current notes:\n{self._summary or '(none)'}\n\n"
+                f"New conversation:\n" + "\n".join(lines)
+            ),
+        )
+
+        try:
+            parts = []
+            async with self._llm.chat(chat_ctx=ctx) as stream:
+                async for chunk in stream:
+                    if chunk.id:
+                        self._request_ids.add(chunk.id)
+                    if chunk.delta and chunk.delta.content:
+                        parts.append(chunk.delta.content)
+            summary = "".join(parts).strip()
+        except Exception as e:
+            logger.warning(f"🗜️ Context summary failed: {e}")
+            return
+
+        if summary:
+            self._summary = summary
+            self._summarized.update(t[0].id for t in turns)
+            logger.info(
+                f"🗜️ Context [{self._mode}]: summarized {len(turns)} older turns "
+                f"({len(summary)} chars)"
+            )
+
+    def owns(self, metrics: object) -> bool:
+        """True for the LLMMetrics of a summary request made by this compactor."""
+        return isinstance(metrics, LLMMetrics) and metrics.request_id in self._request_ids
+
+    async def aclose(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
@@ -0,0 +1,124 @@
+"""
+Hang-up — end the call as soon as the goodbye has been spoken.
+
+end_call used to only log. After the goodbye the session kept streaming
+the caller's audio to STT, running VAD, mixing background audio and
+holding the room (and the worker's session slot) until the caller hung
+up — and a caller who stayed on the line got the silence nudges too.
+
+Now end_call (tools/transfer.py) and the silence farewell hand their
+speech to goodbye(), and once it has played out:
+  1. session.shutdown() closes the STT, TTS and VAD streams and stops
+     reading the room's audio
+  2. on the session's close, background audio is stopped, the room is
+     deleted — which hangs up the SIP leg — and the job ends, freeing
+     the worker slot
+If the caller talks over the goodbye, the call stays up. After a SIP
+transfer (sip_transfer.py) the agent leaves the same way, but keeps the
+room when the caller was bridged to a person in it.
+
+stats.py logs the seconds each call stayed up after its goodbye and the
+STT audio, LLM requests and TTS characters spent in that time; set
+HANGUP_ON_END_CALL=false to compare with leaving the line open.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+
+from livekit.agents import AgentSession, CloseEvent, JobContext
+from livekit.agents.voice import SpeechHandle
+
+from config import config
+from stats import AfterGoodbye
+
+logger = logging.getLogger("voice-agent.hangup")
+
+_calls: weakref.WeakKeyDictionary[AgentSession, CallEnd] = weakref.WeakKeyDictionary()
+# Strong references to running teardowns — the loop only keeps weak ones
+_release_tasks: set[asyncio.Task] = set()
+
+
+class CallEnd:
+    """Tears one call down after its goodbye."""
+
+    def __init__(self, ctx: JobContext, session: AgentSession) -> None:
+        self._ctx = ctx
+        self._session = session
+        self._hang_up = config.hangup_on_end_call
+        self.stats = AfterGoodbye(self._hang_up)
+        self.background_audio = None  # set once it is started
+        self.reason = ""  # why the agent ended the call, "" while it is up
+        self._leaving = False
+        self._delete_room = True
+        _calls[session] = self
+        session.on("close", self._on_close)
+
+    def goodbye(self, speech: SpeechHandle, reason: str) -> None:
+        """End the call once `speech` has played out."""
+        self._end_after(speech, reason, leave=self._hang_up, delete_room=True, transfer=False)
+
+    def transferred(self, speech: SpeechHandle, reason: str, *, delete_room: bool) -> None:
+        """Leave the call once `speech` has played out — someone else has the caller now.
+
+        The room is kept when the caller was bridged to a person in it.
+        """
+        self._end_after(speech, reason, leave=True, delete_room=delete_room, transfer=True)
+
+    def _end_after(
+        self, speech: SpeechHandle, reason: str, *, leave: bool, delete_room: bool, transfer: bool
+    ) -> None:
+        if self.reason:
+            return
+        self.reason = reason
+
+        def _played_out(handle: SpeechHandle) -> None:
+            if handle.interrupted and not transfer:
+                logger.info(f"📞 Caller spoke over the goodbye — staying on the line ({reason})")
+                self.reason = ""
+                return
+            if not transfer:
+                self.stats.goodbye_done()
+            if leave:
+                logger.info(f"📴 {'Handed over' if transfer else 'Goodbye played out'} — leaving the call ({reason})")
+                self._leaving = True
+                self._delete_room = delete_room
+                self._session.shutdown()
+
+        speech.add_done_callback(_played_out)
+
+    def _on_close(self, ev: CloseEvent) -> None:
+        self.stats.closed()
+        if self._leaving:
+            task = asyncio.create_task(self._release())
+            _release_tasks.add(task)
+            task.add_done_callback(_release_tasks.discard)
+
+    async def _release(self) -> None:
+        start = time.perf_counter()
+        if self.background_audio is not None:
+            await self.background_audio.aclose()
+        if self._delete_room:
+            try:
+                await self._ctx.delete_room()  # disconnects the caller, SIP leg included
+            except Exception as e:
+                logger.warning(f"⚠️  Could not delete room {self._ctx.room.name}: {e}")
+        logger.info(f"📴 Call released in {(time.perf_counter() - start) * 1000:.0f} ms")
+        self._ctx.shutdown(reason=self.reason)
+
+
+def goodbye(session: AgentSession, speech: SpeechHandle, reason: str) -> None:
+    """End `session`'s call once `speech` has played out (no-op outside a call)."""
+    call = _calls.get(session)
+    if call is not None:
+        call.goodbye(speech, reason)
+
+
+def transferred(session: AgentSession, speech: SpeechHandle, reason: str, *, delete_room: bool) -> None:
+    """Leave `session`'s call once `speech` has played out (no-op outside a call)."""
+    call = _calls.get(session)
+    if call is not None:
+        call.transferred(speech, reason, delete_room=delete_room)
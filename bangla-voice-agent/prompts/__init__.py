@@ -9,9 +9,17 @@ Available modes (set AGENT_MODE in .env):
   sales         → Outbound sales, lead qualification
   survey        → Customer satisfaction surveys
   collections   → Payment reminders, billing
+
+Edited prompt files are picked up by new calls without a restart
+(refresh_prompts, called at the start of every call).
 """
 
+import importlib.util
+import logging
+import threading
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
 from prompts.receptionist import RECEPTIONIST_PROMPT
 from prompts.appointment import APPOINTMENT_PROMPT
@@ -19,6 +27,14 @@ from prompts.support import SUPPORT_PROMPT
 from prompts.sales import SALES_PROMPT
 from prompts.survey import SURVEY_PROMPT
 from prompts.collections import COLLECTIONS_PROMPT
+from prompts.scripted import (
+    GREETING_INSTRUCTIONS,
+    NUDGE_LINES,
+    SILENCE_FAREWELL,
+    get_greeting,
+)
+
+logger = logging.getLogger("voice-agent.prompts")
 
 PROMPTS = {
     "receptionist": RECEPTIONIST_PROMPT,
@@ -30,9 +46,95 @@ PROMPTS = {
 }
 
 
+@lru_cache(maxsize=64)
+def _stable_prompt(template: str, company_name: str) -> str:
+    """The cacheable part of a prompt — identical for every call in this mode.
+
+    Keyed by the template text, so reloaded prompts never hit stale entries.
+    """
+    return template.format(company_name=company_name)
+
+
+# ═══════════════════════════════════════════════════════
+# HOT RELOAD — edited prompt files apply to new calls
+# ═══════════════════════════════════════════════════════
+_PROMPTS_DIR = Path(__file__).parent
+_reload_lock = threading.Lock()
+
+
+def _prompts_mtime() -> float:
+    return max(p.stat().st_mtime for p in _PROMPTS_DIR.glob("*.py"))
+
+
+_loaded_mtime = _prompts_mtime()
+
+
+def _load_fresh(name: str):
+    """Run a private copy of a prompt module (sys.modules is left alone)."""
+    spec = importlib.util.find_spec(name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def refresh_prompts() -> bool:
+    """Reload prompt templates and scripted lines if any prompt file changed.
+
+    Everything is swapped in one step; calls already running keep the
+    instructions they were built with. A file with an error keeps the
+    previous prompts.
+    """
+    global _loaded_mtime
+    mtime = _prompts_mtime()
+    if mtime == _loaded_mtime:
+        return False
+
+    with _reload_lock:
+        if mtime == _loaded_mtime:
+            return False
+        _loaded_mtime = mtime
+        try:
+            prompts = {
+                mode: getattr(_load_fresh(f"prompts.{mode}"), f"{mode.upper()}_PROMPT")
+                for mode in PROMPTS
+            }
+            scripted = _load_fresh("prompts.scripted")
+        except Exception as e:
+            logger.error(f"❌ Prompt reload failed, keeping previous prompts: {e}")
+            return False
+
+        globals().update(
+            PROMPTS=prompts,
+            GREETING_INSTRUCTIONS=scripted.GREETING_INSTRUCTIONS,
+            NUDGE_LINES=scripted.NUDGE_LINES,
+            SILENCE_FAREWELL=scripted.SILENCE_FAREWELL,
+            get_greeting=scripted.get_greeting,
+        )
+        logger.info("🔄 Prompts reloaded for new calls")
+        return True
+
+
+def build_call_context() -> str:
+    """Build the volatile tail of a system prompt.
+
+    Everything that changes between calls or days lives here, AFTER the
+    stable prompt, so providers can reuse the cached prompt prefix.
+    """
+    # Inject today's date so the LLM always knows the current date.
+    # One format only: the tools take YYYY-MM-DD, and TTS speaks it as
+    # words (providers/bangla_verbalizer.py).
+    today_str = datetime.now().strftime("%Y-%m-%d")  # e.g. 2026-02-21
+
+    return f"\n## আজকের তারিখ\nআজকের তারিখ: {today_str}।\n"
+
+
 def get_prompt(mode: str, company_name: str = "আমাদের কোম্পানি") -> str:
     """Get the system prompt for the given agent mode.
 
+    Stable content comes first and volatile content (today's date) last,
+    so the prompt prefix stays byte-identical across calls and the LLM
+    provider can serve it from its prompt cache.
+
     Args:
         mode: Agent mode from .env (receptionist, appointment, support, sales, survey, collections)
         company_name: Company name to insert into prompts
@@ -42,13 +144,4 @@ def get_prompt(mode: str, company_name: str = "আমাদের কোম্
             f"Unknown AGENT_MODE: '{mode}'. Valid options: {list(PROMPTS.keys())}"
         )
 
-    # Inject today's date so the LLM always knows the current date
-    today = datetime.now()
-    today_str = today.strftime("%Y-%m-%d")  # e.g. 2026-02-21
-    today_bangla = today.strftime("%d/%m/%Y")  # e.g. 21/02/2026
-
-    return PROMPTS[mode].format(
-        company_name=company_name,
-        today_date=today_str,
-        today_date_bangla=today_bangla,
-    )
+    return _stable_prompt(PROMPTS[mode], company_name) + build_call_context()
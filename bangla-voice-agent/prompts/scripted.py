@@ -0,0 +1,57 @@
+"""
+Scripted utterances — lines the agent speaks VERBATIM.
+
+These never go through the LLM. agent.py speaks them straight through
+TTS with session.say(), so there is no LLM round trip before the audio
+starts and the model can't paraphrase them. They are still added to the
+chat history, so the LLM knows what was said.
+
+HOW TO EDIT:
+  Change the text below. Keep each line short — it's a phone call.
+  A mode with no greeting here (None) gets a generated greeting from
+  the LLM instead, because it needs the caller's details.
+"""
+
+from __future__ import annotations
+
+# First line of the call, per AGENT_MODE (copied from step 1 of each prompt)
+GREETINGS = {
+    "receptionist": "আসসালামু আলাইকুম, {company_name}-এ স্বাগতম। আমি নুসরাত। আপনার নামটা জানতে পারি?",
+    "appointment": "আসসালামু আলাইকুম! অ্যাপয়েন্টমেন্ট বুকিং-এ আপনাকে স্বাগতম। আপনি কি ধরনের অ্যাপয়েন্টমেন্ট নিতে চান?",
+    "support": "আসসালামু আলাইকুম! {company_name} সাপোর্টে আপনাকে স্বাগতম। কি সমস্যায় আমি আপনাকে সাহায্য করতে পারি?",
+    "survey": "আসসালামু আলাইকুম, আমি নুসরাত, {company_name} থেকে বলছি। আপনার নামটা জানতে পারি?",
+    # sales / collections address the caller by name → LLM-generated
+    "sales": None,
+    "collections": None,
+}
+
+# Used by modes without a scripted greeting
+GREETING_INSTRUCTIONS = (
+    "আসসালামু আলাইকুম বলে কলারকে সালাম দাও। "
+    "নিজের পরিচয় দাও — তুমি নুসরাত, এই কোম্পানির রিসেপশনিস্ট। "
+    "তারপর কলারের নাম জিজ্ঞেস করো। "
+    "২ লাইনের বেশি বলো না।"
+)
+
+# What Nusrat says when the caller goes silent — like a real human
+NUDGE_LINES = [
+    # Nudge 1: Gentle check (like "hello? are you there?")
+    "হ্যালো? বলুন, আমি শুনছি।",
+    # Nudge 2: A bit more concerned
+    "আপনি কি শুনতে পাচ্ছেন? আমি আপনার কথা শুনতে পাচ্ছি না।",
+]
+
+# Nudge 3: Polite goodbye when the caller never comes back
+SILENCE_FAREWELL = "ঠিক আছে, মনে হচ্ছে লাইনে সমস্যা হচ্ছে। আপনি আবার কল দিবেন। আসসালামু আলাইকুম।"
+
+
+def get_greeting(mode: str, company_name: str = "আমাদের কোম্পানি") -> str | None:
+    """Get the scripted greeting for an agent mode.
+
+    Returns None if the mode has no fixed greeting and the LLM
+    should generate one (see GREETING_INSTRUCTIONS).
+    """
+    greeting = GREETINGS.get(mode)
+    if greeting is None:
+        return None
+    return greeting.format(company_name=company_name)
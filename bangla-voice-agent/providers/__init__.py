@@ -1,5 +1,6 @@
 from providers.stt_factory import get_stt
 from providers.llm_factory import get_llm
-from providers.tts_factory import get_tts
+from providers.tts_factory import get_tts, voice_key
+from providers.speech_cache import say_scripted
 
-__all__ = ["get_stt", "get_llm", "get_tts"]
+__all__ = ["get_stt", "get_llm", "get_tts", "voice_key", "say_scripted"]
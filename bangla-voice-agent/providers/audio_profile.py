@@ -0,0 +1,66 @@
+"""
+Audio profiles — source-aware sample rates
+═══════════════════════════════════════════════════
+SIP calls are narrowband (G.711, 8 kHz). Treated like browser calls, the
+audio is upsampled to 24 kHz on the way in, resampled again to 16 kHz for
+VAD and STT, and TTS renders 24 kHz audio that the SIP bridge throws away.
+
+The profile picked in entrypoint keeps a call at its native rate end to end:
+  wideband   -> dashboard/browser calls, provider defaults (unchanged)
+  telephony  -> SIP calls: room audio, VAD, STT and TTS all at
+                TELEPHONY_SAMPLE_RATE (8000, or 16000 for HD-voice trunks)
+
+Providers that can't produce the telephony rate (e.g. OpenAI TTS, fixed
+24 kHz) keep their own rate and the room output resamples as before.
+Set TELEPHONY_AUDIO=false to treat SIP calls as wideband.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from livekit.agents.voice import room_io
+
+from config import config
+
+# Rates Silero VAD runs at natively
+VAD_SAMPLE_RATES = (8000, 16000)
+
+
+@dataclass(frozen=True)
+class AudioProfile:
+    name: str
+    sample_rate: int | None  # None = each provider's default
+
+    def room_options(self) -> room_io.RoomOptions:
+        """Room audio in/out at the profile rate (no-op for wideband)."""
+        if self.sample_rate is None:
+            return room_io.RoomOptions()
+        return room_io.RoomOptions(
+            audio_input=room_io.AudioInputOptions(sample_rate=self.sample_rate),
+            audio_output=room_io.AudioOutputOptions(sample_rate=self.sample_rate),
+        )
+
+    @property
+    def vad_key(self) -> str:
+        """proc.userdata key of the VAD loaded for this profile in prewarm."""
+        return "vad" if self.sample_rate is None else f"vad_{self.sample_rate}"
+
+
+WIDEBAND = AudioProfile("wideband", None)
+
+
+def telephony_profile() -> AudioProfile:
+    if config.telephony_sample_rate not in VAD_SAMPLE_RATES:
+        raise ValueError(
+            f"TELEPHONY_SAMPLE_RATE must be one of {VAD_SAMPLE_RATES}, "
+            f"got {config.telephony_sample_rate}"
+        )
+    return AudioProfile("telephony", config.telephony_sample_rate)
+
+
+def get_audio_profile(is_sip: bool) -> AudioProfile:
+    """Audio profile for a call, by where it came from."""
+    if is_sip and config.telephony_audio:
+        return telephony_profile()
+    return WIDEBAND
@@ -0,0 +1,98 @@
+"""
+Bangla/English sentence tokenizer for LLM -> TTS streaming
+═══════════════════════════════════════════════════
+The framework's tokenizers (blingfire, basic) only end sentences on
+Latin punctuation. Bangla sentences end with the দাঁড়ি "।", so a Bangla
+reply reached TTS as one chunk at the end of generation and time to
+first audio grew with the length of the reply.
+
+This tokenizer cuts the streamed reply at
+  - sentence ends   "।", "॥", "?", "!", "." and line breaks
+  - clause ends     ",", ";", ":", "—", "…" — once the clause is at
+                    least MIN_CLAUSE_LEN characters, so the first audio
+                    starts after the first clause rather than the first
+                    sentence, without cutting "জি, ..." into fragments
+Pieces shorter than MIN_SENTENCE_LEN are joined to the next one.
+A "." after a number, an initial or an abbreviation such as "ডা." or
+"মো." is not a sentence end.
+
+get_tts (providers/tts_factory.py) hands it to every provider: to the
+streaming ones as their tokenizer, the others wrapped in the framework's
+StreamAdapter.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+
+from livekit.agents import tokenize
+
+MIN_SENTENCE_LEN = 8  # characters; shorter pieces are joined to the next
+MIN_CLAUSE_LEN = 20  # characters before a clause is sent on its own
+STREAM_CONTEXT_LEN = 10  # characters buffered before splitting starts
+
+# Words that end with "." without ending the sentence
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "st", "jr", "sr", "co", "ltd", "inc", "vs", "etc", "no",
+    "ডা", "ড", "মো", "মোছা", "মোসা", "নং", "লি", "সং", "কো",
+}
+
+_BOUNDARY = re.compile(
+    r"(?:(?P<sentence>[।॥]+|[?!]+|\.+)|(?P<clause>[,;:…—–]))[\"'”’)\]]*(?=\s|$)"
+    r"|(?P<newline>\n+)"
+)
+_LAST_WORD = re.compile(r"(\S+)$")
+
+
+def _is_abbreviation(text: str, dot: int) -> bool:
+    match = _LAST_WORD.search(text, 0, dot)
+    if match is None:
+        return False
+    word = match.group(1).lstrip("\"'“‘([").casefold()
+    return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def split_sentences(
+    text: str, *, min_sentence_len: int = MIN_SENTENCE_LEN, min_clause_len: int = MIN_CLAUSE_LEN
+) -> list[tuple[str, int, int]]:
+    """(piece, start, end) for each piece of `text`; the last one may be unfinished."""
+    pieces: list[tuple[str, int, int]] = []
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        if match.group("sentence") == "." and _is_abbreviation(text, match.start()):
+            continue
+        piece = text[start : match.end()].strip()
+        if len(piece) < (min_clause_len if match.group("clause") else min_sentence_len):
+            continue
+        pieces.append((piece, start, match.end()))
+        start = match.end()
+    rest = text[start:].strip()
+    if rest:
+        pieces.append((rest, start, len(text)))
+    return pieces
+
+
+class BanglaSentenceTokenizer(tokenize.SentenceTokenizer):
+    def __init__(
+        self,
+        *,
+        min_sentence_len: int = MIN_SENTENCE_LEN,
+        min_clause_len: int = MIN_CLAUSE_LEN,
+        stream_context_len: int = STREAM_CONTEXT_LEN,
+    ) -> None:
+        self._split = functools.partial(
+            split_sentences, min_sentence_len=min_sentence_len, min_clause_len=min_clause_len
+        )
+        self._min_sentence_len = min_sentence_len
+        self._stream_context_len = stream_context_len
+
+    def tokenize(self, text: str, *, language: str | None = None) -> list[str]:
+        return [piece for piece, _, _ in self._split(text)]
+
+    def stream(self, *, language: str | None = None) -> tokenize.SentenceStream:
+        return tokenize.BufferedSentenceStream(
+            tokenizer=self._split,
+            min_token_len=self._min_sentence_len,
+            min_ctx_len=self._stream_context_len,
+        )
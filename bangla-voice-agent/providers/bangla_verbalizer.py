@@ -0,0 +1,250 @@
+"""
+Bangla verbalizer — numbers as words before they reach TTS
+═══════════════════════════════════════════════════
+The LLM copies numbers into its replies as digits — phone numbers the
+caller gave, dates and times from the calendar tools, amounts from the
+CRM — and TTS voices read them unevenly ("2026-02-21" as a string of
+digits, "10:00 AM" in English). Rather than prompting the LLM to spell
+them out (prompt tokens on every turn, extra output tokens, and still
+wrong now and then), this stage rewrites them deterministically between
+the LLM and TTS:
+
+  01712-345678      শূন্য এক সাত এক দুই, তিন চার পাঁচ, ছয় সাত আট
+  2026-02-21        একুশে ফেব্রুয়ারি দুই হাজার ছাব্বিশ
+  10:00 AM / 16:30  সকাল দশটা / বিকেল সাড়ে চারটা
+  ৳1,500 / 500/-    এক হাজার পাঁচশো টাকা / পাঁচশো টাকা
+  3.5, ২টা          তিন দশমিক পাঁচ, দুইটা
+
+Bangla and ASCII digits are both read. Numbers with a leading zero or
+of 10+ digits (IDs, account numbers) are read digit by digit. Every
+rewrite is memoized per token, so a date or number that comes up again
+in the call costs a dict lookup.
+
+verbalize_stream is an AgentSession tts_text_transforms entry; it holds
+back numbers until the next word shows they are complete. Only TTS
+input is rewritten — the transcript and chat history keep the digits.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import AsyncIterable, Callable
+
+TOKEN_CACHE_SIZE = 4096
+
+_BANGLA_DIGITS = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
+
+# 0–99 — Bangla has a word for each
+NUMBERS = (
+    "শূন্য এক দুই তিন চার পাঁচ ছয় সাত আট নয় "
+    "দশ এগারো বারো তেরো চৌদ্দ পনেরো ষোলো সতেরো আঠারো উনিশ "
+    "বিশ একুশ বাইশ তেইশ চব্বিশ পঁচিশ ছাব্বিশ সাতাশ আটাশ ঊনত্রিশ "
+    "ত্রিশ একত্রিশ বত্রিশ তেত্রিশ চৌত্রিশ পঁয়ত্রিশ ছত্রিশ সাঁইত্রিশ আটত্রিশ ঊনচল্লিশ "
+    "চল্লিশ একচল্লিশ বিয়াল্লিশ তেতাল্লিশ চুয়াল্লিশ পঁয়তাল্লিশ ছেচল্লিশ সাতচল্লিশ আটচল্লিশ ঊনপঞ্চাশ "
+    "পঞ্চাশ একান্ন বাহান্ন তিপ্পান্ন চুয়ান্ন পঞ্চান্ন ছাপ্পান্ন সাতান্ন আটান্ন ঊনষাট "
+    "ষাট একষট্টি বাষট্টি তেষট্টি চৌষট্টি পঁয়ষট্টি ছেষট্টি সাতষট্টি আটষট্টি ঊনসত্তর "
+    "সত্তর একাত্তর বাহাত্তর তিয়াত্তর চুয়াত্তর পঁচাত্তর ছিয়াত্তর সাতাত্তর আটাত্তর ঊনআশি "
+    "আশি একাশি বিরাশি তিরাশি চুরাশি পঁচাশি ছিয়াশি সাতাশি অষ্টাশি ঊননব্বই "
+    "নব্বই একানব্বই বিরানব্বই তিরানব্বই চুরানব্বই পঁচানব্বই ছিয়ানব্বই সাতানব্বই আটানব্বই নিরানব্বই"
+).split()
+
+# Day of the month as spoken in dates ("একুশে ফেব্রুয়ারি")
+DAYS = (
+    "পহেলা দোসরা তেসরা চৌঠা পাঁচই ছয়ই সাতই আটই নয়ই দশই "
+    "এগারোই বারোই তেরোই চৌদ্দই পনেরোই ষোলোই সতেরোই আঠারোই উনিশে বিশে "
+    "একুশে বাইশে তেইশে চব্বিশে পঁচিশে ছাব্বিশে সাতাশে আটাশে ঊনত্রিশে ত্রিশে একত্রিশে"
+).split()
+
+MONTHS = (
+    "জানুয়ারি ফেব্রুয়ারি মার্চ এপ্রিল মে জুন "
+    "জুলাই আগস্ট সেপ্টেম্বর অক্টোবর নভেম্বর ডিসেম্বর"
+).split()
+
+# Hours on the clock ("দশটা"); half past one and two have their own words
+HOURS = "বারোটা একটা দুইটা তিনটা চারটা পাঁচটা ছয়টা সাতটা আটটা নয়টা দশটা এগারোটা".split()
+HALF_PAST = {1: "দেড়টা", 2: "আড়াইটা"}
+
+SCALES = ((10**7, "কোটি"), (10**5, "লাখ"), (1000, "হাজার"))
+
+
+# ═══════════════════════════════════════════════════════
+# NUMBERS
+# ═══════════════════════════════════════════════════════
+def number_words(n: int) -> str:
+    """Spoken Bangla for a whole number, in the lakh/crore system."""
+    if n < 100:
+        return NUMBERS[n]
+    words = []
+    for scale, name in SCALES:
+        if n >= scale:
+            words.append(f"{number_words(n // scale)} {name}")
+            n %= scale
+    if n >= 100:
+        words.append(f"{NUMBERS[n // 100]}শো")
+        n %= 100
+    if n:
+        words.append(NUMBERS[n])
+    return " ".join(words)
+
+
+def digit_words(digits: str) -> str:
+    return " ".join(NUMBERS[int(d)] for d in digits)
+
+
+def _year_words(year: int) -> str:
+    if 1100 <= year < 2000:
+        rest = year % 100
+        return f"{NUMBERS[year // 100]}শো" + (f" {NUMBERS[rest]}" if rest else "")
+    return number_words(year)
+
+
+def _amount_words(number: str) -> str:
+    """Words for "1,500" or "3.5"; digit by digit for leading zeros and long IDs."""
+    whole, _, fraction = number.replace(",", "").partition(".")
+    if (len(whole) > 1 and whole.startswith("0")) or len(whole) >= 10:
+        spoken = digit_words(whole)
+    else:
+        spoken = number_words(int(whole))
+    if fraction:
+        spoken += f" দশমিক {digit_words(fraction)}"
+    return spoken
+
+
+# ═══════════════════════════════════════════════════════
+# PATTERNS — applied in this order, each memoized per token
+# ═══════════════════════════════════════════════════════
+_NUMBER = r"\d{1,3}(?:,\d{2,3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+
+_PHONE = re.compile(r"(?<![\w+])(\+?88[-\s]?)?(01[3-9](?:[-\s]?\d){8})(?!\d)")
+_DATE = re.compile(r"(?<!\d)(\d{4})-(\d{2})-(\d{2})(?!\d)")
+_TIME = re.compile(
+    r"(?<![\d:])(\d{1,2}):(\d{2})(?![\d:])(?:\s?([AaPp])\.?\s?[Mm]\.?(?![A-Za-z]))?"
+)
+_TAKA = re.compile(
+    rf"(?:৳|(?<![A-Za-z])(?:Tk|TK|BDT)\.?)\s?({_NUMBER})(?:\s?(?:টাকা|/-|[Tt]aka\b))?"
+    rf"|(?<!\d)(?<!\d[.,])({_NUMBER})\s?(?:/-|[Tt]aka\b)"
+)
+_AMOUNT = re.compile(rf"(?<!\d)(?<!\d[.,])({_NUMBER})(?!\d|[.,]\d)")
+
+
+def _phone(token: str) -> str:
+    match = _PHONE.fullmatch(token)
+    country, digits = match.group(1), re.sub(r"\D", "", match.group(2))
+    groups = [digits[:5], digits[5:8], digits[8:]]  # 01712 345 678
+    spoken = ", ".join(digit_words(group) for group in groups)
+    return f"প্লাস আট আট {spoken}" if country else spoken
+
+
+def _date(token: str) -> str:
+    year, month, day = (int(part) for part in _DATE.fullmatch(token).groups())
+    try:
+        date(year, month, day)
+    except ValueError:
+        return token  # not a date — the digits are read as numbers
+    return f"{DAYS[day - 1]} {MONTHS[month - 1]} {_year_words(year)}"
+
+
+def _time(token: str) -> str:
+    hour_text, minute_text, period = _TIME.fullmatch(token).groups()
+    hour, minute = int(hour_text), int(minute_text)
+    if hour > 23 or minute > 59 or (period and not 1 <= hour <= 12):
+        return token
+    if period:
+        hour = hour % 12 + (12 if period in "Pp" else 0)
+    part_of_day = ""
+    if period or hour > 12 or hour == 0:
+        part_of_day = (
+            "রাত " if hour < 4 or hour >= 20
+            else "ভোর " if hour < 6
+            else "সকাল " if hour < 12
+            else "দুপুর " if hour < 15
+            else "বিকেল " if hour < 18
+            else "সন্ধ্যা "
+        )
+
+    clock = hour % 12
+    if minute == 0:
+        spoken = HOURS[clock]
+    elif minute == 15:
+        spoken = f"সোয়া {HOURS[clock]}"
+    elif minute == 30:
+        spoken = HALF_PAST.get(clock, f"সাড়ে {HOURS[clock]}")
+    elif minute == 45:
+        spoken = f"পৌনে {HOURS[(clock + 1) % 12]}"
+    else:
+        spoken = f"{HOURS[clock]} {NUMBERS[minute]} মিনিট"
+    return part_of_day + spoken
+
+
+def _taka(token: str) -> str:
+    match = _TAKA.fullmatch(token)
+    whole, _, paisa = (match.group(1) or match.group(2)).replace(",", "").partition(".")
+    spoken = f"{number_words(int(whole))} টাকা"
+    if paisa.strip("0"):
+        spoken += f" {number_words(int(paisa[:2].ljust(2, '0')))} পয়সা"
+    return spoken
+
+
+def _rule(pattern: re.Pattern, convert: Callable[[str], str]) -> Callable[[str], str]:
+    cached = lru_cache(maxsize=TOKEN_CACHE_SIZE)(convert)
+    return lambda text: pattern.sub(lambda match: cached(match.group(0)), text)
+
+
+_RULES = (
+    _rule(_PHONE, _phone),
+    _rule(_DATE, _date),
+    _rule(_TIME, _time),
+    _rule(_TAKA, _taka),
+    _rule(_AMOUNT, _amount_words),
+)
+
+
+def verbalize(text: str) -> str:
+    """Rewrite the numbers in `text` as spoken Bangla."""
+    text = text.translate(_BANGLA_DIGITS)
+    if not any(c.isdigit() for c in text):
+        return text
+    for rule in _RULES:
+        text = rule(text)
+    return text
+
+
+# ═══════════════════════════════════════════════════════
+# STREAMING — AgentSession(tts_text_transforms=[...])
+# ═══════════════════════════════════════════════════════
+# Words that may join the next one ("10:00" + "AM", "Tk" + "500")
+_HOLD = re.compile(r"[\d০-৯৳]|^(?:Tk|TK|BDT)\.?$")
+_WORD = re.compile(r"\S+")
+
+
+def _complete(buffer: str) -> int:
+    """Length of the buffer prefix that text still to come can't change."""
+    words = list(_WORD.finditer(buffer))
+    if not words:
+        return len(buffer)
+    i = len(words) if buffer[-1].isspace() else len(words) - 1  # last word may continue
+    while i > 0 and _HOLD.search(words[i - 1].group()):
+        i -= 1
+    return words[i].start() if i < len(words) else len(buffer)
+
+
+def text_transforms(language: str) -> list:
+    """AgentSession tts_text_transforms for a call in `language`."""
+    transforms: list = ["filter_markdown", "filter_emoji"]  # the framework's defaults
+    if language.startswith("bn"):
+        transforms.append(verbalize_stream)
+    return transforms
+
+
+async def verbalize_stream(text: AsyncIterable[str]) -> AsyncIterable[str]:
+    buffer = ""
+    async for chunk in text:
+        buffer += chunk
+        cut = _complete(buffer)
+        if cut:
+            yield verbalize(buffer[:cut])
+            buffer = buffer[cut:]
+    if buffer:
+        yield verbalize(buffer)
@@ -0,0 +1,172 @@
+"""
+Cross-session batched VAD
+═══════════════════════════════════════════════════
+Every call runs Silero VAD on each 32 ms window of caller audio — one
+tiny ONNX call per window per session. With many concurrent calls the
+per-call overhead dominates, not the model itself.
+
+With VAD_BATCHING=true:
+  - jobs run as threads in one worker process (JobExecutorType.THREAD),
+    so every session in the worker shares one VADBatcher
+  - each session's VAD stream keeps its own context and RNN state but,
+    instead of calling ONNX itself, hands its window to the batcher
+  - the batcher waits up to VAD_BATCH_WINDOW_MS for other sessions'
+    windows, runs ONE batched inference and routes each probability back
+
+Silero's VADStream (speech start/end logic, padding, events) is used
+unchanged — only the model call is swapped.
+
+The LiveKit inference process can't be used for this: it handles one
+request at a time, so there would be nothing to batch.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import numpy as np
+from livekit.plugins import silero
+from livekit.plugins.silero import onnx_model
+from livekit.plugins.silero.vad import VADStream
+
+logger = logging.getLogger("voice-agent.vad")
+
+STATE_SIZE = 128
+
+
+class _Request:
+    __slots__ = ("window", "state", "done", "prob", "new_state")
+
+    def __init__(self, window: np.ndarray, state: np.ndarray) -> None:
+        self.window = window  # context + samples
+        self.state = state  # (2, 1, 128)
+        self.done = threading.Event()
+        self.prob = 0.0
+        self.new_state: np.ndarray | None = None
+
+
+class VADBatcher:
+    """One Silero ONNX session shared by every VAD stream in the process."""
+
+    def __init__(self, *, sample_rate: int = 16000, window_ms: float = 4.0, max_batch: int = 64) -> None:
+        self._session = onnx_model.new_inference_session(force_cpu=True)
+        self._sr = np.array(sample_rate, dtype=np.int64)
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._queue: list[_Request] = []
+        self._cond = threading.Condition()
+        self.batches = 0
+        self.windows = 0
+        self.inference_seconds = 0.0
+        threading.Thread(target=self._loop, name="vad-batcher", daemon=True).start()
+
+    def infer(self, window: np.ndarray, state: np.ndarray) -> tuple[float, np.ndarray]:
+        """Blocking: queue one window, wait for its batch to run."""
+        req = _Request(window, state)
+        with self._cond:
+            self._queue.append(req)
+            if len(self._queue) == 1 or len(self._queue) >= self._max_batch:
+                self._cond.notify()
+        req.done.wait()
+        return req.prob, req.new_state
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                # Give other sessions a moment to join this batch
+                deadline = time.monotonic() + self._window
+                while len(self._queue) < self._max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._queue[: self._max_batch]
+                del self._queue[: self._max_batch]
+            self._run(batch)
+
+    def _run(self, batch: list[_Request]) -> None:
+        try:
+            start = time.perf_counter()
+            out, state = self._session.run(
+                None,
+                {
+                    "input": np.stack([r.window for r in batch]),
+                    "state": np.concatenate([r.state for r in batch], axis=1),
+                    "sr": self._sr,
+                },
+            )
+            self.inference_seconds += time.perf_counter() - start
+            self.batches += 1
+            self.windows += len(batch)
+            for i, r in enumerate(batch):
+                r.prob = float(out[i, 0])
+                r.new_state = state[:, i : i + 1, :]
+        except Exception as e:
+            logger.error(f"❌ Batched VAD inference failed: {e}")
+            for r in batch:
+                r.prob, r.new_state = 0.0, r.state
+        finally:
+            for r in batch:
+                r.done.set()
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.windows / self.batches if self.batches else 0.0
+
+
+_batchers: dict[int, VADBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_batcher(sample_rate: int = 16000) -> VADBatcher:
+    """The process-wide batcher for a sample rate (created on first use)."""
+    from config import config
+
+    with _batchers_lock:
+        if sample_rate not in _batchers:
+            _batchers[sample_rate] = VADBatcher(
+                sample_rate=sample_rate,
+                window_ms=config.vad_batch_window_ms,
+                max_batch=config.vad_batch_max,
+            )
+            logger.info(
+                f"🎙️ Batched VAD started ({sample_rate} Hz, "
+                f"window {config.vad_batch_window_ms} ms, max batch {config.vad_batch_max})"
+            )
+        return _batchers[sample_rate]
+
+
+class _BatchedModel(onnx_model.OnnxModel):
+    """Drop-in for silero's OnnxModel — per-stream state, shared inference."""
+
+    def __init__(self, batcher: VADBatcher, sample_rate: int) -> None:
+        super().__init__(onnx_session=None, sample_rate=sample_rate)
+        self._batcher = batcher
+
+    def __call__(self, x: np.ndarray) -> float:
+        # silero runs this in a thread executor, so blocking here is fine
+        self._input_buffer[:, : self._context_size] = self._context
+        self._input_buffer[:, self._context_size :] = x
+        prob, self._rnn_state = self._batcher.infer(self._input_buffer[0].copy(), self._rnn_state)
+        self._context = self._input_buffer[:, -self._context_size :].copy()
+        return prob
+
+
+class BatchedVAD(silero.VAD):
+    """silero.VAD whose streams share one batched inference per worker process."""
+
+    @classmethod
+    def load(cls, **kwargs) -> BatchedVAD:
+        # Parse options the same way silero does; its own ONNX session goes unused
+        vad = super().load(**kwargs)
+        vad._batcher = get_batcher(vad._opts.sample_rate)
+        return vad
+
+    def stream(self) -> VADStream:
+        stream = VADStream(self, self._opts, _BatchedModel(self._batcher, self._opts.sample_rate))
+        self._streams.add(stream)
+        return stream
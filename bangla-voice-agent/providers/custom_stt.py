@@ -0,0 +1,289 @@
+"""
+Custom streaming STT — self-hosted Bangla ASR over a websocket
+═══════════════════════════════════════════════════
+Selected with STT_PROVIDER=custom; talks to CUSTOM_STT_URL
+(http(s):// is used as ws(s)://). Connections are pooled per STT
+instance: a recognition session that ends cleanly hands its socket to
+the next one, so a call doesn't pay a handshake per turn.
+
+Protocol (one session at a time per connection):
+
+  client -> server
+    {"type": "start", "sample_rate": 16000, "language": "bn-BD",
+     "interim_results": true, "endpointing_ms": 300}
+    <binary>      16-bit mono PCM at sample_rate, 50 ms chunks
+    {"type": "finalize"}   endpointing hint: our VAD heard the caller
+                           stop — finish the utterance now instead of
+                           waiting endpointing_ms of silence
+    {"type": "end"}        no more audio in this session
+
+  server -> client
+    {"type": "speech_started"}
+    {"type": "interim", "text": "...", "confidence": 0.6}
+    {"type": "final", "text": "...", "confidence": 0.9,
+     "start": 1.2, "end": 2.8}       seconds into the session
+    {"type": "speech_ended"}
+    {"type": "ended"}                session over, connection reusable
+    {"type": "error", "message": "..."}
+
+bench/speech_stub.py serves this protocol for local testing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+from livekit import rtc
+from livekit.agents import APIConnectionError, APIError, APIStatusError, APITimeoutError, utils
+from livekit.agents import stt as stt_module
+from livekit.agents.types import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    NOT_GIVEN,
+    APIConnectOptions,
+    NotGivenOr,
+)
+from livekit.agents.utils import AudioBuffer, is_given
+
+logger = logging.getLogger("voice-agent.custom-stt")
+
+CHUNK_MS = 50
+SESSION_MAX_AGE = 600.0  # seconds before a pooled connection is replaced
+HEARTBEAT = 15.0
+
+
+def ws_url(url: str) -> str:
+    parts = urlsplit(url)
+    scheme = {"http": "ws", "https": "wss"}.get(parts.scheme, parts.scheme)
+    return urlunsplit(parts._replace(scheme=scheme))
+
+
+class CustomSTT(stt_module.STT):
+    def __init__(
+        self,
+        *,
+        url: str,
+        language: str,
+        sample_rate: int = 16000,
+        endpointing_ms: int = 300,
+        http_session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        super().__init__(capabilities=stt_module.STTCapabilities(streaming=True, interim_results=True))
+        self._url = ws_url(url)
+        self._language = language
+        self._sample_rate = sample_rate
+        self._endpointing_ms = endpointing_ms
+        self._session = http_session
+        self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
+            connect_cb=self._connect_ws,
+            close_cb=self._close_ws,
+            max_session_duration=SESSION_MAX_AGE,
+        )
+
+    @property
+    def model(self) -> str:
+        return "custom"
+
+    @property
+    def provider(self) -> str:
+        return urlsplit(self._url).netloc
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = utils.http_context.http_session()
+        return self._session
+
+    async def _connect_ws(self, timeout: float) -> aiohttp.ClientWebSocketResponse:
+        try:
+            return await asyncio.wait_for(
+                self._ensure_session().ws_connect(self._url, heartbeat=HEARTBEAT), timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise APITimeoutError(f"custom STT: connecting to {self._url} timed out") from e
+        except aiohttp.ClientError as e:
+            raise APIConnectionError(f"custom STT: cannot connect to {self._url}: {e}") from e
+
+    async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await ws.close()
+
+    def _start_message(self, interim_results: bool, language: str) -> str:
+        return json.dumps({
+            "type": "start",
+            "sample_rate": self._sample_rate,
+            "language": language,
+            "interim_results": interim_results,
+            "endpointing_ms": self._endpointing_ms,
+        })
+
+    def prewarm(self) -> None:
+        self._pool.prewarm()
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+    async def _recognize_impl(
+        self,
+        buffer: AudioBuffer,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> stt_module.SpeechEvent:
+        frame = rtc.combine_audio_frames(buffer)
+        if frame.sample_rate != self._sample_rate:
+            resampler = rtc.AudioResampler(frame.sample_rate, self._sample_rate, num_channels=1)
+            frame = rtc.combine_audio_frames([*resampler.push(frame), *resampler.flush()])
+        language = language if is_given(language) else self._language
+
+        texts: list[str] = []
+        async with self._pool.connection(timeout=conn_options.timeout) as ws:
+            await ws.send_str(self._start_message(False, language))
+            await ws.send_bytes(frame.data.tobytes())
+            await ws.send_str(json.dumps({"type": "end"}))
+            async for message in _messages(ws, conn_options.timeout):
+                if message["type"] == "final":
+                    texts.append(message.get("text", ""))
+                elif message["type"] == "ended":
+                    break
+
+        return stt_module.SpeechEvent(
+            type=stt_module.SpeechEventType.FINAL_TRANSCRIPT,
+            alternatives=[stt_module.SpeechData(language=language, text=" ".join(filter(None, texts)))],
+        )
+
+    def stream(
+        self,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> CustomSpeechStream:
+        return CustomSpeechStream(
+            stt=self,
+            conn_options=conn_options,
+            language=language if is_given(language) else self._language,
+        )
+
+
+async def _messages(ws: aiohttp.ClientWebSocketResponse, timeout: float):
+    """Server JSON messages until the socket closes; errors become APIError."""
+    while True:
+        try:
+            msg = await asyncio.wait_for(ws.receive(), timeout)
+        except asyncio.TimeoutError as e:
+            raise APITimeoutError("custom STT: no reply from server") from e
+        if msg.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSED,
+            aiohttp.WSMsgType.CLOSING,
+            aiohttp.WSMsgType.ERROR,
+        ):
+            raise APIStatusError(
+                "custom STT: connection closed unexpectedly",
+                status_code=ws.close_code or -1,
+                body=str(msg.extra),
+            )
+        if msg.type != aiohttp.WSMsgType.TEXT:
+            continue
+        message = json.loads(msg.data)
+        if message.get("type") == "error":
+            raise APIError(f"custom STT: {message.get('message', 'server error')}")
+        yield message
+
+
+class CustomSpeechStream(stt_module.RecognizeStream):
+    def __init__(self, *, stt: CustomSTT, conn_options: APIConnectOptions, language: str) -> None:
+        super().__init__(stt=stt, conn_options=conn_options, sample_rate=stt._sample_rate)
+        self._custom_stt = stt
+        self._language = language
+        self._audio_duration = 0.0  # sent since the last usage event
+
+    async def _run(self) -> None:
+        stt = self._custom_stt
+        # A session that fails part-way removes its connection from the pool
+        async with stt._pool.connection(timeout=self._conn_options.timeout) as ws:
+            await ws.send_str(stt._start_message(True, self._language))
+            tasks = [
+                asyncio.create_task(self._send(ws)),
+                asyncio.create_task(self._recv(ws)),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except (aiohttp.ClientError, ConnectionError) as e:
+                raise APIConnectionError(f"custom STT: {e}") from e
+            finally:
+                await utils.aio.gracefully_cancel(*tasks)
+
+    async def _send(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        chunks = utils.audio.AudioByteStream(
+            sample_rate=self._custom_stt._sample_rate,
+            num_channels=1,
+            samples_per_channel=self._custom_stt._sample_rate * CHUNK_MS // 1000,
+        )
+        async for data in self._input_ch:
+            if isinstance(data, self._FlushSentinel):
+                for frame in chunks.flush():
+                    await self._send_audio(ws, frame)
+                await ws.send_str(json.dumps({"type": "finalize"}))
+                continue
+            for frame in chunks.write(data.data.tobytes()):
+                await self._send_audio(ws, frame)
+
+        for frame in chunks.flush():
+            await self._send_audio(ws, frame)
+        await ws.send_str(json.dumps({"type": "end"}))
+
+    async def _send_audio(self, ws: aiohttp.ClientWebSocketResponse, frame: rtc.AudioFrame) -> None:
+        self._audio_duration += frame.duration
+        await ws.send_bytes(frame.data.tobytes())
+
+    async def _recv(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        # Quiet stretches are normal mid-call; the heartbeat catches a dead server
+        async for message in _messages(ws, timeout=None):
+            kind = message["type"]
+            if kind == "speech_started":
+                self._event_ch.send_nowait(stt_module.SpeechEvent(type=stt_module.SpeechEventType.START_OF_SPEECH))
+            elif kind in ("interim", "final"):
+                self._send_transcript(message, final=kind == "final")
+            elif kind == "speech_ended":
+                self._event_ch.send_nowait(stt_module.SpeechEvent(type=stt_module.SpeechEventType.END_OF_SPEECH))
+                self._send_usage()
+            elif kind == "ended":
+                self._send_usage()
+                return
+
+    def _send_transcript(self, message: dict, final: bool) -> None:
+        text = message.get("text", "")
+        if not text:
+            return
+        offset = self.start_time_offset
+        self._event_ch.send_nowait(
+            stt_module.SpeechEvent(
+                type=(
+                    stt_module.SpeechEventType.FINAL_TRANSCRIPT
+                    if final
+                    else stt_module.SpeechEventType.INTERIM_TRANSCRIPT
+                ),
+                alternatives=[
+                    stt_module.SpeechData(
+                        language=self._language,
+                        text=text,
+                        confidence=message.get("confidence", 0.0),
+                        start_time=message.get("start", 0.0) + offset,
+                        end_time=message.get("end", 0.0) + offset,
+                    )
+                ],
+            )
+        )
+
+    def _send_usage(self) -> None:
+        if self._audio_duration <= 0:
+            return
+        self._event_ch.send_nowait(
+            stt_module.SpeechEvent(
+                type=stt_module.SpeechEventType.RECOGNITION_USAGE,
+                recognition_usage=stt_module.RecognitionUsage(audio_duration=self._audio_duration),
+            )
+        )
+        self._audio_duration = 0.0
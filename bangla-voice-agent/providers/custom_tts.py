@@ -0,0 +1,266 @@
+"""
+Custom streaming TTS — self-hosted Bangla voices over a websocket
+═══════════════════════════════════════════════════
+Selected with TTS_PROVIDER=custom; talks to CUSTOM_TTS_URL
+(http(s):// is used as ws(s)://). The LLM's reply is cut into sentences
+and clauses as it streams (providers/bangla_tokenizer.py) and each is
+sent as soon as it is complete, so the server starts on the first
+clause while the LLM writes the rest; audio is played as it arrives.
+
+Connections come from a per-instance pool, one synthesis context at a
+time per connection. On barge-in the agent closes the stream: the
+client tells the server to cancel the context — it stops synthesizing
+audio nobody will hear — and the connection goes back to the pool once
+the server confirms.
+
+Protocol:
+
+  client -> server
+    {"type": "start", "context_id": "...", "voice": "...",
+     "language": "bn-BD", "sample_rate": 24000}
+    {"type": "text", "context_id": "...", "text": "একটি বাক্য।"}
+    {"type": "flush", "context_id": "..."}    no more text
+    {"type": "cancel", "context_id": "..."}   drop the rest
+
+  server -> client
+    <binary>                                   16-bit mono PCM of the
+                                               current context
+    {"type": "done", "context_id": "..."}      after flush or cancel
+    {"type": "error", "message": "..."}
+
+bench/speech_stub.py serves this protocol for local testing;
+bench/tts_ttfb.py compares time to first audio with the managed
+providers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from urllib.parse import urlsplit
+
+import aiohttp
+from livekit.agents import APIConnectionError, APIError, APIStatusError, APITimeoutError, tokenize, utils
+from livekit.agents import tts as tts_module
+from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
+
+from providers.bangla_tokenizer import BanglaSentenceTokenizer
+from providers.custom_stt import HEARTBEAT, SESSION_MAX_AGE, ws_url
+
+logger = logging.getLogger("voice-agent.custom-tts")
+
+CANCEL_TIMEOUT = 2.0  # seconds to wait for the server to confirm a cancel
+
+
+class CustomTTS(tts_module.TTS):
+    def __init__(
+        self,
+        *,
+        url: str,
+        language: str,
+        voice: str = "",
+        sample_rate: int = 24000,
+        tokenizer: tokenize.SentenceTokenizer | None = None,
+        http_session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        super().__init__(
+            capabilities=tts_module.TTSCapabilities(streaming=True),
+            sample_rate=sample_rate,
+            num_channels=1,
+        )
+        self._url = ws_url(url)
+        self._language = language
+        self._voice = voice
+        self._tokenizer = tokenizer or BanglaSentenceTokenizer()
+        self._session = http_session
+        self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
+            connect_cb=self._connect_ws,
+            close_cb=self._close_ws,
+            max_session_duration=SESSION_MAX_AGE,
+        )
+        self._releasing: set[asyncio.Task] = set()
+
+    @property
+    def model(self) -> str:
+        return "custom"
+
+    @property
+    def provider(self) -> str:
+        return urlsplit(self._url).netloc
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = utils.http_context.http_session()
+        return self._session
+
+    async def _connect_ws(self, timeout: float) -> aiohttp.ClientWebSocketResponse:
+        try:
+            return await asyncio.wait_for(
+                self._ensure_session().ws_connect(self._url, heartbeat=HEARTBEAT), timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise APITimeoutError(f"custom TTS: connecting to {self._url} timed out") from e
+        except aiohttp.ClientError as e:
+            raise APIConnectionError(f"custom TTS: cannot connect to {self._url}: {e}") from e
+
+    async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await ws.close()
+
+    def _cancel_context(self, ws: aiohttp.ClientWebSocketResponse, context_id: str) -> None:
+        """Cancel an abandoned context in the background, then reuse or drop its connection."""
+
+        async def confirmed() -> None:
+            await ws.send_str(json.dumps({"type": "cancel", "context_id": context_id}))
+            async for message in _messages(ws):
+                # Audio still in flight for the cancelled context is dropped here
+                if _is_done(message, context_id):
+                    return
+
+        async def release() -> None:
+            try:
+                await asyncio.wait_for(confirmed(), CANCEL_TIMEOUT)
+            except Exception as e:
+                logger.debug(f"custom TTS: cancel of {context_id} not confirmed: {e}")
+                self._pool.remove(ws)
+            else:
+                self._pool.put(ws)
+
+        task = asyncio.create_task(release(), name="custom_tts_cancel")
+        self._releasing.add(task)
+        task.add_done_callback(self._releasing.discard)
+
+    def prewarm(self) -> None:
+        self._pool.prewarm()
+
+    async def aclose(self) -> None:
+        await utils.aio.cancel_and_wait(*self._releasing)
+        await self._pool.aclose()
+
+    def synthesize(
+        self, text: str, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> tts_module.ChunkedStream:
+        return self._synthesize_with_stream(text, conn_options=conn_options)
+
+    def stream(
+        self, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> CustomSynthesizeStream:
+        return CustomSynthesizeStream(tts=self, conn_options=conn_options)
+
+
+async def _messages(ws: aiohttp.ClientWebSocketResponse):
+    """Binary audio (bytes) and JSON control messages until the socket closes."""
+    async for msg in ws:
+        if msg.type == aiohttp.WSMsgType.BINARY:
+            yield msg.data
+        elif msg.type == aiohttp.WSMsgType.TEXT:
+            message = json.loads(msg.data)
+            if message.get("type") == "error":
+                raise APIError(f"custom TTS: {message.get('message', 'server error')}")
+            yield message
+        elif msg.type == aiohttp.WSMsgType.ERROR:
+            break
+    raise APIStatusError(
+        "custom TTS: connection closed unexpectedly", status_code=ws.close_code or -1, body=""
+    )
+
+
+def _is_done(message: bytes | dict, context_id: str) -> bool:
+    return isinstance(message, dict) and message.get("type") == "done" and message.get("context_id") == context_id
+
+
+class CustomSynthesizeStream(tts_module.SynthesizeStream):
+    def __init__(self, *, tts: CustomTTS, conn_options: APIConnectOptions) -> None:
+        super().__init__(tts=tts, conn_options=conn_options)
+        self._custom_tts = tts
+
+    async def _run(self, output_emitter: tts_module.AudioEmitter) -> None:
+        tts = self._custom_tts
+        output_emitter.initialize(
+            request_id=utils.shortuuid(),
+            sample_rate=tts.sample_rate,
+            num_channels=1,
+            mime_type="audio/pcm",
+            stream=True,
+        )
+        segments = utils.aio.Chan[tokenize.SentenceStream]()
+
+        async def tokenize_input() -> None:
+            sentences = None
+            async for data in self._input_ch:
+                if isinstance(data, str):
+                    if sentences is None:
+                        sentences = tts._tokenizer.stream()
+                        segments.send_nowait(sentences)
+                    sentences.push_text(data)
+                elif sentences is not None:
+                    sentences.end_input()
+                    sentences = None
+            if sentences is not None:
+                sentences.end_input()
+            segments.close()
+
+        async def run_segments() -> None:
+            async for sentences in segments:
+                await self._run_segment(sentences, output_emitter)
+
+        tasks = [
+            asyncio.create_task(tokenize_input()),
+            asyncio.create_task(run_segments()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await utils.aio.cancel_and_wait(*tasks)
+
+    async def _run_segment(
+        self, sentences: tokenize.SentenceStream, output_emitter: tts_module.AudioEmitter
+    ) -> None:
+        tts = self._custom_tts
+        context_id = utils.shortuuid()
+        ws = await tts._pool.get(timeout=self._conn_options.timeout)
+        done = False
+
+        async def send_text() -> None:
+            await ws.send_str(json.dumps({
+                "type": "start",
+                "context_id": context_id,
+                "voice": tts._voice,
+                "language": tts._language,
+                "sample_rate": tts.sample_rate,
+            }))
+            async for sentence in sentences:
+                self._mark_started()
+                await ws.send_str(json.dumps({"type": "text", "context_id": context_id, "text": sentence.token}))
+            await ws.send_str(json.dumps({"type": "flush", "context_id": context_id}))
+
+        async def recv_audio() -> None:
+            nonlocal done
+            async for message in _messages(ws):
+                if isinstance(message, bytes):
+                    output_emitter.push(message)
+                elif _is_done(message, context_id):
+                    done = True
+                    return
+
+        output_emitter.start_segment(segment_id=context_id)
+        tasks = [asyncio.create_task(send_text()), asyncio.create_task(recv_audio())]
+        failed = False
+        try:
+            await asyncio.gather(*tasks)
+            output_emitter.end_segment()
+        except (aiohttp.ClientError, ConnectionError) as e:
+            failed = True
+            raise APIConnectionError(f"custom TTS: {e}") from e
+        except APIError:
+            failed = True
+            raise
+        finally:
+            await utils.aio.cancel_and_wait(*tasks)
+            if done:
+                tts._pool.put(ws)
+            elif failed or ws.closed:
+                tts._pool.remove(ws)
+            else:
+                # Interrupted (barge-in) — stop the server's work on this context
+                tts._cancel_context(ws, context_id)
@@ -9,10 +9,20 @@ Change LLM_PROVIDER in .env to swap:
   deepseek  -> DeepSeek (excellent Bengali, very cheap)
   custom    -> Any OpenAI-compatible API endpoint
               (Ollama, vLLM, LM Studio, Together AI, Fireworks, etc.)
+  loadtest  -> Offline stand-in for load tests (providers/loadtest.py)
 
 Supports dynamic override via `provider` and `model` parameters
 (used by dashboard metadata bridge).
 When None, falls back to .env config (default behavior).
+
+PROMPT CACHING (LLM_PROMPT_CACHING=true):
+  Our Bangla system prompts are long and resent on every turn.
+  prompts.get_prompt() keeps the prefix stable, and here we turn on
+  whatever caching the provider offers:
+    anthropic -> explicit cache_control breakpoints (system, tools, history)
+    openai    -> automatic prefix cache + prompt_cache_key per mode
+    gemini    -> implicit caching (automatic on 2.5 models, nothing to set)
+    deepseek  -> automatic context caching on disk (nothing to set)
 """
 
 from __future__ import annotations
@@ -30,21 +40,29 @@ except ImportError:
     anthropic_plugin = None
 
 from config import config
+from providers.loadtest import LoadTestLLM
 
 logger = logging.getLogger("voice-agent.llm")
 
 
-def get_llm(provider: str | None = None, model: str | None = None) -> llm_module.LLM:
+def get_llm(
+    provider: str | None = None,
+    model: str | None = None,
+    cache_key: str | None = None,
+) -> llm_module.LLM:
     """Return the configured LLM instance.
 
     Args:
-        provider: Optional override from dashboard metadata.
-                  If None, uses LLM_PROVIDER from .env.
-        model:    Optional model name override from dashboard metadata.
-                  If None, uses the provider's default model from .env.
+        provider:  Optional override from dashboard metadata.
+                   If None, uses LLM_PROVIDER from .env.
+        model:     Optional model name override from dashboard metadata.
+                   If None, uses the provider's default model from .env.
+        cache_key: Groups requests that share a prompt prefix (e.g. the
+                   agent mode) so the provider routes them to the same cache.
     """
 
     provider = (provider or config.llm_provider).lower()
+    caching = config.llm_prompt_caching
 
     # ─────────────────────────────────────
     # Google Gemini
@@ -67,9 +85,13 @@ def get_llm(provider: str | None = None, model: str | None = None) -> llm_module
     elif provider == "openai":
         model_name = model or config.openai_model
         logger.info(f"🧠 LLM: OpenAI ({model_name})")
+        extra = {}
+        if caching and cache_key:
+            extra["prompt_cache_key"] = f"bangla-voice-{cache_key}"
         return openai_plugin.LLM(
             model=model_name,
             api_key=config.openai_api_key or None,
+            **extra,
         )
 
     # ─────────────────────────────────────
@@ -84,10 +106,17 @@ def get_llm(provider: str | None = None, model: str | None = None) -> llm_module
                 "Install: pip install livekit-plugins-anthropic"
             )
         model_name = model or config.anthropic_model
-        logger.info(f"🧠 LLM: Anthropic Claude ({model_name})")
+        logger.info(
+            f"🧠 LLM: Anthropic Claude ({model_name}, "
+            f"caching={'on' if caching else 'off'})"
+        )
+        extra = {}
+        if caching:
+            extra["caching"] = "ephemeral"
         return anthropic_plugin.LLM(
             model=model_name,
             api_key=config.anthropic_api_key or None,
+            **extra,
         )
 
     # ─────────────────────────────────────
@@ -145,8 +174,19 @@ def get_llm(provider: str | None = None, model: str | None = None) -> llm_module
             base_url=config.custom_llm_url,
         )
 
+    # ─────────────────────────────────────
+    # Load-test stand-in (no API calls)
+    # Used by bench/load_test.py
+    # ─────────────────────────────────────
+    elif provider == "loadtest":
+        logger.info(
+            f"🧠 LLM: load-test stand-in ({config.loadtest_llm_tokens_per_second:.0f} tok/s, "
+            f"TTFT {config.loadtest_llm_ttft}s)"
+        )
+        return LoadTestLLM()
+
     else:
         raise ValueError(
             f"Unknown LLM provider: '{provider}'. "
-            f"Valid options: gemini, openai, anthropic, groq, deepseek, custom"
+            f"Valid options: gemini, openai, anthropic, groq, deepseek, custom, loadtest"
         )
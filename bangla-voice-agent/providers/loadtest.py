@@ -0,0 +1,349 @@
+"""
+Load-test stand-in providers
+═══════════════════════════════════════════════════
+Offline STT/LLM/TTS with the timing of real providers, so
+bench/load_test.py can run many calls through the real entrypoint
+without Google/OpenAI keys. Selected with provider "loadtest":
+
+  STT_PROVIDER=loadtest LLM_PROVIDER=loadtest TTS_PROVIDER=loadtest
+
+  LoadTestSTT  -> streaming; detects the caller's speech by energy and
+                  answers with the next scripted line (LOADTEST_SCRIPT):
+                  interims while they talk, the final transcript
+                  LOADTEST_STT_FINAL_DELAY after they stop
+  LoadTestLLM  -> streams LOADTEST_LLM_REPLY_WORDS words after
+                  LOADTEST_LLM_TTFT at LOADTEST_LLM_TOKENS_PER_SECOND;
+                  every LOADTEST_TOOL_EVERY-th caller turn it first
+                  calls LOADTEST_TOOL (if the mode has it)
+  LoadTestTTS  -> audio after LOADTEST_TTS_TTFB, paced at real time.
+                  A quiet tone rather than silence, so the load test's
+                  callers can hear when the reply starts
+
+With LOADTEST_STATS_DIR set, every call's event loop is probed for lag
+and the samples are written there for the load test report.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+import weakref
+from pathlib import Path
+
+import numpy as np
+from livekit.agents import llm as llm_module
+from livekit.agents import stt as stt_module
+from livekit.agents import tts as tts_module
+from livekit.agents import utils
+from livekit.agents.types import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    NOT_GIVEN,
+    APIConnectOptions,
+    NotGivenOr,
+)
+
+from config import config
+
+logger = logging.getLogger("voice-agent.loadtest")
+
+DEFAULT_SCRIPT = [
+    "আসসালামু আলাইকুম, আমি একটা অ্যাপয়েন্টমেন্ট নিতে চাই",
+    "আমার নাম রহিম, নম্বর জিরো ওয়ান সেভেন ওয়ান টু",
+    "আগামীকাল বিকেলে কি সময় আছে",
+    "ঠিক আছে, চারটার সময় দিন",
+    "না, আর কিছু লাগবে না, ধন্যবাদ",
+]
+REPLY_WORDS = "জি অবশ্যই আমি দেখছি আপনার জন্য কোন সময়টা সবচেয়ে ভালো হবে একটু অপেক্ষা করুন".split()
+
+SPEECH_RMS = 500  # int16 RMS above this counts as the caller talking
+END_OF_SPEECH_SILENCE = 0.3  # seconds of quiet that end an utterance
+INTERIM_INTERVAL = 0.3  # seconds of speech between interim transcripts
+
+TTS_SECONDS_PER_CHAR = 0.06  # ~Bangla speaking rate
+TTS_CHUNK_MS = 100
+TTS_TONE_HZ = 220  # whole cycles per chunk — chunks join without clicks
+TTS_TONE_AMPLITUDE = 1000
+
+LAG_PROBE_INTERVAL = 0.1
+
+
+def _script() -> list[str]:
+    if config.loadtest_script:
+        lines = Path(config.loadtest_script).read_text(encoding="utf-8").splitlines()
+        return [line.strip() for line in lines if line.strip()] or DEFAULT_SCRIPT
+    return DEFAULT_SCRIPT
+
+
+# ═══════════════════════════════════════════════════════
+# LOOP LAG PROBE — one per call event loop
+# ═══════════════════════════════════════════════════════
+_probed_loops: weakref.WeakSet = weakref.WeakSet()
+_probe_tasks: set[asyncio.Task] = set()
+
+
+async def _probe_loop_lag(path: Path) -> None:
+    """Append one line per second: worst and mean loop lag in that second."""
+    samples: list[float] = []
+    with open(path, "a", encoding="utf-8") as f:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            samples.append(max(time.perf_counter() - start - LAG_PROBE_INTERVAL, 0.0))
+            if len(samples) * LAG_PROBE_INTERVAL >= 1.0:
+                f.write(json.dumps({
+                    "t": round(time.time(), 1),
+                    "max_ms": round(max(samples) * 1000, 2),
+                    "mean_ms": round(sum(samples) / len(samples) * 1000, 2),
+                }) + "\n")
+                f.flush()
+                samples.clear()
+
+
+def _start_lag_probe() -> None:
+    if not config.loadtest_stats_dir:
+        return
+    loop = asyncio.get_running_loop()
+    if loop in _probed_loops:
+        return
+    _probed_loops.add(loop)
+    stats_dir = Path(config.loadtest_stats_dir)
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    path = stats_dir / f"lag-{os.getpid()}-{id(loop):x}.jsonl"
+    task = loop.create_task(_probe_loop_lag(path), name="loadtest_lag_probe")
+    _probe_tasks.add(task)
+    task.add_done_callback(_probe_tasks.discard)
+
+
+# ═══════════════════════════════════════════════════════
+# STT
+# ═══════════════════════════════════════════════════════
+class LoadTestSTT(stt_module.STT):
+    def __init__(self, *, sample_rate: int | None = None) -> None:
+        super().__init__(capabilities=stt_module.STTCapabilities(streaming=True, interim_results=True))
+        self._sample_rate = sample_rate
+
+    @property
+    def model(self) -> str:
+        return "loadtest"
+
+    @property
+    def provider(self) -> str:
+        return "loadtest"
+
+    async def _recognize_impl(
+        self,
+        buffer,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> stt_module.SpeechEvent:
+        return _final_event(_script()[0])
+
+    def stream(
+        self,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> LoadTestSpeechStream:
+        _start_lag_probe()
+        return LoadTestSpeechStream(stt=self, conn_options=conn_options, sample_rate=self._sample_rate)
+
+
+def _final_event(text: str) -> stt_module.SpeechEvent:
+    return stt_module.SpeechEvent(
+        type=stt_module.SpeechEventType.FINAL_TRANSCRIPT,
+        alternatives=[stt_module.SpeechData(language=config.language, text=text, confidence=0.95)],
+    )
+
+
+class LoadTestSpeechStream(stt_module.RecognizeStream):
+    def __init__(self, *, stt: LoadTestSTT, conn_options: APIConnectOptions, sample_rate: int | None) -> None:
+        super().__init__(stt=stt, conn_options=conn_options, sample_rate=sample_rate or NOT_GIVEN)
+        self._lines = _script()
+        self._turn = 0
+
+    async def _run(self) -> None:
+        speech = 0.0  # seconds of speech in the current utterance
+        quiet = 0.0  # seconds of quiet since the caller last spoke
+        next_interim = INTERIM_INTERVAL
+        final_due: float | None = None  # wall time the final transcript is sent
+
+        async for frame in self._input_ch:
+            if isinstance(frame, self._FlushSentinel):
+                continue
+
+            if final_due is not None and time.monotonic() >= final_due:
+                self._send_final()
+                final_due = None
+
+            pcm = np.frombuffer(frame.data, dtype=np.int16)
+            talking = pcm.size and np.sqrt(np.mean(pcm.astype(np.float32) ** 2)) > SPEECH_RMS
+            if talking:
+                if speech == 0.0:
+                    self._event_ch.send_nowait(
+                        stt_module.SpeechEvent(type=stt_module.SpeechEventType.START_OF_SPEECH)
+                    )
+                speech += frame.duration
+                quiet = 0.0
+                if speech >= next_interim:
+                    next_interim += INTERIM_INTERVAL
+                    self._event_ch.send_nowait(
+                        stt_module.SpeechEvent(
+                            type=stt_module.SpeechEventType.INTERIM_TRANSCRIPT,
+                            alternatives=[
+                                stt_module.SpeechData(
+                                    language=config.language, text=self._partial(speech), confidence=0.6
+                                )
+                            ],
+                        )
+                    )
+            elif speech:
+                quiet += frame.duration
+                if quiet >= END_OF_SPEECH_SILENCE:
+                    final_due = time.monotonic() + config.loadtest_stt_final_delay
+                    speech = 0.0
+                    next_interim = INTERIM_INTERVAL
+
+        if final_due is not None:
+            self._send_final()
+
+    def _line(self) -> str:
+        return self._lines[self._turn % len(self._lines)]
+
+    def _partial(self, speech: float) -> str:
+        words = self._line().split()
+        return " ".join(words[: max(1, int(speech / INTERIM_INTERVAL))])
+
+    def _send_final(self) -> None:
+        self._event_ch.send_nowait(_final_event(self._line()))
+        self._event_ch.send_nowait(stt_module.SpeechEvent(type=stt_module.SpeechEventType.END_OF_SPEECH))
+        self._turn += 1
+
+
+# ═══════════════════════════════════════════════════════
+# LLM
+# ═══════════════════════════════════════════════════════
+class LoadTestLLM(llm_module.LLM):
+    @property
+    def model(self) -> str:
+        return "loadtest"
+
+    @property
+    def provider(self) -> str:
+        return "loadtest"
+
+    def chat(
+        self,
+        *,
+        chat_ctx: llm_module.ChatContext,
+        tools: list | None = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        **kwargs,
+    ) -> LoadTestLLMStream:
+        return LoadTestLLMStream(self, chat_ctx=chat_ctx, tools=tools or [], conn_options=conn_options)
+
+
+class LoadTestLLMStream(llm_module.LLMStream):
+    async def _run(self) -> None:
+        request_id = utils.shortuuid("loadtest-")
+        items = self._chat_ctx.items
+        prompt_tokens = sum(len(str(getattr(item, "content", ""))) for item in items) // 4
+        await asyncio.sleep(config.loadtest_llm_ttft)
+
+        turns = sum(1 for item in items if item.type == "message" and item.role == "user")
+        after_tool = bool(items) and items[-1].type == "function_call_output"
+        tool_names = {getattr(tool, "id", None) for tool in self._tools}
+        every = config.loadtest_tool_every
+        if every and turns and turns % every == 0 and not after_tool and config.loadtest_tool in tool_names:
+            self._event_ch.send_nowait(
+                llm_module.ChatChunk(
+                    id=request_id,
+                    delta=llm_module.ChoiceDelta(
+                        role="assistant",
+                        tool_calls=[
+                            llm_module.FunctionToolCall(
+                                name=config.loadtest_tool,
+                                arguments=config.loadtest_tool_args,
+                                call_id=utils.shortuuid("call_"),
+                            )
+                        ],
+                    ),
+                )
+            )
+            self._send_usage(request_id, prompt_tokens, 1)
+            return
+
+        words = config.loadtest_llm_reply_words
+        for i in range(words):
+            word = REPLY_WORDS[i % len(REPLY_WORDS)]
+            self._event_ch.send_nowait(
+                llm_module.ChatChunk(
+                    id=request_id,
+                    delta=llm_module.ChoiceDelta(role="assistant", content=word + ("।" if i == words - 1 else " ")),
+                )
+            )
+            await asyncio.sleep(1 / config.loadtest_llm_tokens_per_second)
+        self._send_usage(request_id, prompt_tokens, words)
+
+    def _send_usage(self, request_id: str, prompt_tokens: int, completion_tokens: int) -> None:
+        self._event_ch.send_nowait(
+            llm_module.ChatChunk(
+                id=request_id,
+                usage=llm_module.CompletionUsage(
+                    completion_tokens=completion_tokens,
+                    prompt_tokens=prompt_tokens,
+                    total_tokens=prompt_tokens + completion_tokens,
+                ),
+            )
+        )
+
+
+# ═══════════════════════════════════════════════════════
+# TTS
+# ═══════════════════════════════════════════════════════
+class LoadTestTTS(tts_module.TTS):
+    def __init__(self, *, sample_rate: int = 24000) -> None:
+        super().__init__(
+            capabilities=tts_module.TTSCapabilities(streaming=False),
+            sample_rate=sample_rate,
+            num_channels=1,
+        )
+        samples = sample_rate * TTS_CHUNK_MS // 1000
+        t = np.arange(samples) / sample_rate
+        self._chunk = (np.sin(2 * np.pi * TTS_TONE_HZ * t) * TTS_TONE_AMPLITUDE).astype(np.int16).tobytes()
+
+    @property
+    def model(self) -> str:
+        return "loadtest"
+
+    @property
+    def provider(self) -> str:
+        return "loadtest"
+
+    def synthesize(
+        self, text: str, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> LoadTestChunkedStream:
+        return LoadTestChunkedStream(tts=self, input_text=text, conn_options=conn_options)
+
+
+class LoadTestChunkedStream(tts_module.ChunkedStream):
+    async def _run(self, output_emitter: tts_module.AudioEmitter) -> None:
+        tts: LoadTestTTS = self._tts
+        output_emitter.initialize(
+            request_id=utils.shortuuid("loadtest-"),
+            sample_rate=tts.sample_rate,
+            num_channels=1,
+            mime_type="audio/pcm",
+        )
+        await asyncio.sleep(config.loadtest_tts_ttfb)
+
+        chunks = max(1, round(len(self._input_text) * TTS_SECONDS_PER_CHAR * 1000 / TTS_CHUNK_MS))
+        start = time.perf_counter()
+        for i in range(chunks):
+            output_emitter.push(tts._chunk)
+            # Real time: chunk i+1 is due (i+1) chunk lengths after the first
+            await asyncio.sleep(max(0.0, start + (i + 1) * TTS_CHUNK_MS / 1000 - time.perf_counter()))
+        output_emitter.flush()
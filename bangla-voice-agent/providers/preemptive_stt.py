@@ -0,0 +1,202 @@
+"""
+Preemptive generation on stable interim transcripts
+═══════════════════════════════════════════════════
+Our callers often answer in one or two words ("জি", a name, a date).
+Normally the LLM only starts after the FINAL transcript and the
+end-of-turn decision. With PREEMPTIVE_GENERATION=true:
+
+  1. StableInterimSTT wraps the streaming STT. When an interim transcript
+     hasn't changed for PREEMPTIVE_STABLE_WINDOW seconds, it emits a
+     PREFLIGHT transcript.
+  2. AgentSession(preemptive_generation=True) starts the LLM reply (and
+     TTS) on that preflight, but holds it until end of turn.
+  3. If the final transcript is the same apart from punctuation/spacing,
+     the final is rewritten to match so the held reply is used. If it
+     differs materially, the session cancels it and generates again.
+
+Every preflight ends up either used (hit) or thrown away (waste);
+both are counted in stats.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import re
+from typing import Any, AsyncIterable
+
+from livekit.agents import stt as stt_module
+from livekit.agents.stt import RecognizeStream, SpeechEvent, SpeechEventType
+from livekit.agents.types import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    NOT_GIVEN,
+    APIConnectOptions,
+    NotGivenOr,
+)
+
+from stats import record_preflight
+
+logger = logging.getLogger("voice-agent.stt.preemptive")
+
+# The wrapped STT retries on its own — don't retry twice
+_NO_RETRY = APIConnectOptions(max_retry=0, timeout=DEFAULT_API_CONNECT_OPTIONS.timeout)
+
+_NOISE = re.compile(r"[\s।,.?!'\"-]+")
+
+
+def _same_words(a: str, b: str) -> bool:
+    """True if two transcripts differ only in punctuation, spacing or case."""
+    return _NOISE.sub(" ", a).strip().lower() == _NOISE.sub(" ", b).strip().lower()
+
+
+class StableInterimSTT(stt_module.STT):
+    """Streaming STT wrapper that turns stable interim transcripts into preflights."""
+
+    def __init__(self, stt: stt_module.STT, *, stable_window: float = 0.3) -> None:
+        super().__init__(capabilities=stt.capabilities)
+        self._stt = stt
+        self._stable_window = stable_window
+        self._stt.on("metrics_collected", self._on_metrics_collected)
+
+    @property
+    def wrapped_stt(self) -> stt_module.STT:
+        return self._stt
+
+    @property
+    def model(self) -> str:
+        return self._stt.model
+
+    @property
+    def provider(self) -> str:
+        return self._stt.provider
+
+    async def _recognize_impl(
+        self,
+        buffer,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> SpeechEvent:
+        return await self._stt.recognize(
+            buffer=buffer, language=language, conn_options=conn_options
+        )
+
+    def stream(
+        self,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> RecognizeStream:
+        return _StableInterimStream(
+            self,
+            wrapped_stt=self._stt,
+            stable_window=self._stable_window,
+            language=language,
+            conn_options=conn_options,
+        )
+
+    def _on_metrics_collected(self, *args: Any, **kwargs: Any) -> None:
+        self.emit("metrics_collected", *args, **kwargs)
+
+    async def aclose(self) -> None:
+        self._stt.off("metrics_collected", self._on_metrics_collected)
+
+
+class _StableInterimStream(RecognizeStream):
+    def __init__(
+        self,
+        stt: StableInterimSTT,
+        *,
+        wrapped_stt: stt_module.STT,
+        stable_window: float,
+        language: NotGivenOr[str],
+        conn_options: APIConnectOptions,
+    ) -> None:
+        super().__init__(stt=stt, conn_options=_NO_RETRY)
+        self._wrapped_stt = wrapped_stt
+        self._wrapped_conn_options = conn_options
+        self._language = language
+        self._stable_window = stable_window
+
+    async def _metrics_monitor_task(self, event_aiter: AsyncIterable[SpeechEvent]) -> None:
+        # The wrapped stream reports its own metrics
+        async for _ in event_aiter:
+            pass
+
+    async def _run(self) -> None:
+        inner = self._wrapped_stt.stream(
+            language=self._language, conn_options=self._wrapped_conn_options
+        )
+        loop = asyncio.get_running_loop()
+        timer: asyncio.TimerHandle | None = None
+        interim_text = ""
+        preflight: stt_module.SpeechData | None = None
+
+        def _fire(alternative: stt_module.SpeechData) -> None:
+            nonlocal preflight
+            if preflight is not None:
+                record_preflight(hit=False)  # superseded by a newer preflight
+            preflight = alternative
+            logger.debug(f"preflight transcript: {alternative.text}")
+            self._event_ch.send_nowait(
+                SpeechEvent(
+                    type=SpeechEventType.PREFLIGHT_TRANSCRIPT,
+                    alternatives=[alternative],
+                )
+            )
+
+        async def _forward_input() -> None:
+            async for data in self._input_ch:
+                if isinstance(data, self._FlushSentinel):
+                    inner.flush()
+                    continue
+                inner.push_frame(data)
+            inner.end_input()
+
+        async def _forward_events() -> None:
+            nonlocal timer, interim_text, preflight
+            async for ev in inner:
+                if ev.type == SpeechEventType.INTERIM_TRANSCRIPT and ev.alternatives:
+                    alternative = ev.alternatives[0]
+                    if not _same_words(alternative.text, interim_text):
+                        interim_text = alternative.text
+                        if timer:
+                            timer.cancel()
+                        timer = None
+                        if alternative.text.strip():
+                            timer = loop.call_later(self._stable_window, _fire, alternative)
+
+                elif ev.type == SpeechEventType.FINAL_TRANSCRIPT and ev.alternatives:
+                    if timer:
+                        timer.cancel()
+                    timer = None
+                    final = ev.alternatives[0]
+                    if preflight is not None:
+                        hit = _same_words(preflight.text, final.text)
+                        record_preflight(hit=hit)
+                        if hit:
+                            # Same words — keep the preflight's exact text so the
+                            # session reuses the reply it already generated
+                            ev = dataclasses.replace(
+                                ev,
+                                alternatives=[dataclasses.replace(final, text=preflight.text)],
+                            )
+                    interim_text = ""
+                    preflight = None
+
+                self._event_ch.send_nowait(ev)
+
+        tasks = [
+            asyncio.create_task(_forward_input(), name="forward_input"),
+            asyncio.create_task(_forward_events(), name="forward_events"),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            if timer:
+                timer.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await inner.aclose()
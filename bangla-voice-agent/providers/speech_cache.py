@@ -0,0 +1,131 @@
+"""
+Scripted Speech Cache
+═══════════════════════════════════════════════════
+Speaks fixed lines (greeting, silence nudges, farewell) directly
+through TTS — no LLM round trip, no paraphrasing.
+
+Each line is synthesized once per voice and machine: the first time it
+is spoken, the TTS stream is played to the caller and its frames are
+kept as they play. A complete line is written to SPEECH_CACHE_DIR, so
+every later call — in this or any other worker process (the default
+executor starts one per call) — replays it from disk without calling
+TTS, and the greeting starts without waiting for TTS either.
+
+Key = (voice_key, text), where voice_key is the TTS instance's resolved
+voice (tts_factory.voice_key: provider, model, voice, rate/pitch, sample
+rate) — a voice change in .env gets new recordings. Only fixed lines belong here: arbitrary text (the
+dashboard's first_message) goes to session.say() directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import AsyncIterable
+
+from livekit import rtc
+from livekit.agents.voice import AgentSession, SpeechHandle
+from livekit.agents import tts as tts_module
+
+from config import config
+from providers.bangla_verbalizer import verbalize
+
+logger = logging.getLogger("voice-agent.speech-cache")
+
+SPEECH_CACHE_DIR = Path(os.getenv("SPEECH_CACHE_DIR", Path(tempfile.gettempdir()) / "bangla-voice-speech"))
+FRAME_MS = 20
+
+_rendered: dict[tuple[str, str], tuple[rtc.AudioFrame, ...]] = {}
+
+
+def _cache_file(key: tuple[str, str], sample_rate: int, num_channels: int) -> Path:
+    digest = hashlib.sha256("\n".join(key).encode("utf-8")).hexdigest()[:32]
+    return SPEECH_CACHE_DIR / f"{digest}-{sample_rate}-{num_channels}.pcm"
+
+
+def _load(cache_file: Path, sample_rate: int, num_channels: int) -> tuple[rtc.AudioFrame, ...] | None:
+    try:
+        pcm = cache_file.read_bytes()
+    except OSError:
+        return None
+    samples = sample_rate * FRAME_MS // 1000
+    step = samples * num_channels * 2
+    return tuple(
+        rtc.AudioFrame(
+            data=pcm[i : i + step],
+            sample_rate=sample_rate,
+            num_channels=num_channels,
+            samples_per_channel=len(pcm[i : i + step]) // (num_channels * 2),
+        )
+        for i in range(0, len(pcm), step)
+    )
+
+
+def _store(cache_file: Path, frames: list[rtc.AudioFrame]) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(b"".join(bytes(frame.data) for frame in frames))
+        os.replace(tmp, cache_file)  # atomic — concurrent workers never see half a file
+    except OSError as e:
+        logger.warning(f"💾 Could not write speech cache {cache_file}: {e}")
+
+
+async def _synthesize_and_keep(
+    tts: tts_module.TTS, key: tuple[str, str], cache_file: Path
+) -> AsyncIterable[rtc.AudioFrame]:
+    """Play the line from TTS, keeping its frames — one synthesis for playout and cache."""
+    text = key[1]
+    # Same words as a live line, which the session's text transforms verbalize
+    spoken = verbalize(text) if config.language.startswith("bn") else text
+    frames = []
+    async with tts.synthesize(spoken) as stream:
+        async for audio in stream:
+            frames.append(audio.frame)
+            yield audio.frame
+    # Not reached when an interruption closes the stream early — half a line isn't kept
+    _rendered[key] = tuple(frames)
+    await asyncio.to_thread(_store, cache_file, frames)
+    logger.info(f"💾 Cached scripted line ({len(frames)} frames): {text[:40]}...")
+
+
+async def _audio(tts: tts_module.TTS, key: tuple[str, str]) -> AsyncIterable[rtc.AudioFrame]:
+    """The line's cached frames (memory, then disk), else a fresh synthesis."""
+    cache_file = _cache_file(key, tts.sample_rate, tts.num_channels)
+    frames = _rendered.get(key)
+    if frames is None:
+        frames = await asyncio.to_thread(_load, cache_file, tts.sample_rate, tts.num_channels)
+    if frames is None:
+        async for frame in _synthesize_and_keep(tts, key, cache_file):
+            yield frame
+        return
+    _rendered[key] = frames
+    for frame in frames:
+        yield frame
+
+
+def say_scripted(
+    session: AgentSession,
+    text: str,
+    *,
+    voice_key: str,
+    allow_interruptions: bool = True,
+) -> SpeechHandle:
+    """Speak a fixed line verbatim, bypassing the LLM.
+
+    The line is still added to the chat history.
+
+    Args:
+        session:   Running AgentSession
+        text:      Exact words to speak — fixed lines only, see the module docstring
+        voice_key: tts_factory.voice_key() of the session's TTS (cache key)
+        allow_interruptions: Whether the caller can barge in
+    """
+    tts = session.tts
+    if tts is None:
+        return session.say(text, allow_interruptions=allow_interruptions)
+    return session.say(text, audio=_audio(tts, (voice_key, text)), allow_interruptions=allow_interruptions)
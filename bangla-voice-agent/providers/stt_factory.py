@@ -7,10 +7,14 @@ Change STT_PROVIDER in .env to swap:
   deepgram    -> Deepgram Nova-3 (fast, limited Bengali)
   elevenlabs  -> ElevenLabs Scribe (multilingual)
   assemblyai  -> AssemblyAI Universal-2 (good accuracy)
-  custom      -> Any custom STT endpoint
+  custom      -> Self-hosted streaming ASR (providers/custom_stt.py)
+  loadtest    -> Offline stand-in for load tests (providers/loadtest.py)
 
 Supports dynamic override via `provider` parameter (used by dashboard metadata bridge).
 When `provider` is None, falls back to .env config (default behavior).
+
+`sample_rate` asks the provider to take audio at that rate (8 kHz for SIP
+calls, see providers/audio_profile.py) so frames aren't resampled first.
 """
 
 from __future__ import annotations
@@ -42,20 +46,30 @@ except ImportError:
     assemblyai_plugin = None
 
 from config import config
+from providers.custom_stt import CustomSTT
+from providers.loadtest import LoadTestSTT
 
 logger = logging.getLogger("voice-agent.stt")
 
 
-def get_stt(provider: str | None = None) -> stt_module.STT:
+def _rate(sample_rate: int | None) -> str:
+    return f", {sample_rate} Hz" if sample_rate else ""
+
+
+def get_stt(provider: str | None = None, sample_rate: int | None = None) -> stt_module.STT:
     """Return the configured STT instance.
 
     Args:
-        provider: Optional override from dashboard metadata.
-                  If None, uses STT_PROVIDER from .env (default behavior).
+        provider:    Optional override from dashboard metadata.
+                     If None, uses STT_PROVIDER from .env (default behavior).
+        sample_rate: Optional input rate from the call's audio profile.
+                     If None, uses the provider's default.
     """
 
     provider = (provider or config.stt_provider).lower()
     language = config.language
+    # All providers below accept 8 kHz and 16 kHz PCM
+    audio = {"sample_rate": sample_rate} if sample_rate else {}
 
     # ─────────────────────────────────────
     # Google Cloud Speech-to-Text
@@ -63,7 +77,7 @@ def get_stt(provider: str | None = None) -> stt_module.STT:
     # Requires: GOOGLE_APPLICATION_CREDENTIALS
     # ─────────────────────────────────────
     if provider == "google":
-        logger.info(f"🎤 STT: Google Cloud Speech-to-Text (language={language})")
+        logger.info(f"🎤 STT: Google Cloud Speech-to-Text (language={language}{_rate(sample_rate)})")
         creds_file = config.google_credentials
         if not creds_file:
             raise ValueError(
@@ -73,6 +87,7 @@ def get_stt(provider: str | None = None) -> stt_module.STT:
         return google_plugin.STT(
             languages=[language],
             credentials_file=creds_file,
+            **audio,
         )
 
     # ─────────────────────────────────────
@@ -90,11 +105,15 @@ def get_stt(provider: str | None = None) -> stt_module.STT:
             raise ValueError(
                 "Azure STT requires AZURE_SPEECH_KEY and AZURE_SPEECH_REGION in .env"
             )
-        logger.info(f"🎤 STT: Azure Speech Services (language={language}, region={config.azure_speech_region})")
+        logger.info(
+            f"🎤 STT: Azure Speech Services (language={language}, "
+            f"region={config.azure_speech_region}{_rate(sample_rate)})"
+        )
         return azure_plugin.STT(
             speech_key=config.azure_speech_key,
             speech_region=config.azure_speech_region,
             languages=[language],
+            **audio,
         )
 
     # ─────────────────────────────────────
@@ -108,11 +127,12 @@ def get_stt(provider: str | None = None) -> stt_module.STT:
                 "Deepgram STT requires livekit-plugins-deepgram. "
                 "Install: pip install livekit-plugins-deepgram"
             )
-        logger.info(f"🎤 STT: Deepgram Nova-3 (language={language})")
+        logger.info(f"🎤 STT: Deepgram Nova-3 (language={language}{_rate(sample_rate)})")
         return deepgram_plugin.STT(
             api_key=config.deepgram_api_key or None,
             language=language,
             model="nova-3",
+            **audio,
         )
 
     # ─────────────────────────────────────
@@ -127,10 +147,11 @@ def get_stt(provider: str | None = None) -> stt_module.STT:
                 "Install: pip install livekit-plugins-elevenlabs"
             )
         lang_code = language.split("-")[0]  # bn-BD -> bn
-        logger.info(f"🎤 STT: ElevenLabs Scribe (language={lang_code})")
+        logger.info(f"🎤 STT: ElevenLabs Scribe (language={lang_code}{_rate(sample_rate)})")
         return elevenlabs_plugin.STT(
             api_key=config.eleven_api_key or None,
             language_code=lang_code,
+            **audio,
         )
 
     # ─────────────────────────────────────
@@ -144,27 +165,37 @@ def get_stt(provider: str | None = None) -> stt_module.STT:
                 "AssemblyAI STT requires livekit-plugins-assemblyai. "
                 "Install: pip install livekit-plugins-assemblyai"
             )
-        logger.info(f"🎤 STT: AssemblyAI Universal-2 (language={language})")
+        logger.info(f"🎤 STT: AssemblyAI Universal-2 (language={language}{_rate(sample_rate)})")
         return assemblyai_plugin.STT(
             api_key=config.assemblyai_api_key or None,
             language=language,
+            **audio,
         )
 
+    # ─────────────────────────────────────
+    # Load-test stand-in (no API calls)
+    # Used by bench/load_test.py
+    # ─────────────────────────────────────
+    elif provider == "loadtest":
+        logger.info(f"🎤 STT: load-test stand-in{_rate(sample_rate)}")
+        return LoadTestSTT(**audio)
+
     # ─────────────────────────────────────
     # Custom STT endpoint
-    # For self-hosted or local models
+    # Self-hosted Bangla ASR on the LAN, streamed over a websocket
+    # Requires: CUSTOM_STT_URL
     # ─────────────────────────────────────
     elif provider == "custom":
-        logger.warning(
-            "⚠️  Custom STT not yet implemented. Using Google Cloud STT as fallback."
-        )
-        return google_plugin.STT(
-            languages=[language],
-            credentials_file=config.google_credentials,
+        logger.info(f"🎤 STT: Custom ({config.custom_stt_url}, language={language}{_rate(sample_rate)})")
+        return CustomSTT(
+            url=config.custom_stt_url,
+            language=language,
+            endpointing_ms=config.custom_stt_endpointing_ms,
+            **audio,
         )
 
     else:
         raise ValueError(
             f"Unknown STT provider: '{provider}'. "
-            f"Valid options: google, azure, deepgram, elevenlabs, assemblyai, custom"
+            f"Valid options: google, azure, deepgram, elevenlabs, assemblyai, custom, loadtest"
         )
@@ -8,17 +8,32 @@ Change TTS_PROVIDER in .env to swap:
   elevenlabs  -> ElevenLabs (best quality, expensive)
   openai      -> OpenAI TTS (tone control, limited Bengali)
   cartesia    -> Cartesia Sonic-3 (ultra-low latency)
-  custom      -> Any custom TTS endpoint
+  custom      -> Self-hosted streaming TTS (providers/custom_tts.py)
+  loadtest    -> Offline stand-in for load tests (providers/loadtest.py)
 
 Supports dynamic override via `provider` and `voice` parameters
 (used by dashboard metadata bridge).
 When None, falls back to .env config (default behavior).
+
+voice_key(tts) names the resolved voice of an instance made here —
+provider, model, voice, rate/pitch and output sample rate — so cached
+audio (providers/speech_cache.py) never outlives a voice change.
+
+`sample_rate` asks the provider to render at that rate (8 kHz for SIP
+calls, see providers/audio_profile.py). Providers with a fixed output
+rate ignore it and the room output resamples as before.
+
+Every provider splits the streamed LLM reply with the Bangla-aware
+tokenizer (providers/bangla_tokenizer.py): streaming providers use it
+as their tokenizer (CustomTTS by default), the others are returned wrapped in a StreamAdapter
+that uses it.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+import weakref
 from livekit.agents import tts as tts_module
 
 from livekit.plugins import google as google_plugin
@@ -40,9 +55,40 @@ except ImportError:
     azure_plugin = None
 
 from config import config
+from providers.bangla_tokenizer import BanglaSentenceTokenizer
+from providers.custom_tts import CustomTTS
+from providers.loadtest import LoadTestTTS
 
 logger = logging.getLogger("voice-agent.tts")
 
+# ElevenLabs raw PCM output formats by sample rate (skips MP3 decoding too)
+ELEVENLABS_PCM_ENCODINGS = {8000: "pcm_8000", 16000: "pcm_16000"}
+
+
+# Instance -> its resolved voice settings, see voice_key()
+_voices: weakref.WeakKeyDictionary[tts_module.TTS, tuple] = weakref.WeakKeyDictionary()
+
+
+def _voiced(tts: tts_module.TTS, *settings) -> tts_module.TTS:
+    """Remember the settings that decide how `tts` sounds."""
+    _voices[tts] = settings
+    return tts
+
+
+def voice_key(tts: tts_module.TTS) -> str:
+    """Provider, model, voice, rate/pitch and sample rate of an instance from get_tts()."""
+    settings = _voices.get(tts, (type(tts).__name__,))
+    return ":".join(str(s) for s in (*settings, tts.sample_rate, tts.num_channels))
+
+
+def _rate(sample_rate: int | None) -> str:
+    return f", {sample_rate} Hz" if sample_rate else ""
+
+
+def _sentence_streamed(tts: tts_module.TTS) -> tts_module.TTS:
+    """Stream a non-streaming provider sentence by sentence (clause by clause)."""
+    return tts_module.StreamAdapter(tts=tts, sentence_tokenizer=BanglaSentenceTokenizer())
+
 
 def _extract_language_from_voice(voice_name: str, fallback: str) -> str:
     """Extract language code from voice name like 'bn-IN-Chirp3-HD-Kore' -> 'bn-IN'.
@@ -53,17 +99,24 @@ def _extract_language_from_voice(voice_name: str, fallback: str) -> str:
     return fallback
 
 
-def get_tts(provider: str | None = None, voice: str | None = None) -> tts_module.TTS:
+def get_tts(
+    provider: str | None = None,
+    voice: str | None = None,
+    sample_rate: int | None = None,
+) -> tts_module.TTS:
     """Return the configured TTS instance.
 
     Args:
-        provider: Optional override from dashboard metadata.
-                  If None, uses TTS_PROVIDER from .env.
-        voice:    Optional voice name override from dashboard metadata.
-                  If None, uses the provider's default voice from .env.
+        provider:    Optional override from dashboard metadata.
+                     If None, uses TTS_PROVIDER from .env.
+        voice:       Optional voice name override from dashboard metadata.
+                     If None, uses the provider's default voice from .env.
+        sample_rate: Optional output rate from the call's audio profile.
+                     If None, uses the provider's default.
     """
 
     provider = (provider or config.tts_provider).lower()
+    audio = {"sample_rate": sample_rate} if sample_rate else {}
 
     # ─────────────────────────────────────
     # Google Cloud TTS (Chirp3-HD)
@@ -76,7 +129,7 @@ def get_tts(provider: str | None = None, voice: str | None = None) -> tts_module
             voice_name, config.language
         )
         logger.info(
-            f"🔊 TTS: Google Cloud ({voice_name}, language={tts_language})"
+            f"🔊 TTS: Google Cloud ({voice_name}, language={tts_language}{_rate(sample_rate)})"
         )
         creds_file = config.google_credentials
         if not creds_file:
@@ -84,12 +137,17 @@ def get_tts(provider: str | None = None, voice: str | None = None) -> tts_module
                 "Google Cloud TTS requires GOOGLE_APPLICATION_CREDENTIALS "
                 "pointing to your service account JSON file in .env"
             )
-        return google_plugin.TTS(
-            voice_name=voice_name,
-            language=tts_language,
-            speaking_rate=config.google_tts_speaking_rate,
-            pitch=config.google_tts_pitch,
-            credentials_file=creds_file,
+        return _voiced(
+            google_plugin.TTS(
+                voice_name=voice_name,
+                language=tts_language,
+                speaking_rate=config.google_tts_speaking_rate,
+                pitch=config.google_tts_pitch,
+                credentials_file=creds_file,
+                tokenizer=BanglaSentenceTokenizer(),
+                **audio,
+            ),
+            provider, voice_name, tts_language, config.google_tts_speaking_rate, config.google_tts_pitch,
         )
 
     # ─────────────────────────────────────
@@ -98,10 +156,15 @@ def get_tts(provider: str | None = None, voice: str | None = None) -> tts_module
     # ─────────────────────────────────────
     elif provider == "gemini":
         voice_name = voice or "Kore"
-        logger.info(f"🔊 TTS: Gemini TTS (voice={voice_name})")
-        return google_plugin.TTS(
-            voice_name=voice_name,
-            api_key=config.google_api_key or None,
+        logger.info(f"🔊 TTS: Gemini TTS (voice={voice_name}{_rate(sample_rate)})")
+        return _voiced(
+            google_plugin.TTS(
+                voice_name=voice_name,
+                api_key=config.google_api_key or None,
+                tokenizer=BanglaSentenceTokenizer(),
+                **audio,
+            ),
+            provider, voice_name,
         )
 
     # ─────────────────────────────────────
@@ -122,12 +185,16 @@ def get_tts(provider: str | None = None, voice: str | None = None) -> tts_module
         voice_name = voice or config.azure_tts_voice
         logger.info(
             f"🔊 TTS: Azure Neural ({voice_name}, "
-            f"region={config.azure_speech_region})"
+            f"region={config.azure_speech_region}{_rate(sample_rate)})"
         )
-        return azure_plugin.TTS(
-            speech_key=config.azure_speech_key,
-            speech_region=config.azure_speech_region,
-            voice=voice_name,
+        return _voiced(
+            _sentence_streamed(azure_plugin.TTS(
+                speech_key=config.azure_speech_key,
+                speech_region=config.azure_speech_region,
+                voice=voice_name,
+                **audio,
+            )),
+            provider, voice_name,
         )
 
     # ─────────────────────────────────────
@@ -146,30 +213,40 @@ def get_tts(provider: str | None = None, voice: str | None = None) -> tts_module
         lang_short = config.language.split("-")[0]
         lang_code = LANG_MAP.get(lang_short, lang_short)
         voice_id = voice or config.eleven_voice_id
+        encoding = ELEVENLABS_PCM_ENCODINGS.get(sample_rate)
         logger.info(
             f"🔊 TTS: ElevenLabs ({config.eleven_model}, "
-            f"voice={voice_id}, lang={lang_code})"
+            f"voice={voice_id}, lang={lang_code}{_rate(sample_rate if encoding else None)})"
         )
-        return elevenlabs_plugin.TTS(
-            api_key=config.eleven_api_key or None,
-            voice_id=voice_id,
-            model=config.eleven_model,
-            language=lang_code,
+        return _voiced(
+            elevenlabs_plugin.TTS(
+                api_key=config.eleven_api_key or None,
+                voice_id=voice_id,
+                model=config.eleven_model,
+                language=lang_code,
+                word_tokenizer=BanglaSentenceTokenizer(),
+                **({"encoding": encoding} if encoding else {}),
+            ),
+            provider, config.eleven_model, voice_id, lang_code,
         )
 
     # ─────────────────────────────────────
     # OpenAI TTS
     # Tone-controlled, limited Bengali
+    # Fixed 24 kHz output — sample_rate is ignored
     # Requires: OPENAI_API_KEY
     # ─────────────────────────────────────
     elif provider == "openai":
         voice_name = voice or "coral"
         logger.info(f"🔊 TTS: OpenAI (gpt-4o-mini-tts, voice={voice_name})")
-        return openai_plugin.TTS(
-            model="gpt-4o-mini-tts",
-            voice=voice_name,
-            instructions="Speak in a warm, friendly, and professional tone. "
-            "Match the emotional context of what you are saying.",
+        return _voiced(
+            _sentence_streamed(openai_plugin.TTS(
+                model="gpt-4o-mini-tts",
+                voice=voice_name,
+                instructions="Speak in a warm, friendly, and professional tone. "
+                "Match the emotional context of what you are saying.",
+            )),
+            provider, "gpt-4o-mini-tts", voice_name,
         )
 
     # ─────────────────────────────────────
@@ -183,29 +260,48 @@ def get_tts(provider: str | None = None, voice: str | None = None) -> tts_module
                 "Cartesia TTS requires livekit-plugins-cartesia. "
                 "Install: pip install livekit-plugins-cartesia"
             )
-        logger.info("🔊 TTS: Cartesia Sonic-3 (ultra-low latency)")
-        return cartesia_plugin.TTS(
-            api_key=config.cartesia_api_key or None,
-            model="sonic-3",
-            language=config.language.split("-")[0],
+        logger.info(f"🔊 TTS: Cartesia Sonic-3 (ultra-low latency{_rate(sample_rate)})")
+        return _voiced(
+            cartesia_plugin.TTS(
+                api_key=config.cartesia_api_key or None,
+                model="sonic-3",
+                language=config.language.split("-")[0],
+                tokenizer=BanglaSentenceTokenizer(),
+                **audio,
+            ),
+            provider, "sonic-3", config.language.split("-")[0],
         )
 
+    # ─────────────────────────────────────
+    # Load-test stand-in (no API calls)
+    # Used by bench/load_test.py
+    # ─────────────────────────────────────
+    elif provider == "loadtest":
+        logger.info(f"🔊 TTS: load-test stand-in{_rate(sample_rate)}")
+        return _voiced(_sentence_streamed(LoadTestTTS(**audio)), provider)
+
     # ─────────────────────────────────────
     # Custom TTS endpoint
-    # For self-hosted or local models
+    # Self-hosted Bangla voices on the LAN, streamed over a websocket
+    # Requires: CUSTOM_TTS_URL
     # ─────────────────────────────────────
     elif provider == "custom":
-        logger.warning(
-            "⚠️  Custom TTS not yet implemented. Using Google Cloud TTS as fallback."
+        voice_name = voice or config.custom_tts_voice
+        logger.info(
+            f"🔊 TTS: Custom ({config.custom_tts_url}, voice={voice_name or 'default'}{_rate(sample_rate)})"
         )
-        return google_plugin.TTS(
-            voice_name=config.google_tts_voice,
-            language=config.language,
-            credentials_file=config.google_credentials,
+        return _voiced(
+            CustomTTS(
+                url=config.custom_tts_url,
+                language=config.language,
+                voice=voice_name,
+                sample_rate=sample_rate or config.custom_tts_sample_rate,
+            ),
+            provider, config.custom_tts_url, voice_name or "default", config.language,
         )
 
     else:
         raise ValueError(
             f"Unknown TTS provider: '{provider}'. "
-            f"Valid options: google, gemini, azure, elevenlabs, openai, cartesia, custom"
+            f"Valid options: google, gemini, azure, elevenlabs, openai, cartesia, custom, loadtest"
         )
@@ -0,0 +1,170 @@
+"""
+SIP transfer — connect the caller to a person in a department.
+
+transfer_to_department and escalate_to_human (tools/transfer.py) look
+the department up in TRANSFER_TARGETS (department -> phone number or SIP
+URI; tenants can have their own in tenants.toml) and transfer warm:
+
+  1. pre-dial   as soon as the tool is called, the target is dialed into
+                the call's room through SIP_OUTBOUND_TRUNK_ID
+                (CreateSIPParticipant, waiting for the answer) while the
+                agent is still speaking its handoff line
+  2. bridge     once the line has played out and the person has answered,
+                the agent leaves; caller and person stay in the room and
+                hear each other
+  3. fallback   no answer within TRANSFER_RING_TIMEOUT, a dial error or no
+                outbound trunk: the caller's own SIP leg is transferred
+                (TransferSIPParticipant, a SIP REFER) — a cold transfer
+If the cold transfer fails too, the tool tells the LLM so it can offer
+a callback instead.
+
+Handoff latency — handoff line played out -> caller connected (bridged,
+or REFER accepted) — is logged per transfer and reported by stats.py.
+bench/sip_transfer.py measures it against a local stand-in for the
+LiveKit server API (bench/livekit_api_stub.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Awaitable
+
+from google.protobuf.duration_pb2 import Duration
+from livekit import api, rtc
+
+from config import config
+from stats import record_transfer
+
+logger = logging.getLogger("voice-agent.transfer")
+
+TRANSFER_IDENTITY_PREFIX = "transfer-"  # the pre-dialed person's participant identity
+DIAL_GRACE = 5.0  # seconds past the ring timeout before a pre-dial is given up
+
+
+@dataclass
+class TransferResult:
+    department: str
+    target: str
+    mode: str  # "warm", "cold" or "failed"
+    handoff_ms: float = 0.0  # handoff line played out -> caller connected
+    total_ms: float = 0.0  # tool called -> caller connected
+    error: str = ""
+
+
+def refer_uri(target: str) -> str:
+    """Where a cold transfer sends the caller: SIP URIs as they are, numbers as tel: URIs."""
+    return target if target.startswith(("sip:", "tel:")) else f"tel:{target}"
+
+
+def dial_number(target: str) -> str:
+    """What the outbound trunk dials for a pre-dial: the number or user part of the target."""
+    return re.sub(r"^(?:sip|tel):", "", target).split("@", 1)[0]
+
+
+def find_caller(room: rtc.Room) -> rtc.RemoteParticipant | None:
+    """The caller's SIP participant in the room (None on dashboard calls)."""
+    for participant in room.remote_participants.values():
+        if participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP and not participant.identity.startswith(
+            TRANSFER_IDENTITY_PREFIX
+        ):
+            return participant
+    return None
+
+
+class SipTransfer:
+    """Warm transfer of one caller, with a cold transfer as fallback."""
+
+    def __init__(self, lkapi: api.LiveKitAPI, room_name: str, caller_identity: str) -> None:
+        self._api = lkapi
+        self._room = room_name
+        self._caller = caller_identity
+        self._trunk_id = config.sip_outbound_trunk_id
+        self._ring_timeout = config.transfer_ring_timeout
+
+    async def run(self, department: str, target: str, handoff: Awaitable) -> TransferResult:
+        """Transfer the caller to `target`; `handoff` completes when the handoff line has played out."""
+        start = time.perf_counter()
+        identity = f"{TRANSFER_IDENTITY_PREFIX}{department}-{int(time.time())}"
+        dial = asyncio.create_task(self._dial(target, identity)) if self._trunk_id else None
+        try:
+            await handoff
+        except BaseException:
+            if dial is not None:
+                dial.cancel()
+            raise
+        handoff_done = time.perf_counter()
+
+        error = "no outbound trunk"
+        if dial is not None:
+            try:
+                await asyncio.wait_for(dial, self._ring_timeout + DIAL_GRACE - (handoff_done - start))
+                return self._result(department, target, "warm", start, handoff_done)
+            except Exception as e:
+                error = f"pre-dial failed: {type(e).__name__} {e}".strip()
+                logger.warning(f"⚠️  Warm transfer to {department} failed ({error}) — transferring cold")
+                await self._hang_up_leg(identity)
+
+        try:
+            response = await self._api.sip.transfer_sip_participant(
+                api.TransferSIPParticipantRequest(
+                    participant_identity=self._caller,
+                    room_name=self._room,
+                    transfer_to=refer_uri(target),
+                    play_dialtone=True,
+                )
+            )
+            if getattr(response, "status", None) == api.STS_TRANSFER_FAILED:
+                raise RuntimeError(response.reason or "transfer failed")
+        except Exception as e:
+            error = f"{error}; cold transfer failed: {type(e).__name__} {e}".strip()
+            return self._result(department, target, "failed", start, handoff_done, error)
+        return self._result(department, target, "cold", start, handoff_done, error)
+
+    async def _dial(self, target: str, identity: str) -> None:
+        await self._api.sip.create_sip_participant(
+            api.CreateSIPParticipantRequest(
+                sip_trunk_id=self._trunk_id,
+                sip_call_to=dial_number(target),
+                room_name=self._room,
+                participant_identity=identity,
+                participant_name="Transfer",
+                wait_until_answered=True,
+                ringing_timeout=Duration(seconds=int(self._ring_timeout)),
+            )
+        )
+
+    async def _hang_up_leg(self, identity: str) -> None:
+        """Drop a pre-dialed leg that may still be ringing or has just answered."""
+        try:
+            await self._api.room.remove_participant(
+                api.RoomParticipantIdentity(room=self._room, identity=identity)
+            )
+        except Exception:
+            pass  # never joined
+
+    @staticmethod
+    def _result(
+        department: str, target: str, mode: str, start: float, handoff_done: float, error: str = ""
+    ) -> TransferResult:
+        now = time.perf_counter()
+        result = TransferResult(
+            department=department,
+            target=target,
+            mode=mode,
+            handoff_ms=round((now - handoff_done) * 1000, 1),
+            total_ms=round((now - start) * 1000, 1),
+            error=error,
+        )
+        record_transfer(mode, result.handoff_ms)
+        if mode == "failed":
+            logger.error(f"❌ Transfer to {department} ({target}) failed: {error}")
+        else:
+            logger.info(
+                f"☎️  Transfer to {department} ({target}): {mode}, caller connected "
+                f"{result.handoff_ms:.0f} ms after the handoff line ({result.total_ms:.0f} ms after the tool call)"
+            )
+        return result
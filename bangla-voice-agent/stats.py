@@ -0,0 +1,313 @@
+"""
+Performance stats for the voice agent, collected from session metrics events.
+
+Every sample goes to two places:
+  - Prometheus metrics (voice_agent_*) on the worker's PROMETHEUS_PORT.
+    Job processes write them to PROMETHEUS_MULTIPROC_DIR and the worker
+    serves the sum, so hit rates and means are computed over every call
+    the worker ran (e.g. rate(cached_tokens) / rate(prompt_tokens)).
+  - log lines at the end of each call, from counters in this process.
+    With the default executor a process runs one call, so these describe
+    that call only; with VAD_BATCHING (jobs as threads) they cover the
+    calls this worker has run so far.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from livekit.agents.metrics import LLMMetrics, STTMetrics, TTSMetrics
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger("voice-agent.stats")
+
+LATENCY_BUCKETS = (0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+LLM_REQUESTS = Counter("voice_agent_llm_requests", "LLM requests", ["mode"])
+LLM_PROMPT_TOKENS = Counter("voice_agent_llm_prompt_tokens", "LLM prompt tokens", ["mode"])
+LLM_CACHED_TOKENS = Counter("voice_agent_llm_cached_tokens", "LLM prompt tokens read from the provider's cache", ["mode"])
+LLM_CACHE_WRITE_TOKENS = Counter("voice_agent_llm_cache_write_tokens", "LLM prompt tokens written to the cache", ["mode"])
+PREFLIGHTS = Counter("voice_agent_preflights", "Preemptive preflight transcripts", ["outcome"])  # hit / wasted
+FIRST_TURN_CALLS = Counter("voice_agent_first_turn_calls", "Calls by warm-up state at start", ["state"])
+FIRST_TURN_LLM_TTFT = Histogram(
+    "voice_agent_first_turn_llm_ttft_seconds", "First LLM TTFT of a call", ["state"], buckets=LATENCY_BUCKETS
+)
+FIRST_TURN_TTS_TTFB = Histogram(
+    "voice_agent_first_turn_tts_ttfb_seconds", "First TTS TTFB of a call", ["state"], buckets=LATENCY_BUCKETS
+)
+AFTER_GOODBYE_SECONDS = Histogram(
+    "voice_agent_after_goodbye_seconds", "Goodbye played out -> session closed", ["state"],
+    buckets=(0.5, 1, 2, 5, 10, 30, 60, 120, 300),
+)
+AFTER_GOODBYE_STT_SECONDS = Counter("voice_agent_after_goodbye_stt_audio_seconds", "STT audio after the goodbye", ["state"])
+AFTER_GOODBYE_LLM_REQUESTS = Counter("voice_agent_after_goodbye_llm_requests", "LLM requests after the goodbye", ["state"])
+AFTER_GOODBYE_TTS_CHARACTERS = Counter(
+    "voice_agent_after_goodbye_tts_characters", "TTS characters after the goodbye", ["state"]
+)
+TRANSFER_HANDOFF = Histogram(
+    "voice_agent_transfer_handoff_seconds", "Handoff line played out -> caller connected", ["mode"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+# ═══════════════════════════════════════════════════════
+# PROMPT CACHE — how much of each prompt the provider served from cache
+# ═══════════════════════════════════════════════════════
+@dataclass
+class PromptCacheStats:
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of prompt tokens read from the provider's cache."""
+        if not self.prompt_tokens:
+            return 0.0
+        return self.cached_tokens / self.prompt_tokens
+
+
+_prompt_cache: dict[str, PromptCacheStats] = defaultdict(PromptCacheStats)
+
+
+def record_llm_metrics(mode: str, metrics: LLMMetrics) -> None:
+    """Add one LLM request's token usage to the per-mode cache stats."""
+    stats = _prompt_cache[mode]
+    stats.requests += 1
+    stats.prompt_tokens += metrics.prompt_tokens
+    stats.cached_tokens += metrics.prompt_cached_tokens
+    stats.cache_write_tokens += getattr(metrics, "cache_creation_tokens", 0)
+    LLM_REQUESTS.labels(mode).inc()
+    LLM_PROMPT_TOKENS.labels(mode).inc(metrics.prompt_tokens)
+    LLM_CACHED_TOKENS.labels(mode).inc(metrics.prompt_cached_tokens)
+    LLM_CACHE_WRITE_TOKENS.labels(mode).inc(getattr(metrics, "cache_creation_tokens", 0))
+
+
+def prompt_cache_report() -> dict[str, dict]:
+    """Per-mode prompt cache stats, e.g. for logging or a metrics endpoint."""
+    return {
+        mode: {
+            "requests": s.requests,
+            "prompt_tokens": s.prompt_tokens,
+            "cached_tokens": s.cached_tokens,
+            "cache_write_tokens": s.cache_write_tokens,
+            "hit_rate": round(s.hit_rate, 3),
+        }
+        for mode, s in _prompt_cache.items()
+    }
+
+
+def log_prompt_cache_report() -> None:
+    for mode, s in _prompt_cache.items():
+        logger.info(
+            f"💾 Prompt cache [{mode}]: {s.hit_rate:.0%} of prompt tokens cached "
+            f"({s.cached_tokens}/{s.prompt_tokens} in {s.requests} requests in this process)"
+        )
+
+
+# ═══════════════════════════════════════════════════════
+# PREEMPTIVE GENERATION — preflight transcripts used vs. thrown away
+# ═══════════════════════════════════════════════════════
+@dataclass
+class PreemptiveStats:
+    preflights: int = 0
+    hits: int = 0
+
+    @property
+    def wasted(self) -> int:
+        return self.preflights - self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        if not self.preflights:
+            return 0.0
+        return self.hits / self.preflights
+
+
+_preemptive = PreemptiveStats()
+
+
+def record_preflight(hit: bool) -> None:
+    """Count one preflight transcript and whether its early reply was kept."""
+    _preemptive.preflights += 1
+    if hit:
+        _preemptive.hits += 1
+    PREFLIGHTS.labels("hit" if hit else "wasted").inc()
+
+
+def preemptive_report() -> dict:
+    return {
+        "preflights": _preemptive.preflights,
+        "hits": _preemptive.hits,
+        "wasted": _preemptive.wasted,
+        "hit_rate": round(_preemptive.hit_rate, 3),
+    }
+
+
+def log_preemptive_report() -> None:
+    if not _preemptive.preflights:
+        return
+    logger.info(
+        f"⚡ Preemptive generation: {_preemptive.hit_rate:.0%} hit rate "
+        f"({_preemptive.hits} used, {_preemptive.wasted} wasted of {_preemptive.preflights} in this process)"
+    )
+
+
+# ═══════════════════════════════════════════════════════
+# FIRST TURN — calls that started after warm-up vs. before (see warmup.py)
+# ═══════════════════════════════════════════════════════
+@dataclass
+class FirstTurnStats:
+    calls: int = 0
+    llm_ttft: list[float] = field(default_factory=list)
+    tts_ttfb: list[float] = field(default_factory=list)
+
+
+_first_turn: dict[str, FirstTurnStats] = defaultdict(FirstTurnStats)
+
+
+class FirstTurn:
+    """Records the first LLM TTFT and TTS TTFB of one call."""
+
+    def __init__(self, warm: bool) -> None:
+        self.state = "warm" if warm else "cold"
+        self._stats = _first_turn[self.state]
+        self._stats.calls += 1
+        FIRST_TURN_CALLS.labels(self.state).inc()
+        self._llm_seen = False
+        self._tts_seen = False
+
+    def on_metrics(self, metrics) -> None:
+        if isinstance(metrics, LLMMetrics) and not self._llm_seen and metrics.ttft > 0:
+            self._llm_seen = True
+            self._stats.llm_ttft.append(metrics.ttft)
+            FIRST_TURN_LLM_TTFT.labels(self.state).observe(metrics.ttft)
+        elif isinstance(metrics, TTSMetrics) and not self._tts_seen and metrics.ttfb > 0:
+            self._tts_seen = True
+            self._stats.tts_ttfb.append(metrics.ttfb)
+            FIRST_TURN_TTS_TTFB.labels(self.state).observe(metrics.ttfb)
+
+
+def _mean_ms(values: list[float]) -> float | None:
+    return round(sum(values) / len(values) * 1000, 1) if values else None
+
+
+def first_turn_report() -> dict[str, dict]:
+    return {
+        state: {"calls": s.calls, "llm_ttft_ms": _mean_ms(s.llm_ttft), "tts_ttfb_ms": _mean_ms(s.tts_ttfb)}
+        for state, s in _first_turn.items()
+    }
+
+
+def log_first_turn_report() -> None:
+    for state, report in first_turn_report().items():
+        logger.info(
+            f"🔥 First turn [{state}]: LLM TTFT {report['llm_ttft_ms']} ms, "
+            f"TTS TTFB {report['tts_ttfb_ms']} ms ({report['calls']} calls in this process)"
+        )
+
+
+# ═══════════════════════════════════════════════════════
+# AFTER THE GOODBYE — what a call held on to once it was over (see hangup.py)
+# ═══════════════════════════════════════════════════════
+@dataclass
+class AfterGoodbyeStats:
+    calls: int = 0
+    seconds: list[float] = field(default_factory=list)  # goodbye played out -> session closed
+    stt_audio_seconds: float = 0.0
+    llm_requests: int = 0
+    tts_characters: int = 0
+
+
+_after_goodbye: dict[str, AfterGoodbyeStats] = defaultdict(AfterGoodbyeStats)
+
+
+class AfterGoodbye:
+    """Records one call's session time and provider usage after its goodbye.
+
+    "hung up" calls are closed by the agent; "left open" calls
+    (HANGUP_ON_END_CALL=false) stay up until the caller hangs up.
+    """
+
+    def __init__(self, hang_up: bool) -> None:
+        self._state = "hung up" if hang_up else "left open"
+        self._stats = _after_goodbye[self._state]
+        self._goodbye_at: float | None = None
+        self._closed = False
+
+    def goodbye_done(self) -> None:
+        if self._goodbye_at is None:
+            self._goodbye_at = time.monotonic()
+            self._stats.calls += 1
+
+    def on_metrics(self, metrics) -> None:
+        if self._goodbye_at is None or self._closed:
+            return
+        if isinstance(metrics, STTMetrics):
+            self._stats.stt_audio_seconds += metrics.audio_duration
+            AFTER_GOODBYE_STT_SECONDS.labels(self._state).inc(metrics.audio_duration)
+        elif isinstance(metrics, LLMMetrics):
+            self._stats.llm_requests += 1
+            AFTER_GOODBYE_LLM_REQUESTS.labels(self._state).inc()
+        elif isinstance(metrics, TTSMetrics):
+            self._stats.tts_characters += metrics.characters_count
+            AFTER_GOODBYE_TTS_CHARACTERS.labels(self._state).inc(metrics.characters_count)
+
+    def closed(self) -> None:
+        if self._goodbye_at is not None and not self._closed:
+            seconds = time.monotonic() - self._goodbye_at
+            self._stats.seconds.append(seconds)
+            AFTER_GOODBYE_SECONDS.labels(self._state).observe(seconds)
+        self._closed = True
+
+
+def after_goodbye_report() -> dict[str, dict]:
+    return {
+        state: {
+            "calls": s.calls,
+            "seconds_per_call": round(sum(s.seconds) / len(s.seconds), 2) if s.seconds else None,
+            "stt_audio_seconds": round(s.stt_audio_seconds, 1),
+            "llm_requests": s.llm_requests,
+            "tts_characters": s.tts_characters,
+        }
+        for state, s in _after_goodbye.items()
+    }
+
+
+def log_after_goodbye_report() -> None:
+    for state, report in after_goodbye_report().items():
+        logger.info(
+            f"📴 After goodbye [{state}]: {report['seconds_per_call']} s per call, "
+            f"STT {report['stt_audio_seconds']} s, {report['llm_requests']} LLM requests, "
+            f"{report['tts_characters']} TTS chars ({report['calls']} calls in this process)"
+        )
+
+
+# ═══════════════════════════════════════════════════════
+# TRANSFERS — how long callers waited to be connected (see sip_transfer.py)
+# ═══════════════════════════════════════════════════════
+_transfers: dict[str, list[float]] = defaultdict(list)  # mode -> handoff latency (ms) per transfer
+
+
+def record_transfer(mode: str, handoff_ms: float) -> None:
+    _transfers[mode].append(handoff_ms)
+    TRANSFER_HANDOFF.labels(mode).observe(handoff_ms / 1000)
+
+
+def transfer_report() -> dict[str, dict]:
+    return {
+        mode: {"transfers": len(latencies), "handoff_ms": round(sum(latencies) / len(latencies), 1)}
+        for mode, latencies in _transfers.items()
+    }
+
+
+def log_transfer_report() -> None:
+    for mode, report in transfer_report().items():
+        logger.info(
+            f"☎️  Transfers [{mode}]: caller connected {report['handoff_ms']} ms after the handoff line "
+            f"(mean of {report['transfers']} in this process)"
+        )
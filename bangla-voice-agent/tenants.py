@@ -0,0 +1,233 @@
+"""
+Multi-tenant configuration — several businesses on one deployment.
+
+Tenants are listed in TENANTS_FILE (default tenants.toml next to this
+file, see tenants.example.toml). Each call is matched to a tenant by, in order:
+  1. dialed number    (SIP attribute sip.trunkPhoneNumber)
+  2. SIP trunk ID     (SIP attribute sip.trunkID)
+  3. room name prefix (longest match — set per dispatch rule)
+Calls that match nothing use the plain .env configuration.
+
+A tenant overrides agent mode, company name, providers, Google Sheet and
+Calendar IDs, transfer targets, and optionally the whole system prompt. The overrides are
+applied to the call's Config snapshot (config.pin_config), so tools and
+provider factories pick them up without knowing about tenants.
+
+Resolution is a dict lookup. Stable prompts are cached per tenant, and
+each worker process builds every tenant's STT/LLM/TTS in prewarm, so
+call setup only takes a ready-made bundle.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import dataclasses
+import logging
+import re
+import threading
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+
+from config import config, pin_config, refresh_config
+from prompts import PROMPTS
+
+logger = logging.getLogger("voice-agent.tenants")
+
+# Tenant settings copied onto the call's Config
+CONFIG_OVERRIDES = (
+    "agent_mode",
+    "company_name",
+    "stt_provider",
+    "llm_provider",
+    "tts_provider",
+    "google_sheet_id",
+    "google_calendar_id",
+)
+
+# SIP participant attributes set by LiveKit SIP
+SIP_CALLER_NUMBER = "sip.phoneNumber"
+SIP_DIALED_NUMBER = "sip.trunkPhoneNumber"
+SIP_TRUNK_ID = "sip.trunkID"
+
+
+def _digits(number: str) -> str:
+    return re.sub(r"\D", "", number)
+
+
+@dataclass(frozen=True)
+class Tenant:
+    name: str
+    numbers: tuple[str, ...] = ()
+    trunks: tuple[str, ...] = ()
+    room_prefixes: tuple[str, ...] = ()
+    agent_mode: str | None = None
+    company_name: str | None = None
+    system_prompt: str | None = None
+    stt_provider: str | None = None
+    llm_provider: str | None = None
+    llm_model: str | None = None
+    tts_provider: str | None = None
+    tts_voice: str | None = None
+    google_sheet_id: str | None = None
+    google_calendar_id: str | None = None
+    transfer_targets: tuple[tuple[str, str], ...] = ()  # department -> number or SIP URI
+
+    def apply(self, base):
+        """The call's Config: `base` with this tenant's overrides."""
+        overrides = {name: getattr(self, name) for name in CONFIG_OVERRIDES if getattr(self, name)}
+        if self.transfer_targets:
+            overrides["transfer_targets"] = dict(self.transfer_targets)
+        return dataclasses.replace(base, **overrides)
+
+
+DEFAULT_TENANT = Tenant(name="default")
+
+
+class TenantRegistry:
+    def __init__(self, tenants: list[Tenant]) -> None:
+        self.tenants = tenants
+        self._by_number: dict[str, Tenant] = {}
+        self._by_trunk: dict[str, Tenant] = {}
+        prefixes: list[tuple[str, Tenant]] = []
+        for tenant in tenants:
+            for number in tenant.numbers:
+                self._by_number[_digits(number)] = tenant
+            for trunk in tenant.trunks:
+                self._by_trunk[trunk] = tenant
+            prefixes.extend((prefix, tenant) for prefix in tenant.room_prefixes)
+        self._prefixes = sorted(prefixes, key=lambda p: len(p[0]), reverse=True)
+
+    @classmethod
+    def load(cls, path: Path) -> TenantRegistry:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        fields = {f.name for f in dataclasses.fields(Tenant)}
+        tenants = []
+        for entry in data.get("tenant", []):
+            unknown = set(entry) - fields
+            if unknown:
+                raise ValueError(f"tenant {entry.get('name')!r}: unknown keys {sorted(unknown)}")
+            if entry.get("agent_mode") and entry["agent_mode"] not in PROMPTS:
+                raise ValueError(f"tenant {entry.get('name')!r}: unknown agent_mode {entry['agent_mode']!r}")
+            for key in ("numbers", "trunks", "room_prefixes"):
+                entry[key] = tuple(entry.get(key, ()))
+            entry["transfer_targets"] = tuple(
+                (department.lower(), target) for department, target in entry.get("transfer_targets", {}).items()
+            )
+            tenants.append(Tenant(**entry))
+        return cls(tenants)
+
+    def resolve(
+        self,
+        *,
+        dialed_number: str | None = None,
+        trunk_id: str | None = None,
+        room_name: str | None = None,
+    ) -> Tenant:
+        if dialed_number and (tenant := self._by_number.get(_digits(dialed_number))):
+            return tenant
+        if trunk_id and (tenant := self._by_trunk.get(trunk_id)):
+            return tenant
+        if room_name:
+            for prefix, tenant in self._prefixes:
+                if room_name.startswith(prefix):
+                    return tenant
+        return DEFAULT_TENANT
+
+
+# ═══════════════════════════════════════════════════════
+# REGISTRY — loaded once per process, reloaded when the file changes
+# ═══════════════════════════════════════════════════════
+_registry = TenantRegistry([])
+_registry_key: tuple[str, float] | None = None
+_lock = threading.Lock()
+
+
+def get_registry() -> TenantRegistry:
+    """The tenant registry, reloaded if TENANTS_FILE changed.
+
+    A file that fails to load keeps the previous registry.
+    """
+    global _registry, _registry_key
+    path = Path(config.tenants_file)
+    if not path.is_absolute():
+        path = Path(__file__).parent / path
+    try:
+        key = (str(path), path.stat().st_mtime)
+    except OSError:
+        key = (str(path), 0.0)  # no file — single-tenant
+    if key == _registry_key:
+        return _registry
+
+    with _lock:
+        if key != _registry_key:
+            _registry_key = key
+            if key[1]:
+                try:
+                    _registry = TenantRegistry.load(path)
+                    logger.info(f"🏢 Tenants loaded from {path}: {[t.name for t in _registry.tenants]}")
+                except Exception as e:
+                    logger.error(f"❌ Could not load tenants from {path}, keeping previous: {e}")
+            else:
+                _registry = TenantRegistry([])
+    return _registry
+
+
+# ═══════════════════════════════════════════════════════
+# PROVIDER BUNDLES — built in prewarm, taken by calls
+# ═══════════════════════════════════════════════════════
+@dataclass
+class ProviderBundle:
+    tenant: Tenant
+    config: object  # the Config the providers were built with
+    stt: object
+    llm: object
+    tts: object
+
+
+def prompt_mode(tenant: Tenant) -> str:
+    """Prompt-cache and stats key for the tenant's calls (config must be pinned)."""
+    mode = "custom" if tenant.system_prompt else config.agent_mode
+    return mode if tenant is DEFAULT_TENANT else f"{tenant.name}:{mode}"
+
+
+def build_bundle(tenant: Tenant, sample_rate: int | None, call_config=None) -> ProviderBundle:
+    """STT/LLM/TTS for one of the tenant's calls, built with the tenant's config."""
+    from providers import get_llm, get_stt, get_tts
+
+    def _build() -> ProviderBundle:
+        snapshot = call_config or tenant.apply(refresh_config())
+        pin_config(snapshot)
+        return ProviderBundle(
+            tenant=tenant,
+            config=snapshot,
+            stt=get_stt(sample_rate=sample_rate),
+            llm=get_llm(model=tenant.llm_model, cache_key=prompt_mode(tenant)),
+            tts=get_tts(voice=tenant.tts_voice, sample_rate=sample_rate),
+        )
+
+    # Own context: the tenant's config must not leak into the caller's
+    return contextvars.copy_context().run(_build)
+
+
+def prewarm_bundles(userdata: dict, sample_rate: int | None) -> None:
+    """Build a bundle per tenant (and the default) for this worker process."""
+    bundles = userdata.setdefault("tenant_bundles", {})
+    for tenant in (DEFAULT_TENANT, *get_registry().tenants):
+        try:
+            bundles[(tenant.name, sample_rate)] = build_bundle(tenant, sample_rate)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not prewarm providers for tenant {tenant.name}: {e}")
+
+
+def take_bundle(userdata: dict, tenant: Tenant, sample_rate: int | None, call_config) -> ProviderBundle:
+    """The prewarmed bundle for this call, else a freshly built one.
+
+    Each bundle serves one call — plugin clients bind to the call's loop.
+    A bundle built before an .env or tenants file edit is not used.
+    """
+    bundle = userdata.get("tenant_bundles", {}).pop((tenant.name, sample_rate), None)
+    if bundle is not None and (bundle.tenant, bundle.config) == (tenant, call_config):
+        return bundle
+    return build_bundle(tenant, sample_rate, call_config)
@@ -7,17 +7,16 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta
 
-from google.oauth2 import service_account
+from google.auth.credentials import AnonymousCredentials
 from googleapiclient.discovery import build
 
 from livekit.agents import RunContext, function_tool
 from config import config
+from tools.google_auth import get_credentials
 
 logger = logging.getLogger("voice-agent.tools.appointment")
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
-CALENDAR_ID = config.google_calendar_id
-CREDENTIALS_FILE = config.google_credentials
 TIMEZONE = "Asia/Dhaka"
 
 BUSINESS_START_HOUR = 9
@@ -36,15 +35,18 @@ def _format_time(dt: datetime) -> str:
 
 
 def _get_calendar_service():
-    if not CREDENTIALS_FILE:
-        raise ValueError("GOOGLE_APPLICATION_CREDENTIALS not set in .env")
-    if not CALENDAR_ID:
+    if not config.google_calendar_id:
         raise ValueError("GOOGLE_CALENDAR_ID not set in .env")
-
-    credentials = service_account.Credentials.from_service_account_file(
-        CREDENTIALS_FILE, scopes=SCOPES
-    )
-    return build("calendar", "v3", credentials=credentials, cache_discovery=False)
+    if config.google_api_emulator:
+        # Bundled discovery document, requests to the local emulator
+        return build(
+            "calendar",
+            "v3",
+            credentials=AnonymousCredentials(),
+            client_options={"api_endpoint": config.google_api_emulator.rstrip("/") + "/calendar/v3/"},
+            static_discovery=True,
+        )
+    return build("calendar", "v3", credentials=get_credentials(SCOPES), cache_discovery=False)
 
 
 def _get_busy_times(service, date_str: str) -> list[dict]:
@@ -56,10 +58,10 @@ def _get_busy_times(service, date_str: str) -> list[dict]:
         "timeMin": time_min,
         "timeMax": time_max,
         "timeZone": TIMEZONE,
-        "items": [{"id": CALENDAR_ID}],
+        "items": [{"id": config.google_calendar_id}],
     }
     result = service.freebusy().query(body=body).execute()
-    return result["calendars"][CALENDAR_ID]["busy"]
+    return result["calendars"][config.google_calendar_id]["busy"]
 
 
 def _generate_all_slots(date_str: str) -> list[dict]:
@@ -217,7 +219,7 @@ async def book_appointment(
 
         created_event = (
             service.events()
-            .insert(calendarId=CALENDAR_ID, body=event)
+            .insert(calendarId=config.google_calendar_id, body=event)
             .execute()
         )
 
@@ -266,7 +268,7 @@ async def cancel_appointment(
         events_result = (
             service.events()
             .list(
-                calendarId=CALENDAR_ID,
+                calendarId=config.google_calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
                 singleEvents=True,
@@ -299,7 +301,7 @@ async def cancel_appointment(
         event_id = matched["id"]
         event_time = matched.get("start", {}).get("dateTime", "unknown")
         service.events().delete(
-            calendarId=CALENDAR_ID, eventId=event_id
+            calendarId=config.google_calendar_id, eventId=event_id
         ).execute()
 
         logger.info(f"📅 ✅ Event cancelled: {event_id} ({matched.get('summary', '')})")
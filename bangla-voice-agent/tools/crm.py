@@ -5,18 +5,31 @@ Uses real Google Sheets as a lightweight CRM database.
 
 Sheet structure (first row = headers):
   A: Name | B: Phone | C: Email | D: Company | E: Last Interaction | F: Notes | G: Status
+
+SPECULATIVE PREFETCH:
+  The prompts ask for the caller's mobile number before calling
+  lookup_customer. PhoneNumberWatcher reads the live transcripts, spots
+  the number as soon as the caller says it, and starts the Sheets lookup
+  right away. When the LLM then calls lookup_customer, the tool picks up
+  the in-flight (or finished) result instead of starting from scratch.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+import time
+import unicodedata
 from datetime import datetime
 
 import gspread
-from google.oauth2 import service_account
+import requests
+from google.auth.credentials import AnonymousCredentials
 
 from livekit.agents import RunContext, function_tool
 from config import config
+from tools.google_auth import get_credentials
 
 logger = logging.getLogger("voice-agent.tools.crm")
 
@@ -25,25 +38,41 @@ SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
 ]
-SHEET_ID = config.google_sheet_id
-CREDENTIALS_FILE = config.google_credentials
+SHEETS_API_ROOT = "https://sheets.googleapis.com"
 
 # Expected column headers (will auto-create if sheet is empty)
 HEADERS = ["Name", "Phone", "Email", "Company", "Last Interaction", "Notes", "Status"]
 
 
+class _EmulatorSession(requests.Session):
+    """Sends gspread's Sheets API requests to GOOGLE_API_EMULATOR."""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__()
+        self._base_url = base_url.rstrip("/")
+
+    def request(self, method, url, *args, **kwargs):
+        return super().request(method, url.replace(SHEETS_API_ROOT, self._base_url, 1), *args, **kwargs)
+
+
+def sheets_configured() -> bool:
+    """Whether _sheets_client() can reach the current call's CRM sheet."""
+    return bool(config.google_sheet_id and (config.google_api_emulator or config.google_credentials))
+
+
+def _sheets_client() -> gspread.Client:
+    if config.google_api_emulator:
+        return gspread.Client(AnonymousCredentials(), session=_EmulatorSession(config.google_api_emulator))
+    return gspread.authorize(get_credentials(SCOPES))
+
+
 def _get_sheet():
-    """Get the Google Sheet worksheet (first sheet)."""
-    if not CREDENTIALS_FILE:
-        raise ValueError("GOOGLE_APPLICATION_CREDENTIALS not set in .env")
-    if not SHEET_ID:
+    """Get the Google Sheet worksheet (first sheet) of the current call's tenant."""
+    if not config.google_sheet_id:
         raise ValueError("GOOGLE_SHEET_ID not set in .env")
 
-    credentials = service_account.Credentials.from_service_account_file(
-        CREDENTIALS_FILE, scopes=SCOPES
-    )
-    gc = gspread.authorize(credentials)
-    spreadsheet = gc.open_by_key(SHEET_ID)
+    gc = _sheets_client()
+    spreadsheet = gc.open_by_key(config.google_sheet_id)
     worksheet = spreadsheet.sheet1
 
     # Auto-setup headers if sheet is empty
@@ -65,6 +94,79 @@ def _normalize_phone(phone: str) -> str:
     return phone
 
 
+# ═══════════════════════════════════════════════════════
+# PHONE NUMBER EXTRACTION — Bangla digits, ASCII digits, spoken words
+# ═══════════════════════════════════════════════════════
+_NUMBER_WORDS = {
+    # NFC so "য়" matches whether STT emits it precomposed or not
+    unicodedata.normalize("NFC", word): digit
+    for digit, words in {
+        "0": ["শূন্য", "শুন্য", "জিরো", "zero"],
+        "1": ["এক", "ওয়ান", "one"],
+        "2": ["দুই", "টু", "two"],
+        "3": ["তিন", "থ্রি", "three"],
+        "4": ["চার", "ফোর", "four"],
+        "5": ["পাঁচ", "পাচ", "ফাইভ", "five"],
+        "6": ["ছয়", "সিক্স", "six"],
+        "7": ["সাত", "সেভেন", "seven"],
+        "8": ["আট", "এইট", "eight"],
+        "9": ["নয়", "নাইন", "nine"],
+    }.items()
+    for word in words
+}
+
+# "ডাবল সাত" -> 77, "ট্রিপল জিরো" -> 000
+_REPEAT_WORDS = {
+    unicodedata.normalize("NFC", word): count
+    for word, count in {
+        "ডাবল": 2, "double": 2,
+        "ট্রিপল": 3, "triple": 3,
+    }.items()
+}
+
+# Bangladeshi mobile: 01[3-9] + 8 digits, optionally after the 88 country code
+_BD_MOBILE = re.compile(r"(?:88)?(01[3-9]\d{8})")
+
+
+def extract_phone_number(text: str) -> str | None:
+    """Find a Bangladeshi mobile number in a transcript.
+
+    Understands Bangla digits (০১৭...), ASCII digits, spoken Bangla number
+    words ("শূন্য এক সাত ..."), English number words in Bangla script
+    ("জিরো ওয়ান সেভেন ...") and "ডাবল"/"ট্রিপল". Returns the normalized
+    number (same form as _normalize_phone) or None.
+    """
+    text = unicodedata.normalize("NFC", text).lower()
+    run = ""
+    repeat = 1
+    found = None
+
+    for token in re.split(r"[\s,।.?!]+", text):
+        if not token:
+            continue
+        if token in _REPEAT_WORDS:
+            repeat = _REPEAT_WORDS[token]
+            continue
+
+        digits = _NUMBER_WORDS.get(token)
+        if digits is None:
+            normalized = _normalize_phone(token)
+            if normalized.isdigit():
+                digits = normalized
+        if digits is None:
+            # Any other word ends the current digit run
+            run, repeat = "", 1
+            continue
+
+        run += digits * repeat if len(digits) == 1 else digits
+        repeat = 1
+        match = _BD_MOBILE.search(run)
+        if match:
+            found = match.group(1)
+
+    return found
+
+
 def _find_customer_row(worksheet, phone: str) -> int | None:
     """Find the row number of a customer by phone number. Returns None if not found."""
     phone_normalized = _normalize_phone(phone)
@@ -80,6 +182,107 @@ def _find_customer_row(worksheet, phone: str) -> int | None:
     return None
 
 
+def _lookup_customer_record(phone_number: str) -> dict:
+    """Blocking Sheets lookup. Returns the lookup_customer result dict."""
+    worksheet = _get_sheet()
+    row_num = _find_customer_row(worksheet, phone_number)
+
+    if row_num:
+        row = worksheet.row_values(row_num)
+        while len(row) < len(HEADERS):
+            row.append("")
+
+        customer = {
+            "name": row[0],
+            "phone": row[1],
+            "email": row[2],
+            "company": row[3],
+            "last_interaction": row[4],
+            "notes": row[5],
+            "status": row[6],
+        }
+        logger.info(f"🔍 Found customer: {customer['name']}")
+        return {"found": True, "customer": customer}
+
+    logger.info(f"🔍 No customer found for {phone_number}")
+    return {
+        "found": False,
+        "message": f"No customer found with phone number {phone_number}",
+    }
+
+
+# ═══════════════════════════════════════════════════════
+# SPECULATIVE PREFETCH — shared by all sessions in this process
+# ═══════════════════════════════════════════════════════
+PREFETCH_TTL_SECONDS = 120
+
+# (sheet id, normalized phone) -> (lookup task, started at, its event loop)
+# Keyed by sheet too: tenants with different CRMs share the process. A
+# task only serves calls on its own loop (THREAD executor: one per call).
+_prefetched: dict[tuple[str, str], tuple[asyncio.Task, float, asyncio.AbstractEventLoop]] = {}
+
+
+def _prefetch_key(phone_number: str) -> tuple[str, str]:
+    return config.google_sheet_id, _normalize_phone(phone_number)
+
+
+def _usable(entry: tuple[asyncio.Task, float, asyncio.AbstractEventLoop] | None) -> bool:
+    """Fresh, on this loop, and not failed — a failed prefetch falls back to the live lookup."""
+    if entry is None:
+        return False
+    task, started, loop = entry
+    if time.monotonic() - started >= PREFETCH_TTL_SECONDS or loop is not asyncio.get_running_loop():
+        return False
+    return not (task.done() and (task.cancelled() or task.exception() is not None))
+
+
+def prefetch_customer(phone_number: str) -> None:
+    """Start a CRM lookup in the background, unless a usable one exists."""
+    now = time.monotonic()
+    for stale in [k for k, (_, started, _) in _prefetched.items() if now - started >= PREFETCH_TTL_SECONDS]:
+        _prefetched.pop(stale, None)
+
+    key = _prefetch_key(phone_number)
+    if _usable(_prefetched.get(key)):
+        return
+    logger.info(f"🔍 Prefetching CRM record for {key[1]}")
+    task = asyncio.create_task(asyncio.to_thread(_lookup_customer_record, key[1]))
+    _prefetched[key] = (task, now, asyncio.get_running_loop())
+
+
+def _take_prefetched(phone_number: str) -> asyncio.Task | None:
+    entry = _prefetched.get(_prefetch_key(phone_number))
+    return entry[0] if _usable(entry) else None
+
+
+def _invalidate_prefetch(phone_number: str) -> None:
+    """Drop a prefetched record after we write to that customer's row."""
+    _prefetched.pop(_prefetch_key(phone_number), None)
+
+
+class PhoneNumberWatcher:
+    """Watches one session's transcripts and prefetches the caller's CRM record.
+
+    Numbers are often split across several STT segments, so the last few
+    final transcripts are searched together with the current interim one.
+    """
+
+    def __init__(self, history: int = 3) -> None:
+        self._finals: list[str] = []
+        self._history = history
+        self._last_phone: str | None = None
+
+    def on_transcript(self, transcript: str, is_final: bool) -> None:
+        text = " ".join(self._finals + [transcript])
+        if is_final:
+            self._finals = (self._finals + [transcript])[-self._history :]
+
+        phone = extract_phone_number(text)
+        if phone and phone != self._last_phone:
+            self._last_phone = phone
+            prefetch_customer(phone)
+
+
 @function_tool()
 async def register_customer(
     context: RunContext,
@@ -94,6 +297,7 @@ async def register_customer(
         phone_number: Customer's phone number
     """
     logger.info(f"📋 Registering customer: {customer_name} ({phone_number})")
+    _invalidate_prefetch(phone_number)
 
     try:
         worksheet = _get_sheet()
@@ -153,31 +357,15 @@ async def lookup_customer(
     logger.info(f"🔍 CRM lookup: {phone_number}")
 
     try:
-        worksheet = _get_sheet()
-        row_num = _find_customer_row(worksheet, phone_number)
-
-        if row_num:
-            row = worksheet.row_values(row_num)
-            while len(row) < len(HEADERS):
-                row.append("")
-
-            customer = {
-                "name": row[0],
-                "phone": row[1],
-                "email": row[2],
-                "company": row[3],
-                "last_interaction": row[4],
-                "notes": row[5],
-                "status": row[6],
-            }
-            logger.info(f"🔍 Found customer: {customer['name']}")
-            return {"found": True, "customer": customer}
-
-        logger.info(f"🔍 No customer found for {phone_number}")
-        return {
-            "found": False,
-            "message": f"No customer found with phone number {phone_number}",
-        }
+        prefetched = _take_prefetched(phone_number)
+        if prefetched is not None:
+            logger.info(f"🔍 Using prefetched CRM result ({'ready' if prefetched.done() else 'in flight'})")
+            try:
+                return await prefetched
+            except Exception as e:
+                logger.warning(f"🔍 Prefetched CRM lookup failed ({e}) — looking up again")
+                _invalidate_prefetch(phone_number)
+        return await asyncio.to_thread(_lookup_customer_record, phone_number)
     except Exception as e:
         logger.error(f"🔍 CRM error: {e}")
         return {"found": False, "message": f"CRM lookup error: {str(e)}"}
@@ -198,6 +386,15 @@ async def update_customer_notes(
         notes: New notes to add to the customer record
     """
     logger.info(f"📝 CRM update: {phone_number}")
+    return append_customer_notes(phone_number, notes)
+
+
+def append_customer_notes(phone_number: str, notes: str) -> dict:
+    """Append notes to the customer's row (creating it if needed). Blocking.
+
+    Also used after the call to store the call summary (call_summary.py).
+    """
+    _invalidate_prefetch(phone_number)
 
     try:
         worksheet = _get_sheet()
@@ -252,6 +449,7 @@ async def create_support_ticket(
         priority: Priority level: low, medium, or high
     """
     logger.info(f"🎫 Creating ticket for {caller_name}: {priority}")
+    _invalidate_prefetch(phone_number)
 
     try:
         worksheet = _get_sheet()
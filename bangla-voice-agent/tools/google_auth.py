@@ -0,0 +1,49 @@
+"""
+Shared Google service-account credentials for the CRM and calendar tools.
+
+One Credentials object per (key file, scopes) for the whole process, so
+the OAuth token is fetched once — at warm-up (see warmup.py) — and then
+reused by every tool call instead of fetched again per call. google-auth
+refreshes it on its own when it expires; warm-up renews it early while
+the worker is idle.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+
+from config import config
+
+REFRESH_MARGIN = timedelta(minutes=5)  # warm-up renews tokens this close to expiry
+
+_lock = threading.Lock()
+_credentials: dict[tuple[str, tuple[str, ...]], service_account.Credentials] = {}
+
+
+def get_credentials(scopes: list[str]) -> service_account.Credentials:
+    """The process-wide credentials for GOOGLE_APPLICATION_CREDENTIALS and these scopes."""
+    if not config.google_credentials:
+        raise ValueError("GOOGLE_APPLICATION_CREDENTIALS not set in .env")
+    key = (config.google_credentials, tuple(scopes))
+    with _lock:
+        credentials = _credentials.get(key)
+        if credentials is None:
+            credentials = service_account.Credentials.from_service_account_file(
+                config.google_credentials, scopes=list(scopes)
+            )
+            _credentials[key] = credentials
+    return credentials
+
+
+def refresh_token(scopes: list[str]) -> bool:
+    """Fetch the token if it is missing or expires soon; True if it was fetched."""
+    credentials = get_credentials(scopes)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # google-auth expiry is naive UTC
+    if credentials.valid and credentials.expiry and credentials.expiry - now > REFRESH_MARGIN:
+        return False
+    credentials.refresh(Request())
+    return True
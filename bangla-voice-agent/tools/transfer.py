@@ -1,7 +1,7 @@
 """
 Call Transfer Tool
-Handles call transfers and escalation to human agents.
-For MVP: logs the transfer intent. In production: connects to SIP/telephony.
+Handles call transfers, escalation to human agents and hanging up.
+Transfers are SIP warm transfers with a cold fallback (sip_transfer.py).
 """
 
 from __future__ import annotations
@@ -9,17 +9,57 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 
-from livekit.agents import RunContext, function_tool
+from livekit.agents import RunContext, function_tool, get_job_context, llm
+
+import hangup
+from config import config
+from sip_transfer import SipTransfer, find_caller
 
 logger = logging.getLogger("voice-agent.tools.transfer")
 
 
+async def _transfer(context: RunContext, department: str) -> dict | None:
+    """Connect the caller to `department`; None once they are connected."""
+    department = department.strip().lower()
+    target = config.transfer_targets.get(department)
+    if not target:
+        available = ", ".join(config.transfer_targets) or "none"
+        return {
+            "success": False,
+            "message": f"No transfer line for {department} (available: {available}). Offer a callback instead.",
+        }
+    job = get_job_context()
+    caller = find_caller(job.room)
+    if caller is None:
+        return {"success": False, "message": "Transfers only work on phone calls. Offer a callback instead."}
+
+    # A barge-in must not cancel a transfer halfway through dialing
+    context.disallow_interruptions()
+    result = await SipTransfer(job.api, job.room.name, caller.identity).run(
+        department, target, handoff=context.wait_for_playout()
+    )
+    if result.mode == "failed":
+        return {
+            "success": False,
+            "message": "The transfer could not be connected. Apologize and offer a callback.",
+        }
+
+    # The caller is with the department now — leave without another word
+    hangup.transferred(
+        context.session,
+        context.speech_handle,
+        f"transferred_{result.mode}:{department}",
+        delete_room=result.mode == "cold",  # a bridged caller and person share this room
+    )
+    return None
+
+
 @function_tool()
 async def transfer_to_department(
     context: RunContext,
     department: str,
     reason: str,
-) -> dict:
+) -> dict | None:
     """Transfer the call to a specific department.
 
     Args:
@@ -27,71 +67,51 @@ async def transfer_to_department(
         reason: Reason for the transfer
     """
     logger.info(f"📞 Transfer requested → {department}: {reason}")
-
-    # In production, this would initiate a SIP transfer via LiveKit's telephony
-    # For MVP, we log and confirm
-    return {
-        "success": True,
-        "message": f"Transferring to {department} department. Reason: {reason}",
-        "transfer_id": f"TRF-{datetime.now().strftime('%H%M%S')}",
-        # In production, add:
-        # "sip_target": "sip:sales@your-pbx.com"
-    }
+    return await _transfer(context, department)
 
 
 @function_tool()
 async def escalate_to_human(
     context: RunContext,
     urgency: str,
-    summary: str,
-) -> dict:
+) -> dict | None:
     """Escalate the call to a human agent when the AI cannot resolve the issue.
 
     Args:
         urgency: Urgency level: normal or urgent
-        summary: Brief summary of the conversation so far for the human agent
     """
-    logger.info(f"🚨 Escalation ({urgency}): {summary}")
-
-    return {
-        "success": True,
-        "message": "Connecting you with a human agent now. Please hold.",
-        "estimated_wait": "2 minutes",
-        "summary_forwarded": True,
-    }
+    # No summary argument — the call is summarized from its transcript afterwards (call_summary.py)
+    logger.info(f"🚨 Escalation ({urgency}) → {config.escalation_department}")
+    return await _transfer(context, config.escalation_department)
 
 
 @function_tool()
 async def end_call(
     context: RunContext,
     reason: str,
-    call_summary: str,
-) -> dict:
-    """End the current call gracefully with a summary.
+) -> dict | None:
+    """End the current call gracefully.
     Call this when the caller says goodbye, wants to hang up, or the conversation is complete.
 
     Args:
         reason: Why the call is ending (e.g., "completed", "caller_request", "issue_resolved")
-        call_summary: Brief summary of what was discussed and any actions taken
     """
+    # The summary is written from the transcript after the call (call_summary.py)
     logger.info(f"📞 Call ending: {reason}")
-    logger.info(f"📞 Call summary: {call_summary}")
-
-    # ─────────────────────────────────────────────────────
-    # PRODUCTION: When SIP trunk is connected, uncomment
-    # the lines below to actually disconnect the call:
-    #
-    # import asyncio
-    # session = context.session
-    # async def _delayed_disconnect():
-    #     await asyncio.sleep(2)  # Let goodbye audio finish
-    #     await session.aclose()
-    # asyncio.ensure_future(_delayed_disconnect())
-    # ─────────────────────────────────────────────────────
 
+    # Hang up once the goodbye has played out (hangup.py)
+    await context.wait_for_playout()
+    hangup.goodbye(context.session, context.speech_handle, reason)
+    said_goodbye = any(
+        isinstance(item, llm.ChatMessage) and item.role == "assistant"
+        for item in context.speech_handle.chat_items
+    )
+    if said_goodbye:
+        return None  # no result — no further LLM turn after the goodbye
+
+    # Called without a goodbye — the reply to this result is the goodbye
     return {
         "success": True,
         "reason": reason,
-        "summary": call_summary,
         "timestamp": datetime.now().isoformat(),
     }
@@ -0,0 +1,217 @@
+"""
+Warm-up — the first call on a worker as fast as the ones after it.
+
+Without it the first call after a worker starts, or after a quiet
+spell, pays for the Google service-account token fetch and — for
+self-hosted (custom) endpoints — loading the model, all while the
+caller waits for the greeting.
+
+start() is called from prewarm and runs in a background thread (prewarm
+itself must stay quick). For every tenant's providers it:
+  - fetches the Google tokens the CRM/calendar tools use
+    (tools/google_auth.py keeps them for every call in the process)
+  - sends a tiny priming request to custom STT, LLM and TTS endpoints
+    (a short recognition, a 1-token completion with the tenant's system
+    prompt, one short sentence) so the model is loaded and, where the
+    server supports it, the prompt prefix is cached
+
+Then, every KEEP_WARM_INTERVAL seconds while this process has no call,
+it renews tokens that are about to expire and primes again — servers
+like Ollama unload idle models after a few minutes.
+
+Connections themselves can't be carried over: LiveKit gives each call a
+fresh HTTP session and plugin clients bind to the call's event loop.
+Neither can DNS answers — Python and glibc don't cache lookups and the
+image runs no local resolver cache — so managed provider hosts are not
+warmed here.
+
+Each call records whether it started warm; stats.py reports first-turn
+LLM TTFT and TTS TTFB for warm vs. cold calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable
+
+import aiohttp
+from livekit import rtc
+
+from config import config, refresh_config
+
+logger = logging.getLogger("voice-agent.warmup")
+
+PRIMING_TEXT = "হ্যালো।"
+PRIMING_AUDIO_SECONDS = 0.3
+
+_lock = threading.Lock()
+_started = False
+_active_calls = 0
+_warmed_at = 0.0  # monotonic time of the last warm-up that warmed anything, 0 = never
+
+
+def is_warm() -> bool:
+    """True once a warm-up has primed at least one provider in this process."""
+    return _warmed_at > 0
+
+
+def call_started() -> None:
+    global _active_calls
+    with _lock:
+        _active_calls += 1
+
+
+async def call_ended() -> None:
+    """Shutdown callback — keep-warm resumes once no call is running."""
+    global _active_calls
+    with _lock:
+        _active_calls = max(0, _active_calls - 1)
+
+
+def start() -> None:
+    """Warm up now and keep warm while idle. Once per process; returns immediately."""
+    global _started
+    with _lock:
+        if _started or not config.warmup_enabled:
+            return
+        _started = True
+    threading.Thread(target=_keep_warm, name="warmup", daemon=True).start()
+
+
+def _keep_warm() -> None:
+    while True:
+        if not _active_calls:
+            try:
+                asyncio.run(_warm_once())
+            except Exception as e:
+                logger.warning(f"⚠️  Warm-up failed: {e}")
+        refresh_config()
+        if config.keep_warm_interval <= 0:
+            return
+        time.sleep(config.keep_warm_interval)
+
+
+# ═══════════════════════════════════════════════════════
+# TARGETS — what to warm for every tenant's providers
+# ═══════════════════════════════════════════════════════
+def _targets(session: aiohttp.ClientSession) -> dict[str, Callable[[], Awaitable]]:
+    from prompts import PROMPTS, get_prompt
+    from tenants import DEFAULT_TENANT, get_registry
+
+    targets: dict[str, Callable[[], Awaitable]] = {}
+    for tenant in (DEFAULT_TENANT, *get_registry().tenants):
+        snapshot = tenant.apply(refresh_config())
+
+        if snapshot.google_credentials and not snapshot.google_api_emulator and (
+            snapshot.google_sheet_id or snapshot.google_calendar_id
+        ):
+            targets["google-token"] = _google_tokens
+
+        stt, llm, tts = snapshot.stt_provider.lower(), snapshot.llm_provider.lower(), snapshot.tts_provider.lower()
+        if stt == "custom":
+            targets[f"stt:{snapshot.custom_stt_url}"] = lambda s=snapshot: _prime_stt(s, session)
+        if llm == "custom":
+            prompt = tenant.system_prompt or (
+                get_prompt(mode=snapshot.agent_mode, company_name=snapshot.company_name)
+                if snapshot.agent_mode in PROMPTS
+                else ""
+            )
+            model = tenant.llm_model or snapshot.custom_llm_model
+            targets[f"llm:{snapshot.custom_llm_url}:{model}:{tenant.name}"] = (
+                lambda s=snapshot, m=model, p=prompt: _prime_llm(s, m, p, session)
+            )
+        if tts == "custom":
+            voice = tenant.tts_voice or snapshot.custom_tts_voice
+            targets[f"tts:{snapshot.custom_tts_url}:{voice}"] = lambda s=snapshot, v=voice: _prime_tts(s, v, session)
+    return targets
+
+
+async def _google_tokens() -> None:
+    from tools.appointment import SCOPES as CALENDAR_SCOPES
+    from tools.crm import SCOPES as SHEETS_SCOPES
+    from tools.google_auth import refresh_token
+
+    for scopes in (SHEETS_SCOPES, CALENDAR_SCOPES):
+        await asyncio.to_thread(refresh_token, scopes)
+
+
+async def _prime_stt(snapshot, session: aiohttp.ClientSession) -> None:
+    from providers.custom_stt import CustomSTT
+
+    stt = CustomSTT(url=snapshot.custom_stt_url, language=snapshot.language, http_session=session)
+    samples = int(16000 * PRIMING_AUDIO_SECONDS)
+    frame = rtc.AudioFrame(bytes(samples * 2), 16000, 1, samples)
+    try:
+        await stt.recognize([frame])
+    finally:
+        await stt.aclose()
+
+
+async def _prime_llm(snapshot, model: str, prompt: str, session: aiohttp.ClientSession) -> None:
+    messages = [{"role": "user", "content": PRIMING_TEXT}]
+    if prompt:
+        messages.insert(0, {"role": "system", "content": prompt})
+    async with session.post(
+        snapshot.custom_llm_url.rstrip("/") + "/chat/completions",
+        json={"model": model, "messages": messages, "max_tokens": 1},
+        headers={"Authorization": f"Bearer {snapshot.custom_llm_api_key}"},
+    ) as response:
+        response.raise_for_status()
+        await response.read()
+
+
+async def _prime_tts(snapshot, voice: str, session: aiohttp.ClientSession) -> None:
+    from providers.custom_tts import CustomTTS
+
+    tts = CustomTTS(
+        url=snapshot.custom_tts_url,
+        language=snapshot.language,
+        voice=voice,
+        sample_rate=snapshot.custom_tts_sample_rate,
+        http_session=session,
+    )
+    try:
+        async for _ in tts.synthesize(PRIMING_TEXT):
+            pass
+    finally:
+        await tts.aclose()
+
+
+# ═══════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════
+async def _timed(name: str, prime: Callable[[], Awaitable]) -> tuple[str, float | str]:
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(prime(), config.warmup_timeout)
+    except Exception as e:
+        return name, f"{type(e).__name__}: {e}"
+    return name, (time.perf_counter() - start) * 1000
+
+
+async def _warm_once() -> None:
+    global _warmed_at
+    start = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        try:
+            targets = _targets(session)
+        except Exception as e:
+            logger.warning(f"⚠️  Warm-up skipped: {e}")
+            return
+        if not targets:
+            return
+        results = await asyncio.gather(*(_timed(name, prime) for name, prime in targets.items()))
+
+    failed = {name: error for name, error in results if isinstance(error, str)}
+    for name, error in failed.items():
+        logger.warning(f"⚠️  Warm-up of {name} failed: {error}")
+    if len(failed) < len(results):  # nothing is warm when every target failed
+        _warmed_at = time.monotonic()
+    timings = ", ".join(f"{name} {ms:.0f} ms" for name, ms in results if not isinstance(ms, str))
+    logger.info(
+        f"🔥 Warm-up: {len(results) - len(failed)}/{len(results)} targets in "
+        f"{(time.perf_counter() - start) * 1000:.0f} ms ({timings})"
+    )
@@ -0,0 +1,165 @@
+"""
+Load-aware admission for the agent worker.
+
+LiveKit asks the worker for its load before dispatching a call and stops
+sending calls once it reaches the load threshold. By default that load is
+CPU only, so a worker can keep accepting calls while its event loop is
+already falling behind — and every call on it gets choppy audio.
+
+get_load() reports the most constrained of:
+  - sessions   active calls / MAX_SESSIONS_PER_WORKER
+  - loop lag   worst call event-loop lag / MAX_LOOP_LAG_MS
+  - cpu        CPU usage / MAX_WORKER_CPU
+
+Calls don't run on the worker's event loop — each job has its own loop,
+in its own process with the default executor (a thread with
+VAD_BATCHING). So every call runs a CallLoopLag probe that writes its
+loop's lag to a file in LAG_DIR every LAG_REPORT_INTERVAL; the worker
+reads the worst of them. A loop too busy to report counts as lagging by
+the time since its last report.
+
+each scaled so 1.0 means "at capacity". The server is built with
+load_threshold=1.0, so a worker at capacity in any dimension is marked
+full and the call goes to another worker.
+
+The load is exported as the worker load gauge when PROMETHEUS_PORT is set,
+and logged whenever the worker fills up or frees up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import psutil
+from livekit.agents import AgentServer, utils
+from livekit.agents.utils.hw import get_cpu_monitor
+
+from config import config, refresh_config
+
+logger = logging.getLogger("voice-agent.load")
+
+LAG_PROBE_INTERVAL = 0.1  # seconds between event-loop lag probes
+LAG_REPORT_INTERVAL = 0.5  # seconds between a call's lag reports to the worker
+# One directory per worker; job processes inherit it from the worker, which imports this first
+LAG_DIR = Path(os.environ.setdefault(
+    "VOICE_AGENT_LAG_DIR", str(Path(tempfile.gettempdir()) / f"bangla-voice-lag-{os.getpid()}")
+))
+LOAD_THRESHOLD = 1.0  # every component is scaled so 1.0 = at capacity
+
+
+class CallLoopLag:
+    """Measures one call's event-loop lag and reports it to the worker. Create on the call's loop."""
+
+    def __init__(self) -> None:
+        self._path = LAG_DIR / f"{os.getpid()}-{id(asyncio.get_running_loop()):x}"
+        self._lag = utils.MovingAverage(20)  # ~2 s
+        self._task = asyncio.create_task(self._run(), name="call_loop_lag_probe")
+
+    async def _run(self) -> None:
+        LAG_DIR.mkdir(parents=True, exist_ok=True)
+        reported = time.monotonic()
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            self._lag.add_sample(max(time.perf_counter() - start - LAG_PROBE_INTERVAL, 0.0))
+            if time.monotonic() - reported >= LAG_REPORT_INTERVAL:
+                reported = time.monotonic()
+                self._path.write_text(f"{self._lag.get_avg():.4f}")
+
+    async def aclose(self) -> None:
+        """Shutdown callback — the call no longer counts towards the worker's load."""
+        self._task.cancel()
+        self._path.unlink(missing_ok=True)
+
+
+def _worst_call_lag() -> float:
+    """Seconds of lag of the most lagging call loop (0.0 without calls)."""
+    now = time.time()
+    worst = 0.0
+    try:
+        entries = list(os.scandir(LAG_DIR))
+    except FileNotFoundError:
+        return 0.0
+    for entry in entries:
+        if not psutil.pid_exists(int(entry.name.split("-", 1)[0])):
+            Path(entry.path).unlink(missing_ok=True)  # job process died without its shutdown callbacks
+            continue
+        try:
+            lag = float(Path(entry.path).read_text())
+            silent = now - entry.stat().st_mtime - LAG_REPORT_INTERVAL  # too busy to report
+        except (OSError, ValueError):
+            continue  # just removed, or being written
+        worst = max(worst, lag, silent)
+    return worst
+
+
+class WorkerLoad:
+    def __init__(self) -> None:
+        self._cpu_monitor = get_cpu_monitor()
+        self._cpu = utils.MovingAverage(5)  # ~2.5 s
+        self._lock = threading.Lock()
+        self._started = False
+        self._full = False
+        self.components: dict[str, float] = {"sessions": 0.0, "loop_lag": 0.0, "cpu": 0.0}
+
+    def _watch_cpu(self) -> None:
+        while True:
+            cpu = self._cpu_monitor.cpu_percent(interval=0.5)
+            with self._lock:
+                self._cpu.add_sample(cpu)
+
+    def start(self) -> None:
+        """Start the CPU probe. Called on the worker loop once it runs."""
+        if self._started:
+            return
+        self._started = True
+        threading.Thread(target=self._watch_cpu, name="worker-cpu-load", daemon=True).start()
+        logger.info(
+            f"🚦 Admission: max {config.max_sessions_per_worker or '∞'} calls, "
+            f"call loop lag {config.max_loop_lag_ms:.0f} ms, CPU {config.max_worker_cpu:.0%}"
+        )
+
+    def get_load(self, server: AgentServer) -> float:
+        """load_fnc for AgentServer — 1.0 or more means the worker is full."""
+        refresh_config()  # limits follow .env edits
+        with self._lock:
+            cpu = self._cpu.get_avg()
+        lag = _worst_call_lag()
+
+        sessions = len(server.active_jobs)
+        self.components = {
+            "sessions": sessions / config.max_sessions_per_worker if config.max_sessions_per_worker else 0.0,
+            "loop_lag": lag * 1000 / config.max_loop_lag_ms,
+            "cpu": cpu / config.max_worker_cpu,
+        }
+        load = max(self.components.values())
+
+        full = load >= LOAD_THRESHOLD
+        if full != self._full:
+            self._full = full
+            limit = max(self.components, key=self.components.get)
+            if full:
+                logger.warning(
+                    f"🚦 Worker full — not taking new calls ({sessions} active, "
+                    f"limited by {limit}: {self._describe()})"
+                )
+            else:
+                logger.info(f"🚦 Worker accepting calls again ({sessions} active, {self._describe()})")
+        return load
+
+    def _describe(self) -> str:
+        return ", ".join(f"{k} {v:.0%}" for k, v in self.components.items())
+
+    def report(self) -> dict:
+        """Current load components, e.g. for logging or a metrics endpoint."""
+        return {k: round(v, 3) for k, v in self.components.items()}
+
+
+# One per worker process; the CPU probe only runs in the main worker process
+worker_load = WorkerLoad()